@@ -4,19 +4,37 @@ add_questions.py - staging.json の問題を自動処理して本番追加
 
 処理フロー:
   1. listening/staging.json 読み込み・バリデーション
-  2. 現在の questions.js から問題数を取得
+  2. 問題ストア（question_store.py）から現在の問題数を取得
   3. 各問題に audio フィールドを付与（q{existing+n}.mp3）
-  4. edge-tts で MP3 生成
-  5. questions.js 末尾の ]; の前に新問題を追記
-  6. git add . && git commit && git push
-  7. staging.json をクリア（空配列）
+  4. edge-tts で MP3 生成（キャッシュ未ヒット分のみ、1つのイベントループ内で並列合成。
+     同じストリームから単語タイミングも受け取って保存）
+  5. 音声の後処理（無音トリム・ラウドネス正規化・再エンコード、ffmpeg がある場合のみ）と
+     audio_check.py による検査（壊れた音声があればここで中止）
+  6. ストアに新問題を追加し、音声メタデータ索引・kp の再生位置（timings.json）を更新して
+     questions.js とレベル別シャード（question_shards.py）の末尾に新しい問題だけを書き足す
+     明日以降の「今日の問題セット」（daily_sets.py）も作り直す。音声パック（audio_packs.py）を
+     使っている場合はパックにも書き足す（packs/ は git 管理外なので配信先へは別途反映）
+  7. git add . && git commit && git push
+  8. staging.json をクリア（空配列）
+
+1〜8 は公開ロック（listening/.publish.lock）を取って行う（audio_check.py --gc が書き出し済みで
+ストアに未登録の音声を消さないように）。check_batch.py から起動されたときは親のロックを引き継ぐ。
+
+Usage:
+  python3 add_questions.py
+  python3 add_questions.py --workers 16 --per-voice 4   # 並列数を指定
+  python3 add_questions.py --no-postprocess             # 音声の後処理を省略
 """
 
+import argparse
 import asyncio
 import json
+import random
 import re
 import subprocess
 import sys
+import time
+from collections import defaultdict
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).parent
@@ -33,7 +51,26 @@ VOICES = [
     "en-GB-RyanNeural",      # UK male
 ]
 
-from lib import VALID_FIELDS, VALID_DIFFS
+# 音声合成の並列設定（edge-tts はボイス単位でスロットリングされやすい）
+TTS_WORKERS = 8        # 同時に走らせる合成タスク数
+TTS_PER_VOICE = 3      # 1ボイスあたりの同時接続上限
+TTS_RETRIES = 4        # 失敗時のリトライ回数
+TTS_TIMEOUT = 60.0     # 1問あたりのタイムアウト（秒）
+TTS_BACKOFF = 1.0      # リトライ待機の基準秒数（指数バックオフ + ジッター）
+
+# edge-tts の合成パラメータ（変更するとキャッシュキーも変わる）
+TTS_PARAMS = {"rate": "+0%", "volume": "+0%", "pitch": "+0Hz"}
+
+from lib import VALID_FIELDS, VALID_DIFFS, file_lock
+import tts_cache
+import audio_postprocess
+import audio_meta
+import audio_check
+import audio_packs
+import word_timings
+import daily_sets
+from question_store import open_store
+from dedup_index import filter_near_duplicates, load_index, register_published
 
 
 def load_staging():
@@ -103,68 +140,133 @@ def load_staging():
     return data
 
 
-def get_existing_count(content):
-    """questions.js から現在の問題数を取得"""
-    # audio フィールドで問題数を数える
-    # questions.js は JavaScript オブジェクト記法（キーにクォートなし）
-    count = len(re.findall(r'\baudio:', content))
-    print(f"現在の問題数: {count} 問")
-    return count
-
-
 async def generate_audio_async(text, voice, output_path):
-    """edge-tts で非同期 MP3 生成"""
+    """edge-tts で非同期 MP3 生成
+
+    ストリームを1回だけ読み、MP3 を書き出しながら WordBoundary（単語ごとの位置）も集める。
+    戻り値: [[開始秒, 長さ秒, 単語], ...]
+    """
     import edge_tts
 
-    communicate = edge_tts.Communicate(text, voice)
-    await communicate.save(str(output_path))
+    try:
+        communicate = edge_tts.Communicate(text, voice, boundary="WordBoundary", **TTS_PARAMS)
+    except TypeError:   # edge-tts 7.0 未満は boundary 引数が無く、常に WordBoundary を返す
+        communicate = edge_tts.Communicate(text, voice, **TTS_PARAMS)
+    words = []
+    with open(output_path, "wb") as f:
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                f.write(chunk["data"])
+            elif chunk["type"] == "WordBoundary":
+                # offset / duration は 100ns 単位
+                words.append([round(chunk["offset"] / 1e7, 3), round(chunk["duration"] / 1e7, 3),
+                              chunk["text"]])
+    return words
 
 
 def generate_audio(text, voice, output_path):
-    """edge-tts で MP3 生成（同期ラッパー）"""
-    asyncio.run(generate_audio_async(text, voice, output_path))
-
-
-def format_question_js(q):
-    """問題オブジェクトを questions.js 形式の1行文字列に変換"""
-    choices_str = json.dumps(q["choices"], ensure_ascii=False)
-    kp_str = json.dumps(q["kp"], ensure_ascii=False)
-
-    def esc(s):
-        return (s.replace("\\", "\\\\")
-                 .replace('"', '\\"')
-                 .replace("\n", "\\n")
-                 .replace("\r", "\\r")
-                 .replace("\t", "\\t"))
-
-    axis_part = f', axis: "{esc(q["axis"])}"' if q.get("axis") else ""
-
-    return (
-        f'  {{ diff: "{q["diff"]}"{axis_part}, text: "{esc(q["text"])}", ja: "{esc(q["ja"])}", '
-        f'answer: "{esc(q["answer"])}", choices: {choices_str}, '
-        f'audio: "{esc(q["audio"])}", '
-        f'expl: "{esc(q["expl"])}", kp: {kp_str} }}'
-    )
-
-
-def append_to_questions_js(content, new_questions):
-    """questions.js の末尾 ]; の前に新問題を追記"""
-    # ファイル末尾の ]; を正規表現で探す（文字列内の ]; に誤マッチしないよう末尾固定）
-    m = re.search(r'\];\s*$', content)
-    if not m:
-        print("ERROR: questions.js に ]; が見つかりません", file=sys.stderr)
-        sys.exit(1)
-    last_bracket_pos = m.start()
-
-    # 最後の問題の末尾（,がない場合は追加）
-    before = content[:last_bracket_pos].rstrip()
-    if before and not before.endswith(","):
-        before += ","
-
-    new_lines = ",\n".join(format_question_js(q) for q in new_questions)
-    new_content = before + "\n" + new_lines + "\n];\n"
-
-    QUESTIONS_JS.write_text(new_content, encoding="utf-8")
+    """edge-tts で MP3 生成（同期ラッパー）。戻り値は単語タイミング"""
+    return asyncio.run(generate_audio_async(text, voice, output_path))
+
+
+async def _synthesize_one(job, voice_sem, retries, timeout):
+    """1問分を合成（タイムアウト・指数バックオフ付きリトライ）
+
+    途中で失敗したファイルが「既存」扱いされないよう .part に書いてから rename する。
+    job に "key" があれば単語タイミングを tts_cache に保存する（MP3 より先に書く）。
+    戻り値: 成功時は合成にかかった秒数
+    """
+    output_path = job["path"]
+    tmp_path = output_path.with_name(output_path.name + ".part")
+    last_error = None
+
+    for attempt in range(retries + 1):
+        async with voice_sem:
+            started = time.perf_counter()
+            try:
+                words = await asyncio.wait_for(
+                    generate_audio_async(job["text"], job["voice"], tmp_path),
+                    timeout=timeout,
+                )
+                if "key" in job:
+                    tts_cache.store_timings(job["key"], words)
+                tmp_path.replace(output_path)
+                return time.perf_counter() - started
+            except Exception as e:  # edge-tts は 429/WebSocket 切断など多様な例外を投げる
+                last_error = e
+                tmp_path.unlink(missing_ok=True)
+
+        if attempt < retries:
+            delay = TTS_BACKOFF * (2 ** attempt) + random.uniform(0, TTS_BACKOFF)
+            kind = "タイムアウト" if isinstance(last_error, asyncio.TimeoutError) else type(last_error).__name__
+            print(f"    RETRY {job['name']}: {kind} → {delay:.1f}秒後に再試行 "
+                  f"({attempt + 1}/{retries})")
+            await asyncio.sleep(delay)
+
+    raise last_error
+
+
+async def synthesize_all(jobs, *, workers=TTS_WORKERS, per_voice=TTS_PER_VOICE,
+                         retries=TTS_RETRIES, timeout=TTS_TIMEOUT):
+    """全ジョブを1つのイベントループ内で並列合成
+
+    jobs: [{"name", "text", "voice", "path"}, ...]  name は表示用
+    戻り値: (latencies, failures)
+      latencies: {voice: [秒, ...]}  成功したジョブの合成時間
+      failures:  [(job, exception), ...]
+    """
+    queue = asyncio.Queue()
+    for job in jobs:
+        queue.put_nowait(job)
+
+    voice_sems = defaultdict(lambda: asyncio.Semaphore(per_voice))
+    latencies = defaultdict(list)
+    failures = []
+    total = len(jobs)
+    done = 0
+
+    async def worker():
+        nonlocal done
+        while True:
+            try:
+                job = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                elapsed = await _synthesize_one(job, voice_sems[job["voice"]], retries, timeout)
+                latencies[job["voice"]].append(elapsed)
+                done += 1
+                print(f"  [{done}/{total}] ✅ {job['name']} ({job['voice']}, {elapsed:.1f}秒)")
+            except Exception as e:
+                failures.append((job, e))
+                done += 1
+                print(f"  [{done}/{total}] ERROR: {job['name']} 音声生成失敗: {type(e).__name__} {e}",
+                      file=sys.stderr)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(workers, total)))))
+    return latencies, failures
+
+
+def print_tts_report(latencies, elapsed):
+    """スループットとボイス別レイテンシを表示"""
+    n = sum(len(v) for v in latencies.values())
+    if not n:
+        return
+    print(f"\n音声生成レポート: {n} 問 / {elapsed:.1f}秒（{n / elapsed:.2f} 問/秒）")
+    for voice in sorted(latencies):
+        vals = sorted(latencies[voice])
+        avg = sum(vals) / len(vals)
+        p95 = vals[min(len(vals) - 1, int(len(vals) * 0.95))]
+        print(f"  {voice:22s}: {len(vals):4d} 問  平均 {avg:.2f}秒  p95 {p95:.2f}秒  最大 {vals[-1]:.2f}秒")
+
+
+def last_audio_number(store):
+    """参照・ファイルの両方で使われている最大の音声番号（q01.mp3 と q1.mp3 はどちらも 1）"""
+    names = {Path(q["audio"]).name for q in store.iter_questions() if q.get("audio")}
+    if AUDIO_DIR.exists():
+        names.update(p.name for p in AUDIO_DIR.glob("q*.mp3"))
+    numbers = [int(m.group(1)) for m in map(re.compile(r"^q(\d+)\.mp3$").match, names) if m]
+    return max(numbers, default=0)
 
 
 def git_commit_push(n_added, total):
@@ -190,6 +292,19 @@ def git_commit_push(n_added, total):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="staging.json の問題を音声生成して本番追加")
+    parser.add_argument("--workers", type=int, default=TTS_WORKERS,
+                        help=f"音声合成の同時実行数（デフォルト: {TTS_WORKERS}）")
+    parser.add_argument("--per-voice", type=int, default=TTS_PER_VOICE,
+                        help=f"1ボイスあたりの同時接続上限（デフォルト: {TTS_PER_VOICE}）")
+    parser.add_argument("--retries", type=int, default=TTS_RETRIES,
+                        help=f"失敗時のリトライ回数（デフォルト: {TTS_RETRIES}）")
+    parser.add_argument("--timeout", type=float, default=TTS_TIMEOUT,
+                        help=f"1問あたりのタイムアウト秒（デフォルト: {TTS_TIMEOUT:g}）")
+    parser.add_argument("--no-postprocess", action="store_true",
+                        help="音声の後処理（無音トリム・音量正規化・再エンコード）を省略")
+    args = parser.parse_args()
+
     # edge-tts が使えるか確認
     try:
         import edge_tts  # noqa: F401
@@ -200,56 +315,145 @@ def main():
 
     AUDIO_DIR.mkdir(parents=True, exist_ok=True)
 
+    # 音声の書き出しからストアへの登録までの間に audio_check.py --gc が走らないようにする
+    with file_lock(audio_check.PUBLISH_LOCK) as locked:
+        if not locked:
+            print("ERROR: 別のプロセスが公開処理中です。終わってから再実行してください", file=sys.stderr)
+            sys.exit(1)
+        publish(args)
+
+
+def publish(args):
+    """staging.json の問題を音声生成してストアに追加し、公開する（公開ロックを持って呼ぶ）"""
     # 1. staging.json 読み込み
     staging = load_staging()
 
-    # 2. questions.js を読み込み（以降で2回使うため1回だけ読む）
+    # 既存問題バンク（＋staging 内）と類似重複する問題を除外
+    index = load_index()
+    staging, rejected = filter_near_duplicates(staging, index)
+    if rejected:
+        print(f"WARNING: 類似重複のため {len(rejected)} 問を除外しました:")
+        for q, sim, similar in rejected:
+            print(f"  [{sim:.2f}] \"{q['text'][:50]}\" ≈ \"{similar[:50]}\"")
+    if not staging:
+        print("追加できる問題がありません（すべて重複）")
+        sys.exit(0)
+
+    # 2. 問題ストアから現在の問題数を取得
     if not QUESTIONS_JS.exists():
         print(f"ERROR: {QUESTIONS_JS} が見つかりません", file=sys.stderr)
         sys.exit(1)
-    questions_js_content = QUESTIONS_JS.read_text(encoding="utf-8")
-    existing_count = get_existing_count(questions_js_content)
+    store = open_store()
+    existing_count = store.count()
+    print(f"現在の問題数: {existing_count} 問")
 
     # 3. audio フィールドを付与
+    #    番号は問題数の続きから振るが、既に使われている番号（参照・孤立ファイル）は避ける
+    base = max(existing_count, last_audio_number(store))
     for i, q in enumerate(staging):
-        q_num = existing_count + i + 1
+        q_num = base + i + 1
         # ゼロパディング: 1-9 → q1、10-99 → q10、100以上 → q100 など（拡張子なし）
         q["audio"] = f"audio/q{q_num}.mp3"
 
     # 4. MP3 生成
-    print(f"\n音声生成開始: {len(staging)} 問")
+    #    (text, voice, TTS_PARAMS) のハッシュでキャッシュを引き、未ヒット分だけ合成する。
+    #    同一内容は1回だけ合成し、番号がずれた再実行でもキャッシュから復元される。
+    print(f"\n音声生成開始: {len(staging)} 問"
+          f"（並列 {args.workers} / ボイス毎 {args.per_voice}）")
+    manifest = tts_cache.load_manifest()
+    keys = []
+    jobs = {}
+    reused = 0
     for i, q in enumerate(staging):
         voice = VOICES[i % len(VOICES)]
-        q_num = existing_count + i + 1
-        audio_filename = f"q{q_num}.mp3"
-        audio_path = AUDIO_DIR / audio_filename
-
-        if audio_path.exists():
-            print(f"  [{i+1}/{len(staging)}] スキップ（既存）: {audio_filename}")
+        key = tts_cache.cache_key(q["text"], voice, TTS_PARAMS)
+        keys.append(key)
+        if tts_cache.has_blob(key) or key in jobs:
+            reused += 1
             continue
-
-        print(f"  [{i+1}/{len(staging)}] 生成中: {audio_filename} ({voice})")
-        print(f"    \"{q['text'][:50]}{'...' if len(q['text']) > 50 else ''}\"")
-
-        try:
-            generate_audio(q["text"], voice, audio_path)
-            print(f"    ✅ 生成完了")
-        except Exception as e:
-            print(f"    ERROR: 音声生成失敗: {e}", file=sys.stderr)
+        audio_path = AUDIO_DIR / Path(q["audio"]).name
+        if audio_path.exists() and manifest.get(q["audio"]) == key:
+            # キャッシュ導入前に生成済みの同一音声は blob として取り込む
+            tts_cache.store_blob(key, audio_path)
+            reused += 1
+            continue
+        blob = tts_cache.blob_path(key)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        jobs[key] = {"name": audio_path.name, "text": q["text"], "voice": voice, "path": blob, "key": key}
+    print(f"  キャッシュヒット: {reused} 問 / 合成: {len(jobs)} 問")
+
+    if jobs:
+        started = time.perf_counter()
+        latencies, failures = asyncio.run(synthesize_all(
+            list(jobs.values()), workers=args.workers, per_voice=args.per_voice,
+            retries=args.retries, timeout=args.timeout,
+        ))
+        print_tts_report(latencies, time.perf_counter() - started)
+        if failures:
+            print(f"ERROR: {len(failures)} 問の音声生成に失敗しました（questions.js は変更していません）",
+                  file=sys.stderr)
+            for job, e in failures:
+                print(f"  {job['name']}: \"{job['text'][:50]}\" → {type(e).__name__} {e}", file=sys.stderr)
+            print("  再実行すると生成済みの音声はキャッシュから復元されます", file=sys.stderr)
             sys.exit(1)
 
-    # 5. questions.js に追記
+    for q, key in zip(staging, keys):
+        tts_cache.materialize(key, AUDIO_DIR / Path(q["audio"]).name)
+        manifest[q["audio"]] = key
+    tts_cache.save_manifest(manifest)
+    timings = {q["audio"]: tts_cache.load_timings(key) for q, key in zip(staging, keys)}
+
+    # 5. 音声の後処理（プロセスプールで並列。失敗したファイルは合成したまま使う）
+    if not args.no_postprocess:
+        print("\n音声の後処理中...")
+        speech_starts = {audio: words[0][0] for audio, words in timings.items() if words}
+        stats = audio_postprocess.postprocess([(q["audio"], q["diff"]) for q in staging], quiet=True,
+                                              speech_starts=speech_starts)
+        if stats is None:
+            print("  ffmpeg が見つからないため省略しました")
+        else:
+            audio_postprocess.print_report(stats)
+
+    # 公開前の音声チェック（今回の音声が壊れていればストアに入れずに中止）
+    report = audio_check.check(staging, only={q["audio"] for q in staging})
+    if audio_check.has_errors(report):
+        audio_check.print_report(report)
+        bad = set(report["missing"] + report["empty"]) | {a for a, _ in report["corrupt"]}
+        for q, key in zip(staging, keys):
+            if q["audio"] in bad:
+                tts_cache.blob_path(key).unlink(missing_ok=True)  # 再実行で合成し直す
+        print("ERROR: 音声に問題があるため中止しました（questions.js は変更していません）",
+              file=sys.stderr)
+        sys.exit(1)
+
+    # 6. ストアに追加して questions.js を再生成
     print(f"\nquestions.js に {len(staging)} 問を追記中...")
-    append_to_questions_js(questions_js_content, staging)
-    total = existing_count + len(staging)
+    store.insert_questions(staging)
+    # 新しい音声の長さ・発話速度を索引に登録（後処理後のファイルを読む）
+    audio_meta.update_index(store, [q["audio"] for q in staging])
+    total = store.append_js()   # 既存部分は読み書きせず、新しい問題だけを末尾に書き足す
+    # kp フレーズの再生位置（後処理で先頭を切った分をずらして timings.json に登録）
+    word_timings.update_index([(q["audio"], timings[q["audio"]], q["kp"]) for q in staging])
+    # 明日以降の「今日の問題セット」に新しい問題を入れる（今日までの公開済みセットは変えない）
+    daily_sets.build(store)
+    questions = list(store.iter_questions())
+    store.close()
     print(f"✅ 追記完了（{existing_count} → {total} 問）")
+    if audio_packs.PACK_INDEX.exists():
+        # 音声パックを使っている → 新しい音声を末尾に書き足す（packs/ は git 管理外。配信は別途）
+        audio_packs.build()
+        print("✅ 音声パックを更新しました（listening/packs/ を配信先に反映してください）")
+
+    if audio_check.has_errors(audio_check.check(questions)):
+        print("WARNING: 既存の音声に問題があります（python3 audio_check.py で確認してください）")
+    register_published([q["text"] for q in staging], index)
 
-    # 6. git commit & push
+    # 7. git commit & push
     print("\ngit commit & push...")
     git_commit_push(len(staging), total)
     print("✅ push 完了")
 
-    # 7. staging.json をクリア
+    # 8. staging.json をクリア
     STAGING_JSON.write_text("[]\n", encoding="utf-8")
     print("✅ staging.json をクリアしました")
 
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+audio_check.py - 音声ファイルの整合性チェックと孤立ファイルの回収
+
+問題ストア（questions.js）の audio 参照と listening/audio の実ファイルを突き合わせる。
+
+  missing   : 参照されているのにファイルが無い
+  empty     : 0バイト
+  corrupt   : MP3 フレーム同期が取れない・末尾が途切れている
+  duplicate : 複数の問題が同じ音声を参照している
+  orphan    : どの問題からも参照されていないファイル（q1.mp3 / q01.mp3 の表記揺れを含む）
+  leftover  : 合成・後処理の途中で残った .part / .post.mp3 / .tmp
+
+フレームの検査は audio_meta.scan_mp3 をプロセスプールで並列に実行する。
+参照先に問題があれば終了コード 1 を返すので、公開前のゲートとして使える
+（add_questions.py も公開前に実行し、今回追加した音声に問題があれば中止する）。
+
+Usage:
+  python3 audio_check.py                  # 検査のみ（参照先に問題があれば終了コード 1）
+  python3 audio_check.py --gc --dry-run   # 回収対象の表示
+  python3 audio_check.py --gc             # 孤立ファイルと途中ファイルを削除
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from audio_meta import scan_mp3
+from lib import file_lock
+from question_store import open_store
+
+REPO_ROOT = Path(__file__).parent
+LISTENING_DIR = REPO_ROOT / "listening"
+AUDIO_DIR = LISTENING_DIR / "audio"
+PUBLISH_LOCK = LISTENING_DIR / ".publish.lock"     # check_batch.py・add_questions.py の公開と共通
+
+CHECK_WORKERS = os.cpu_count() or 4
+PARALLEL_MIN = 64       # これより少なければプロセスを起こさずに検査する
+LEFTOVER_SUFFIXES = (".part", ".post.mp3", ".tmp")
+
+_AUDIO_NUM = re.compile(r"^q0*(\d+)\.mp3$")
+
+
+def _scan(path):
+    info = scan_mp3(path)
+    return info["frames"], info["sync_errors"], info["truncated"]
+
+
+def scan_all(paths, workers=CHECK_WORKERS):
+    """[(frames, sync_errors, truncated), ...] を paths の順で返す"""
+    if workers <= 1 or len(paths) < PARALLEL_MIN:
+        return [_scan(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_scan, paths, chunksize=max(1, len(paths) // (workers * 4))))
+
+
+def check(questions, workers=CHECK_WORKERS, only=None):
+    """音声の整合性を検査する
+
+    questions: 全問題（参照の突き合わせに使う）
+    only: 検査する audio パスの集合（None なら全件。孤立ファイルは全件のときだけ調べる）
+    戻り値: {"checked", "missing", "empty", "corrupt", "duplicate", "orphan", "leftover"}
+    """
+    refs = defaultdict(list)
+    for q in questions:
+        if q.get("audio"):
+            refs[q["audio"]].append(q.get("id"))
+    targets = sorted(refs if only is None else set(only) & set(refs))
+
+    files = {}
+    if AUDIO_DIR.exists():
+        with os.scandir(AUDIO_DIR) as it:
+            files = {e.name: e.stat().st_size for e in it if e.is_file()}
+
+    report = {"checked": len(targets), "missing": [], "empty": [], "corrupt": [],
+              "duplicate": [], "orphan": [], "leftover": []}
+    to_scan = []
+    for audio in targets:
+        name = Path(audio).name
+        if len(refs[audio]) > 1:
+            report["duplicate"].append((audio, refs[audio]))
+        if name not in files:
+            report["missing"].append(audio)
+        elif files[name] == 0:
+            report["empty"].append(audio)
+        else:
+            to_scan.append(audio)
+
+    for audio, (frames, sync_errors, truncated) in zip(
+            to_scan, scan_all([LISTENING_DIR / a for a in to_scan], workers)):
+        if not frames:
+            report["corrupt"].append((audio, "MP3 フレームが見つからない"))
+        elif sync_errors or truncated:
+            reason = f"フレーム同期エラー {sync_errors} 回" if sync_errors else ""
+            if truncated:
+                reason += ("・" if reason else "") + "末尾のフレームが途切れている"
+            report["corrupt"].append((audio, reason))
+
+    if only is None:
+        referenced = {Path(a).name for a in refs}
+        by_number = {}
+        for name in referenced:
+            m = _AUDIO_NUM.match(name)
+            if m:
+                by_number[int(m.group(1))] = name
+        for name in sorted(files):
+            if name.endswith(LEFTOVER_SUFFIXES):
+                report["leftover"].append((name, files[name]))
+            elif name not in referenced:
+                m = _AUDIO_NUM.match(name)
+                twin = by_number.get(int(m.group(1))) if m else None
+                report["orphan"].append((name, files[name], twin))
+    return report
+
+
+def has_errors(report):
+    """参照先の問題（公開を止めるべきもの）があるか"""
+    return bool(report["missing"] or report["empty"] or report["corrupt"] or report["duplicate"])
+
+
+def print_report(report, elapsed=None):
+    took = f"（{elapsed:.2f}秒）" if elapsed is not None else ""
+    print(f"音声チェック: {report['checked']} 件を検査{took}")
+    for audio in report["missing"]:
+        print(f"  MISSING   {audio}")
+    for audio in report["empty"]:
+        print(f"  EMPTY     {audio}（0バイト）")
+    for audio, reason in report["corrupt"]:
+        print(f"  CORRUPT   {audio}: {reason}")
+    for audio, ids in report["duplicate"]:
+        print(f"  DUPLICATE {audio}: 問題 ID {', '.join(map(str, ids))} が同じ音声を参照")
+    for name, size, twin in report["orphan"]:
+        note = f"（表記揺れ: {twin} が参照されている）" if twin else ""
+        print(f"  ORPHAN    audio/{name} {size / 1024:.1f} KB{note}")
+    for name, size in report["leftover"]:
+        print(f"  LEFTOVER  audio/{name} {size / 1024:.1f} KB")
+    if not has_errors(report):
+        print("✅ 参照先の音声に問題はありません")
+
+
+def gc(report, dry_run=False):
+    """孤立ファイルと途中ファイルを削除する。戻り値: (削除件数, 回収バイト数)
+
+    参照切れ（missing / empty）がある間は回収しない。孤立ファイルの中に本来の音声が
+    残っている可能性がある（q1.mp3 と q01.mp3 の取り違えなど）ため。
+    """
+    if report["missing"] or report["empty"]:
+        print("ERROR: 参照切れの音声があるため回収を中止しました（先に参照を直してください）",
+              file=sys.stderr)
+        sys.exit(1)
+
+    targets = [(name, size) for name, size, _ in report["orphan"]] + report["leftover"]
+    removed = reclaimed = 0
+    for name, size in targets:
+        path = AUDIO_DIR / name
+        prefix = "[dry-run] " if dry_run else ""
+        print(f"  {prefix}削除: audio/{name}（{size / 1024:.1f} KB）")
+        if not dry_run:
+            path.unlink(missing_ok=True)
+        removed += 1
+        reclaimed += size
+    return removed, reclaimed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="音声ファイルの整合性チェックと孤立ファイルの回収")
+    parser.add_argument("--gc", action="store_true", help="孤立ファイルと途中ファイルを削除")
+    parser.add_argument("--dry-run", action="store_true", help="--gc で削除対象の表示のみ")
+    parser.add_argument("--workers", type=int, default=CHECK_WORKERS,
+                        help=f"並列プロセス数（デフォルト: {CHECK_WORKERS}）")
+    args = parser.parse_args()
+
+    if not args.gc:
+        with open_store() as store:
+            questions = list(store.iter_questions())
+        started = time.perf_counter()
+        report = check(questions, workers=args.workers)
+        print_report(report, time.perf_counter() - started)
+        sys.exit(1 if has_errors(report) else 0)
+
+    # 取り込み・公開（check_batch.py → add_questions.py）と同時に走らないようにする。
+    # 問題もロックを取ってから読む（書き出し済みでストアに未登録の音声を孤立とみなさない）
+    with file_lock(PUBLISH_LOCK) as locked:
+        if not locked:
+            print("ERROR: 別のプロセスが公開処理中です。終わってから再実行してください", file=sys.stderr)
+            sys.exit(1)
+        with open_store() as store:
+            questions = list(store.iter_questions())
+        report = check(questions, workers=args.workers)
+        removed, reclaimed = gc(report, dry_run=args.dry_run)
+    prefix = "[dry-run] " if args.dry_run else ""
+    print(f"{prefix}回収: {removed} 件（{reclaimed / 1024 / 1024:.2f} MB）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+audio_meta.py - 音声ファイルのメタデータ索引（長さ・ビットレート・発話速度）
+
+listening/audio の MP3 をデコードせず、フレームヘッダを mmap で先頭から辿って
+フレーム数・サンプル数から正確な長さを求める（VBR でも正しい）。結果は問題ストア
+（questions.db の audio_meta テーブル）に保存し、問題文の語数から 1秒あたりの語数（wps）も付ける。
+
+サイズと更新時刻が変わっていないファイルは読み直さないので、問題追加後の更新は新しい音声の分だけ。
+axis_features.py / classify_axis.py はこの長さを発話速度の判定に使う（無ければサイズから推定）。
+
+Usage:
+  python3 audio_meta.py              # 索引を更新して集計を表示
+  python3 audio_meta.py --rescan     # 全ファイルを読み直す
+  python3 audio_meta.py --emit       # questions.js に dur（秒）を出力するようにして再生成
+  python3 audio_meta.py --no-emit    # dur の出力をやめて再生成
+"""
+
+import argparse
+import mmap
+import re
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from lib import id3v2_size, mp3_frame_header, mp3_is_info_frame
+from question_store import open_store
+
+REPO_ROOT = Path(__file__).parent
+LISTENING_DIR = REPO_ROOT / "listening"
+
+_WORD = re.compile(r"[A-Za-z0-9']+")
+
+
+def scan_mp3(path):
+    """MP3 のフレームヘッダを辿って長さ・ビットレートを求める（デコードはしない）
+
+    戻り値: {"bytes", "frames", "duration", "kbps", "sample_rate", "sync_errors", "truncated"}
+      sync_errors: フレーム同期が外れて読み飛ばした回数
+      truncated  : 最後のフレームがファイル末尾で途切れている
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    info = {"bytes": size, "frames": 0, "duration": 0.0, "kbps": 0.0, "sample_rate": 0,
+            "sync_errors": 0, "truncated": False}
+    if size == 0:
+        return info
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = size - 128 if size >= 128 and mm[size - 128:size - 125] == b"TAG" else size  # ID3v1
+        pos = id3v2_size(mm)
+        headers = {}        # ヘッダ4バイト → 解析結果（CBR ならほぼ1種類なので毎回解析しない）
+        frames = samples = audio_bytes = rate = 0
+        first = True
+        while pos + 4 <= end:
+            key = mm[pos:pos + 4]
+            header = headers.get(key)
+            if header is None:
+                header = mp3_frame_header(mm, pos)
+                if header is None:
+                    # 同期が外れた → 次のフレーム候補（0xFF）まで読み飛ばす
+                    info["sync_errors"] += 1
+                    pos = mm.find(b"\xff", pos + 1, end)
+                    if pos < 0:
+                        break
+                    continue
+                headers[key] = header
+            length, _, rate, frame_samples = header
+            if pos + length > end:
+                info["truncated"] = True
+                break
+            if not (first and mp3_is_info_frame(mm, pos, length)):
+                frames += 1
+                samples += frame_samples
+                audio_bytes += length
+            first = False
+            pos += length
+
+    if frames and rate:
+        duration = samples / rate
+        info.update(frames=frames, duration=round(duration, 3), sample_rate=rate,
+                    kbps=round(audio_bytes * 8 / duration / 1000, 1))
+    return info
+
+
+def update_index(store, audios=None, rescan=False):
+    """音声メタデータの索引を更新する
+
+    audios: 対象の audio パス（None なら全問題。このとき参照されなくなった行は削除）
+    戻り値: (読み直した件数, 削除した件数, [(audio パス, 問題), ...])
+    """
+    texts = {q["audio"]: q["text"] for q in store.iter_questions() if q.get("audio")}
+    targets = texts if audios is None else {a: texts[a] for a in audios if a in texts}
+    known = store.audio_meta()
+
+    rows = []
+    problems = []
+    for audio, text in targets.items():
+        path = LISTENING_DIR / audio
+        try:
+            st = path.stat()
+        except OSError:
+            problems.append((audio, "ファイルなし"))
+            continue
+        prev = known.get(audio)
+        if not rescan and prev and prev["bytes"] == st.st_size and prev["mtime_ns"] == st.st_mtime_ns:
+            continue
+        info = scan_mp3(path)
+        if not info["frames"]:
+            problems.append((audio, "0バイト" if not info["bytes"] else "MP3 フレームなし"))
+            continue
+        if info["sync_errors"] or info["truncated"]:
+            problems.append((audio, f"同期エラー {info['sync_errors']} 回"
+                                    + ("・末尾が途切れている" if info["truncated"] else "")))
+        words = len(_WORD.findall(text))
+        rows.append({**info, "audio": audio, "mtime_ns": st.st_mtime_ns,
+                     "wps": round(words / info["duration"], 2) if info["duration"] else None})
+
+    store.set_audio_meta(rows)
+    stale = []
+    if audios is None:
+        stale = [a for a in known if a not in texts or not (LISTENING_DIR / a).exists()]
+        store.delete_audio_meta(stale)
+    return len(rows), len(stale), problems
+
+
+def print_summary(store):
+    meta = store.audio_meta()
+    if not meta:
+        print("索引は空です")
+        return
+    total_sec = sum(m["duration"] for m in meta.values())
+    total_bytes = sum(m["bytes"] for m in meta.values())
+    print(f"索引: {len(meta)} 件 / 合計 {total_sec / 60:.1f} 分 / {total_bytes / 1024 / 1024:.1f} MB")
+
+    groups = defaultdict(list)
+    for q in store.iter_questions():
+        m = meta.get(q.get("audio"))
+        if m:
+            groups[(q["diff"], q.get("axis") or "未付与")].append(m)
+    print(f"  {'diff':5s} {'axis':11s} {'件数':>5s} {'平均秒':>6s} {'kbps':>6s} {'語/秒':>6s}")
+    for (diff, axis), ms in sorted(groups.items()):
+        wps = [m["wps"] for m in ms if m["wps"]]
+        print(f"  {diff:5s} {axis:11s} {len(ms):5d} {sum(m['duration'] for m in ms) / len(ms):6.2f} "
+              f"{sum(m['kbps'] for m in ms) / len(ms):6.1f} {sum(wps) / len(wps) if wps else 0:6.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="音声ファイルのメタデータ索引（長さ・ビットレート・発話速度）")
+    parser.add_argument("--rescan", action="store_true", help="全ファイルを読み直す")
+    emit = parser.add_mutually_exclusive_group()
+    emit.add_argument("--emit", action="store_true", help="questions.js に dur（秒）を出力して再生成")
+    emit.add_argument("--no-emit", action="store_true", help="questions.js への dur の出力をやめて再生成")
+    args = parser.parse_args()
+
+    with open_store() as store:
+        started = time.perf_counter()
+        scanned, removed, problems = update_index(store, rescan=args.rescan)
+        elapsed = time.perf_counter() - started
+        print(f"スキャン: {scanned} 件（削除 {removed} 件、{elapsed:.2f}秒）")
+        for audio, reason in problems:
+            print(f"  WARNING: {audio}: {reason}", file=sys.stderr)
+
+        if args.emit or args.no_emit:
+            with store.conn:
+                store.set_meta("emit_dur", "1" if args.emit else "0")
+            n = store.emit_js()
+            print(f"✅ questions.js を再生成しました（{n} 問、dur {'あり' if args.emit else 'なし'}）")
+        print()
+        print_summary(store)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+audio_packs.py - レベル別（任意で axis 別）の音声パックとオフセット索引を作る
+
+クイズは1問ごとに audio/qN.mp3 を取りに行くので、1セッションで数十回の HTTP リクエストになる。
+同じプールの音声を1本の MP3 に連結し、各問題の位置を索引に書き出す。
+MP3 はフレーム単位で独立しているので、連結したファイルの一部を Range リクエストで
+切り出してもそのまま再生できる（サーバーが Range に対応していなければパックごと1回で取得）。
+
+  listening/packs/lv1.mp3 ...    # 音声パック（ID3 タグは除いて連結）
+  listening/packs/index.json     # クライアント用の索引
+      {"version": 1,
+       "packs": {"lv1": {"file": "packs/lv1.mp3", "hash", "bytes", "count"}},
+       "clips": {"audio/q1.mp3": ["lv1", オフセット, バイト数, 秒数]}}
+  listening/packs/build.json     # 差分ビルド用の記録（各パックの中身と順序）
+
+パックは問題の登録順に並べるので、問題を追加したときは末尾に書き足すだけで済む
+（既存部分が記録と一致する場合）。読み書きは mmap で行う。
+add_questions.py は索引がある（パックを使っている）ときだけ、公開のたびに新しい音声を書き足す。
+
+listening/packs/ は git に入れない（.gitignore。合計で数十 MB あり、作り直すたびに履歴が増えるため）。
+GitHub Pages とは別の配信先に packs/ ごと置き、クイズ（listening/index.html）の AUDIO_PACK_BASE に
+その URL を設定する。未設定ならクイズは索引を取得せず、音声を1問ずつ読む。
+axis 別にするかはストアの meta（pack_by_axis）に保存する。
+
+Usage:
+  python3 audio_packs.py              # パックと索引を作る（変更のあるパックだけ書き換え）
+  python3 audio_packs.py --by-axis    # レベル×axis 別のパックにする（設定を保存）
+  python3 audio_packs.py --by-level   # レベル別のパックに戻す（設定を保存）
+  python3 audio_packs.py --rebuild    # 差分を使わずすべて作り直す
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from lib import id3v2_size, mp3_frame_header, mp3_is_info_frame
+from question_store import open_store
+
+REPO_ROOT = Path(__file__).parent
+LISTENING_DIR = REPO_ROOT / "listening"
+PACK_DIR = LISTENING_DIR / "packs"
+PACK_INDEX = PACK_DIR / "index.json"
+BUILD_STATE = PACK_DIR / "build.json"
+
+INDEX_VERSION = 1
+
+
+def read_clip(path):
+    """音声ファイルを mmap で開き、(mmap, 音声部分の開始位置, 秒数) を返す
+
+    ID3v2 タグは連結すると途中に残って邪魔なので除く。
+    秒数は固定ビットレートとして先頭の音声フレームから計算する（Xing / Info フレームは除く）。
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    start = id3v2_size(mm)
+    header = mp3_frame_header(mm, start)
+    if header is None:
+        mm.close()
+        raise ValueError("MP3 フレーム同期が見つかりません")
+    if mp3_is_info_frame(mm, start, header[0]):
+        start += header[0]
+        header = mp3_frame_header(mm, start) or header
+    duration = (len(mm) - start) * 8 / (header[1] * 1000)
+    return mm, start, round(duration, 2)
+
+
+def load_build_state():
+    """{pack 名: [[audio パス, sha1, バイト数, 秒数], ...]}"""
+    if BUILD_STATE.exists():
+        return json.loads(BUILD_STATE.read_text(encoding="utf-8"))
+    return {}
+
+
+def write_json(path, data, **kwargs):
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data, ensure_ascii=False, **kwargs) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def pool_name(q, by_axis):
+    if by_axis:
+        return f"{q['diff']}-{q.get('axis') or 'none'}"
+    return q["diff"]
+
+
+def collect_pools(questions, by_axis):
+    """{pack 名: [audio パス, ...]}（問題の登録順）"""
+    pools = defaultdict(list)
+    seen = set()
+    for q in questions:
+        audio = q.get("audio")
+        if not audio or audio in seen:
+            continue
+        seen.add(audio)
+        pools[pool_name(q, by_axis)].append(audio)
+    return pools
+
+
+def write_pack(path, clips, previous, rebuild=False):
+    """パックを書き出す。戻り値: (エントリ一覧, 書き込んだバイト数)
+
+    clips: [(audio パス, sha1, mmap, 開始位置, 秒数), ...]
+    previous の中身が clips の先頭と一致し、ファイルのサイズも合っていれば末尾だけ書き足す。
+    """
+    entries = [[audio, sha1, len(mm) - start, duration] for audio, sha1, mm, start, duration in clips]
+    total = sum(e[2] for e in entries)
+
+    keep = 0
+    if not rebuild and previous and path.exists():
+        prev_total = sum(e[2] for e in previous)
+        if (len(previous) <= len(entries) and path.stat().st_size == prev_total
+                and all(p[:3] == e[:3] for p, e in zip(previous, entries))):
+            keep = len(previous)
+    if keep and keep == len(entries):
+        return entries, 0
+
+    offset = sum(e[2] for e in entries[:keep])
+    target = path if keep else path.with_name(path.name + ".tmp")
+    with open(target, "r+b" if keep else "w+b") as f:
+        f.truncate(total)
+        if total:
+            with mmap.mmap(f.fileno(), total) as out:
+                for audio, sha1, mm, start, duration in clips[keep:]:
+                    length = len(mm) - start
+                    out[offset:offset + length] = mm[start:]
+                    offset += length
+                out.flush()
+    if not keep:
+        os.replace(target, path)
+    return entries, total - sum(e[2] for e in entries[:keep])
+
+
+def pack_hash(path):
+    if path.stat().st_size == 0:
+        return hashlib.sha1(b"").hexdigest()[:10]
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return hashlib.sha1(mm).hexdigest()[:10]
+
+
+def build(by_axis=None, rebuild=False):
+    """全パックと索引を作る。戻り値: (索引, 書き込んだバイト数, [(audio パス, 除外理由), ...])
+
+    by_axis: None ならストアの meta（pack_by_axis）の設定に従う
+    """
+    with open_store() as store:
+        if by_axis is None:
+            by_axis = store.get_meta("pack_by_axis") == "1"
+        pools = collect_pools(store.iter_questions(), by_axis)
+
+    PACK_DIR.mkdir(parents=True, exist_ok=True)
+    state = {} if rebuild else load_build_state()
+    new_state = {}
+    index = {"version": INDEX_VERSION, "packs": {}, "clips": {}}
+    written = 0
+    skipped = []
+
+    for name in sorted(pools):
+        clips = []
+        try:
+            for audio in pools[name]:
+                path = LISTENING_DIR / audio
+                if not path.exists() or path.stat().st_size == 0:
+                    skipped.append((audio, "ファイルなし・0バイト"))
+                    continue
+                try:
+                    mm, start, duration = read_clip(path)
+                except ValueError as e:
+                    skipped.append((audio, str(e)))
+                    continue
+                clips.append((audio, hashlib.sha1(mm).hexdigest()[:12], mm, start, duration))
+
+            pack_path = PACK_DIR / f"{name}.mp3"
+            entries, n = write_pack(pack_path, clips, state.get(name), rebuild)
+        finally:
+            for clip in clips:
+                clip[2].close()
+
+        written += n
+        new_state[name] = entries
+        index["packs"][name] = {
+            "file": f"packs/{pack_path.name}",
+            "hash": pack_hash(pack_path),
+            "bytes": pack_path.stat().st_size,
+            "count": len(entries),
+        }
+        offset = 0
+        for audio, _, length, duration in entries:
+            index["clips"][audio] = [name, offset, length, duration]
+            offset += length
+
+    # 今回のプールに無いパック（axis 別 → レベル別への切り替えなど）を削除
+    for stale in PACK_DIR.glob("*.mp3"):
+        if stale.stem not in pools:
+            stale.unlink()
+
+    write_json(PACK_INDEX, index, separators=(",", ":"))
+    write_json(BUILD_STATE, new_state, indent=1)
+    return index, written, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="レベル別の音声パックとオフセット索引を作る")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--by-axis", action="store_true", help="レベル×axis 別のパックにする（設定を保存）")
+    mode.add_argument("--by-level", action="store_true", help="レベル別のパックに戻す（設定を保存）")
+    parser.add_argument("--rebuild", action="store_true", help="差分を使わずすべて作り直す")
+    args = parser.parse_args()
+
+    if args.by_axis or args.by_level:
+        with open_store() as store:
+            with store.conn:
+                store.set_meta("pack_by_axis", "1" if args.by_axis else "0")
+    started = time.perf_counter()
+    index, written, skipped = build(rebuild=args.rebuild)
+    elapsed = time.perf_counter() - started
+
+    for audio, reason in skipped:
+        print(f"  SKIP {audio}: {reason}", file=sys.stderr)
+    total = sum(p["bytes"] for p in index["packs"].values())
+    print(f"音声パック: {len(index['packs'])} 個 / {len(index['clips'])} 問"
+          f"（{total / 1024 / 1024:.1f} MB、書き込み {written / 1024 / 1024:.2f} MB、{elapsed:.2f}秒）")
+    for name, pack in index["packs"].items():
+        print(f"  {name:16s} {pack['count']:4d} 問  {pack['bytes'] / 1024 / 1024:6.2f} MB  {pack['hash']}")
+    print(f"索引: {PACK_INDEX.relative_to(REPO_ROOT)}（{PACK_INDEX.stat().st_size / 1024:.1f} KB）")
+
+
+if __name__ == "__main__":
+    main()
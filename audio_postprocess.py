@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+audio_postprocess.py - 音声の後処理（無音トリム・ラウドネス正規化・再エンコード）
+
+edge-tts の出力はボイスごとに音量が揃っておらず、前後の無音の長さもまちまち。
+ffmpeg で次の処理をかけ、レベル別のビットレート（既定はすべて 48 kbps）で MP3 に再エンコードする。
+
+  1. 先頭・末尾の無音をトリム（前後に PAD_SEC だけ余白を残す）
+  2. loudnorm で -16 LUFS に正規化（ボイス間の音量差をなくす）
+  3. mono / 24kHz / レベル別ビットレートで再エンコード
+
+処理済みのファイルは listening/audio_post.json に出力ハッシュと設定を記録し、
+同じ設定なら二度処理しない（再エンコードの繰り返しで音質が劣化しないように）。
+合成時の単語タイミングがある音声は、先頭を「最初の単語 − PAD_SEC」で正確に切り、
+切った秒数（shift）を記録する（word_timings.py がタイミングをずらすのに使う）。
+add_questions.py が新しい音声に対して自動で実行する。ffmpeg が無ければ何もしない。
+
+Usage:
+  python3 audio_postprocess.py                # 未処理の既存音声をすべて処理
+  python3 audio_postprocess.py --dry-run      # 処理対象の件数とサイズだけ表示
+  python3 audio_postprocess.py --workers 8    # 並列数を指定
+  python3 audio_postprocess.py --report       # 処理済みの記録から削減量を集計
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import tts_cache
+
+REPO_ROOT = Path(__file__).parent
+LISTENING_DIR = REPO_ROOT / "listening"
+AUDIO_DIR = LISTENING_DIR / "audio"
+POST_MANIFEST = LISTENING_DIR / "audio_post.json"
+
+# レベル別のビットレート（kbps）。元の edge-tts の出力が 48 kbps なので、どのレベルもそれを下回らない。
+# 上級ほど発話が速く子音・弱形の聞き分けが問題になるので、上級で下げると難易度が音質で変わってしまう。
+# 既に 48 kbps 未満で処理済みのファイルは設定の違いで処理し直されるが、元より大きくなる出力は
+# 採用しない（process_file）ので、音質を戻すには音声を作り直してから処理する
+LEVEL_BITRATES = {"lv1": 48, "lv2": 48, "lv3": 48, "lv4": 48, "lv5": 48}
+DEFAULT_BITRATE = 48
+SAMPLE_RATE = 24000
+
+TARGET_LUFS = -16.0     # モバイルのスピーカーで聞き取りやすい音量
+TRUE_PEAK = -1.5
+SILENCE_DB = -50        # これより小さい音を無音とみなす
+PAD_SEC = 0.15          # トリム後に前後へ残す余白
+POST_WORKERS = os.cpu_count() or 4
+
+# 処理内容を変えたら上げる（記録済みのファイルも処理し直す）
+POST_VERSION = 1
+
+
+def ffmpeg_path():
+    """ffmpeg の実行ファイル（無ければ None）"""
+    return shutil.which("ffmpeg")
+
+
+def profile_for(diff):
+    """レベルに対応する処理設定（記録の比較に使う）"""
+    return {
+        "v": POST_VERSION,
+        "kbps": LEVEL_BITRATES.get(diff, DEFAULT_BITRATE),
+        "lufs": TARGET_LUFS,
+    }
+
+
+def file_sha1(path):
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+def load_post_manifest():
+    """{"audio/q1.mp3": {"sha1", "profile", "before", "after", "shift"}}
+
+    shift: 先頭を切った秒数（None は無音検出で切ったため不明）
+    """
+    if POST_MANIFEST.exists():
+        return json.loads(POST_MANIFEST.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_post_manifest(manifest):
+    tmp = POST_MANIFEST.with_name(POST_MANIFEST.name + ".tmp")
+    tmp.write_text(
+        json.dumps(dict(sorted(manifest.items())), ensure_ascii=False, indent=1) + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp, POST_MANIFEST)
+
+
+def build_filter(lead=None):
+    """lead: 先頭から切る秒数（None なら無音検出で切る）"""
+    # silenceremove は先頭しか削れないので、反転して末尾も削ってから戻す
+    trim = (f"silenceremove=start_periods=1:start_threshold={SILENCE_DB}dB:"
+            f"start_silence={PAD_SEC}")
+    head = trim if lead is None else f"atrim=start={lead:.3f},asetpts=PTS-STARTPTS"
+    return ",".join([
+        head, "areverse", trim, "areverse",
+        f"loudnorm=I={TARGET_LUFS}:TP={TRUE_PEAK}:LRA=11",
+    ])
+
+
+def process_file(ffmpeg, path, kbps, lead=None):
+    """1ファイルを処理して置き換える（ProcessPoolExecutor のワーカーで実行）
+
+    出力が元より大きい・空の場合は元のファイルを残す。
+    戻り値: (before バイト, after バイト, 置き換えたか)
+    """
+    path = Path(path)
+    before = path.stat().st_size
+    tmp = path.with_name(path.name + ".post.mp3")
+    cmd = [
+        ffmpeg, "-hide_banner", "-loglevel", "error", "-y", "-i", str(path),
+        "-af", build_filter(lead),
+        "-ac", "1", "-ar", str(SAMPLE_RATE), "-codec:a", "libmp3lame", "-b:a", f"{kbps}k",
+        "-map_metadata", "-1", str(tmp),
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip()
+                               else f"ffmpeg 終了コード {result.returncode}")
+        after = tmp.stat().st_size
+        if after == 0 or after >= before:
+            return before, before, False
+        tmp.replace(path)
+        return before, after, True
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def pending_files(entries, manifest, force=False):
+    """処理が必要な [(audio パス, diff), ...] を返す
+
+    entries: [(audio パス, diff), ...]
+    記録の出力ハッシュと現在のファイルが一致し、設定も同じなら処理済みとみなす。
+    """
+    todo = []
+    for audio, diff in entries:
+        path = LISTENING_DIR / audio
+        if not path.exists() or path.stat().st_size == 0:
+            continue
+        rec = manifest.get(audio)
+        if (not force and rec and rec.get("profile") == profile_for(diff)
+                and rec.get("sha1") == file_sha1(path)):
+            continue
+        todo.append((audio, diff))
+    return todo
+
+
+def lead_trim(speech_start, prev_shift):
+    """先頭から切る秒数（単語タイミングが無ければ None = 無音検出）
+
+    speech_start: 合成直後の音声での最初の単語の位置（秒）
+    prev_shift  : このファイルが既に先頭を切られている秒数
+    """
+    if speech_start is None or prev_shift is None:
+        return None
+    return round(max(0.0, speech_start - prev_shift - PAD_SEC), 3)
+
+
+def speech_starts_from_cache(audios):
+    """tts_cache の単語タイミングから {audio パス: 最初の単語の秒数} を作る"""
+    manifest = tts_cache.load_manifest()
+    starts = {}
+    for audio in audios:
+        key = manifest.get(audio)
+        words = tts_cache.load_timings(key) if key else None
+        if words:
+            starts[audio] = words[0][0]
+    return starts
+
+
+def postprocess(entries, workers=POST_WORKERS, force=False, quiet=False, speech_starts=None):
+    """音声ファイルをまとめて後処理し、記録を更新する
+
+    entries: [(audio パス, diff), ...]
+    speech_starts: {audio パス: 合成直後の最初の単語の秒数}（あれば先頭を正確に切る）
+    戻り値: {"processed", "replaced", "failed", "before", "after"}（ffmpeg が無ければ None）
+    """
+    ffmpeg = ffmpeg_path()
+    if ffmpeg is None:
+        return None
+
+    manifest = load_post_manifest()
+    todo = pending_files(entries, manifest, force)
+    stats = {"processed": 0, "replaced": 0, "failed": 0, "before": 0, "after": 0}
+    if not todo:
+        return stats
+
+    speech_starts = speech_starts or {}
+    leads = {}
+    for audio, _ in todo:
+        # 記録と同じファイルなら切った秒数を引き継ぐ（キャッシュから戻した直後なら 0 から）
+        rec = manifest.get(audio)
+        same = rec and rec.get("sha1") == file_sha1(LISTENING_DIR / audio)
+        prev_shift = rec.get("shift") if same else 0.0
+        leads[audio] = (prev_shift, lead_trim(speech_starts.get(audio), prev_shift))
+
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(todo)))) as pool:
+        futures = {
+            pool.submit(process_file, ffmpeg, LISTENING_DIR / audio,
+                        profile_for(diff)["kbps"], leads[audio][1]): (audio, diff)
+            for audio, diff in todo
+        }
+        for future in as_completed(futures):
+            audio, diff = futures[future]
+            prev_shift, lead = leads[audio]
+            try:
+                before, after, replaced = future.result()
+            except Exception as e:
+                stats["failed"] += 1
+                print(f"  ERROR: {audio} の後処理に失敗: {type(e).__name__} {e}", file=sys.stderr)
+                continue
+            if not replaced:
+                shift = prev_shift
+            elif lead is None or prev_shift is None:
+                shift = None        # 無音検出で切った（切った秒数は不明）
+            else:
+                shift = round(prev_shift + lead, 3)
+            manifest[audio] = {
+                "sha1": file_sha1(LISTENING_DIR / audio),
+                "profile": profile_for(diff),
+                "before": before,
+                "after": after,
+                "shift": shift,
+            }
+            stats["processed"] += 1
+            stats["replaced"] += replaced
+            stats["before"] += before
+            stats["after"] += after
+            if not quiet:
+                print(f"  [{stats['processed'] + stats['failed']}/{len(todo)}] {audio} "
+                      f"{before / 1024:.1f} → {after / 1024:.1f} KB")
+
+    save_post_manifest(manifest)
+    return stats
+
+
+def format_saved(before, after):
+    saved = before - after
+    ratio = saved / before * 100 if before else 0.0
+    return (f"{before / 1024 / 1024:.2f} MB → {after / 1024 / 1024:.2f} MB"
+            f"（{saved / 1024 / 1024:.2f} MB 削減、{ratio:.1f}%）")
+
+
+def print_report(stats, elapsed=None):
+    took = f" / {elapsed:.1f}秒" if elapsed is not None else ""
+    print(f"後処理: {stats['processed']} 件（置き換え {stats['replaced']} 件、"
+          f"失敗 {stats['failed']} 件）{took}")
+    if stats["before"]:
+        print(f"  {format_saved(stats['before'], stats['after'])}")
+
+
+def print_manifest_report(manifest):
+    by_level = {}
+    for rec in manifest.values():
+        kbps = rec["profile"]["kbps"]
+        b, a, n = by_level.get(kbps, (0, 0, 0))
+        by_level[kbps] = (b + rec["before"], a + rec["after"], n + 1)
+    print(f"処理済み: {len(manifest)} 件（{POST_MANIFEST.name}）")
+    for kbps in sorted(by_level, reverse=True):
+        b, a, n = by_level[kbps]
+        print(f"  {kbps:3d} kbps: {n:4d} 件  {format_saved(b, a)}")
+    total_b = sum(r["before"] for r in manifest.values())
+    total_a = sum(r["after"] for r in manifest.values())
+    if total_b:
+        print(f"  合計     : {format_saved(total_b, total_a)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="音声の無音トリム・ラウドネス正規化・再エンコード")
+    parser.add_argument("--workers", type=int, default=POST_WORKERS,
+                        help=f"並列プロセス数（デフォルト: {POST_WORKERS}）")
+    parser.add_argument("--force", action="store_true", help="処理済みのファイルも処理し直す")
+    parser.add_argument("--dry-run", action="store_true", help="処理対象の表示のみ")
+    parser.add_argument("--report", action="store_true", help="処理済みの記録から削減量を集計")
+    args = parser.parse_args()
+
+    if args.report:
+        print_manifest_report(load_post_manifest())
+        return
+
+    if ffmpeg_path() is None:
+        print("ERROR: ffmpeg が見つかりません")
+        print("  brew install ffmpeg  /  apt install ffmpeg")
+        sys.exit(1)
+
+    from question_store import open_store
+    with open_store() as store:
+        entries = [(q["audio"], q["diff"]) for q in store.iter_questions() if q.get("audio")]
+
+    if args.dry_run:
+        todo = pending_files(entries, load_post_manifest(), args.force)
+        size = sum((LISTENING_DIR / audio).stat().st_size for audio, _ in todo)
+        print(f"[dry-run] 処理対象: {len(todo)} / {len(entries)} 件（{size / 1024 / 1024:.2f} MB）")
+        return
+
+    print(f"音声の後処理を開始（{len(entries)} 件、並列 {args.workers}）")
+    started = time.perf_counter()
+    speech_starts = speech_starts_from_cache([audio for audio, _ in entries])
+    stats = postprocess(entries, workers=args.workers, force=args.force, speech_starts=speech_starts)
+    print()
+    print_report(stats, time.perf_counter() - started)
+    if stats["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+axis_features.py - 問題バンクの特徴量抽出（NumPy）と axis / diff ラベルの検証
+
+問題文・選択肢・音声ファイルから次の特徴量を全問まとめて計算する。
+
+  words        : 語数
+  reduction    : 音変化トークン数（gonna / wanna / lemme / didja ...）
+  contraction  : 縮約形の数（I'm / don't / we've ...）
+  idiom        : イディオム辞書のヒット数
+  duration     : 音声の長さ（秒。audio_meta.py の索引から。実行前に索引を更新し、
+                 それでも索引に無い音声は NaN = 音声なしとして扱う）
+  wps          : 1秒あたりの語数（音声がある場合）
+  choice_mean / choice_std / answer_ratio : 選択肢の長さの平均・標準偏差・正解の長さ比
+
+テキストは1本に連結して正規表現を1回だけ走らせ、マッチ位置を np.searchsorted で
+問題番号に戻して np.bincount で数えるので、Python のループは問題数に比例しない。
+5万問でも1秒かからない。
+
+特徴量と食い違うラベルを一覧表示し、明らかな reduction / speed の問題には
+事前ラベルを付ける（classify_axis.py が API 呼び出しの前に使う）。
+
+Usage:
+  python3 axis_features.py               # 特徴量の集計と食い違うラベルの一覧
+  python3 axis_features.py --limit 50    # 一覧の表示件数
+  python3 axis_features.py --bench 50000 # 5万問に複製して処理時間を計測
+"""
+
+import argparse
+import re
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:     # classify_axis.py は numpy が無ければ事前ラベルを省略する
+    np = None
+
+import audio_meta
+from question_store import open_store
+
+# 音変化（reduction）トークン
+REDUCTION_TOKENS = [
+    "gonna", "wanna", "gotta", "hafta", "hasta", "kinda", "sorta", "dunno", "lemme", "gimme",
+    "outta", "lotta", "betcha", "gotcha", "dontcha", "didja", "didya", "whaddya", "whadya",
+    "wouldja", "couldja", "toldja", "coulda", "woulda", "shoulda", "musta", "oughta", "ya",
+    "y'know", "c'mon", "'cause", "'em", "ain't", "y'all", "tryna", "innit", "s'pose",
+]
+# イディオム・句動詞の辞書（部分一致。活用形は代表形だけ）
+IDIOMS = [
+    "break a leg", "hit the sack", "hit the road", "piece of cake", "under the weather",
+    "call it a day", "cut corners", "on the fence", "in the loop", "out of the loop",
+    "the last straw", "spill the beans", "beat around the bush", "bite the bullet",
+    "cost an arm and a leg", "once in a blue moon", "get the ball rolling", "hang in there",
+    "pull it off", "pulled it off", "figure it out", "figured it out", "no big deal",
+    "my bad", "a long shot", "on the same page", "ballpark", "touch base", "rain check",
+    "dead horse", "wash our hands", "wash my hands", "cold feet", "go the extra mile",
+    "hit it off", "let it slide", "jump the gun", "play it by ear", "sleep on it",
+    "take it easy", "up in the air", "the ball is in your court", "back to square one",
+    "blow off steam", "cut me some slack", "hold your horses", "keep an eye on",
+    "kill two birds", "let the cat out", "miss the boat", "over the moon", "rule of thumb",
+    "speak of the devil", "throw in the towel", "tip of the iceberg", "under my belt",
+    "when pigs fly", "you can say that again", "drop the ball", "dropped the ball",
+    "in hot water", "on thin ice", "out of the blue", "bent out of shape", "beats me",
+    "for real", "no way", "i'm down", "count me in", "hang out", "flake", "bail on",
+]
+
+# 事前ラベル・食い違い判定のしきい値
+PRELABEL_REDUCTION = 2       # 音変化トークンがこれ以上なら reduction
+PRELABEL_SPEED_WPS = 3.6     # 1秒あたりの語数がこれ以上なら speed
+SLOW_WPS = 2.4               # speed ラベルなのにこれ未満なら要確認
+LEVELS = ["lv1", "lv2", "lv3", "lv4", "lv5"]
+
+def _phrase_pattern(phrases):
+    """語句リストを接頭辞で束ねた正規表現にする
+
+    gonna|gotta|gotcha|... を単純に | で並べると位置ごとに全候補を試すので遅い。
+    go(?:nna|t(?:ta|cha)) のように木構造にすると 5万問の連結テキストで数十倍速い。
+    """
+    trie = {}
+    for p in phrases:
+        node = trie
+        for ch in p:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return "(?:" + body + ")?" if "" in node else body
+
+    return re.compile(r"(?<![a-z0-9'])" + build(trie) + r"(?![a-z0-9])")
+
+
+_REDUCTION = _phrase_pattern(REDUCTION_TOKENS)
+_IDIOM = _phrase_pattern(IDIOMS)
+# 縮約形はアポストロフィから探す（先頭が固定文字だと re が高速に読み飛ばせる）
+_CONTRACTION = re.compile(r"'(?:s|re|ve|ll|d|t|m)(?![a-z])")
+
+# 語の構成文字（ASCII 以外は encode 時に "?" になるので語の区切り扱い）
+_WORD_CHARS = np.zeros(256, dtype=bool) if np is not None else None
+if _WORD_CHARS is not None:
+    _WORD_CHARS[np.frombuffer(b"abcdefghijklmnopqrstuvwxyz0123456789'", dtype=np.uint8)] = True
+
+
+def _count_by_owner(starts, offsets, n):
+    """連結テキスト上の位置を問題ごとの件数にする"""
+    owners = np.searchsorted(offsets, starts, side="right") - 1
+    return np.bincount(owners, minlength=n)
+
+
+def _count_matches(pattern, corpus, offsets, n):
+    starts = np.fromiter((m.start() for m in pattern.finditer(corpus)), dtype=np.int64)
+    return _count_by_owner(starts, offsets, n)
+
+
+def _count_words(corpus, offsets, n):
+    # 語の先頭 = 構成文字で、直前が構成文字でない位置（"?" 置換で文字位置はそのまま）
+    is_word = _WORD_CHARS[np.frombuffer(corpus.encode("ascii", "replace"), dtype=np.uint8)]
+    starts = np.flatnonzero(is_word & ~np.concatenate(([False], is_word[:-1])))
+    return _count_by_owner(starts, offsets, n)
+
+
+def extract_features(questions, durations=None):
+    """全問の特徴量を {名前: np.ndarray} で返す
+
+    durations: {audio パス: 秒}（audio_meta の索引）。載っていない音声の duration / wps は NaN。
+    ファイルサイズからの推定はビットレートが一定でないと外れるので行わない。
+    """
+    n = len(questions)
+    texts = [q["text"].lower().replace("’", "'") for q in questions]
+    corpus = "\n".join(texts)
+    lengths = np.fromiter((len(t) + 1 for t in texts), dtype=np.int64, count=n)
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    words = _count_words(corpus, offsets, n)
+    reduction = _count_matches(_REDUCTION, corpus, offsets, n)
+    contraction = _count_matches(_CONTRACTION, corpus, offsets, n)
+    idiom = _count_matches(_IDIOM, corpus, offsets, n)
+
+    durations = durations or {}
+    duration = np.fromiter((durations.get(q.get("audio"), np.nan) for q in questions),
+                           dtype=np.float64, count=n)
+
+    choice_len = np.zeros((n, 5))
+    for i, q in enumerate(questions):
+        lens = [len(c) for c in (q.get("choices") or [])[:5]]
+        choice_len[i, :len(lens)] = lens
+    distractor_mean = choice_len[:, 1:].mean(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return {
+            "words": words,
+            "reduction": reduction,
+            "contraction": contraction,
+            "idiom": idiom,
+            "reduction_density": reduction / np.maximum(words, 1),
+            "duration": duration,
+            "wps": words / duration,
+            "choice_mean": choice_len.mean(axis=1),
+            "choice_std": choice_len.std(axis=1),
+            "answer_ratio": choice_len[:, 0] / np.where(distractor_mean > 0, distractor_mean, np.nan),
+        }
+
+
+def prelabel(features):
+    """明らかな reduction / speed の問題に axis を付ける（それ以外は空文字）"""
+    labels = np.full(len(features["words"]), "", dtype=object)
+    speed = (features["wps"] >= PRELABEL_SPEED_WPS) & (features["words"] >= 8)
+    labels[speed] = "speed"
+    # 音変化トークンが複数あれば reduction を優先
+    labels[features["reduction"] >= PRELABEL_REDUCTION] = "reduction"
+    return labels
+
+
+def prelabel_questions(questions, durations=None):
+    """{text: axis}（事前ラベルが付いた問題だけ）"""
+    if not questions:
+        return {}
+    labels = prelabel(extract_features(questions, durations))
+    return {q["text"]: axis for q, axis in zip(questions, labels) if axis}
+
+
+def flag_labels(questions, features):
+    """特徴量と食い違う axis / diff ラベルを [(index, 理由), ...] で返す"""
+    axis = np.array([q.get("axis") or "" for q in questions], dtype=object)
+    level = np.array([LEVELS.index(q["diff"]) if q.get("diff") in LEVELS else -1 for q in questions])
+    words = features["words"]
+    red = features["reduction"]
+    wps = features["wps"]
+
+    checks = [
+        ((axis == "reduction") & (red == 0) & (features["contraction"] == 0),
+         "axis=reduction だが音変化・縮約形が無い"),
+        (((axis != "reduction") & (axis != "speed") & (axis != "")) & (red >= PRELABEL_REDUCTION + 1),
+         "音変化トークンが多いが axis が reduction / speed ではない"),
+        ((axis == "speed") & (wps < SLOW_WPS),
+         f"axis=speed だが発話が遅い（{SLOW_WPS} 語/秒未満）"),
+    ]
+
+    # diff: 語数から推定したレベルと2段階以上ずれているもの
+    known = level >= 0
+    medians = np.array([
+        np.median(words[level == lv]) if np.any(level == lv) else np.nan for lv in range(len(LEVELS))
+    ])
+    valid = ~np.isnan(medians)
+    if valid.sum() >= 2 and np.all(np.diff(medians[valid]) > 0):
+        expected = np.interp(words, medians[valid], np.arange(len(LEVELS))[valid])
+        checks.append((known & (np.abs(expected - level) >= 2),
+                       "語数がレベルの標準から大きく外れている"))
+
+    flags = []
+    for mask, reason in checks:
+        flags.extend((int(i), reason) for i in np.flatnonzero(mask))
+    flags.sort()
+    return flags
+
+
+def print_summary(questions, features):
+    axis = np.array([q.get("axis") or "未付与" for q in questions], dtype=object)
+    print(f"{'axis':12s} {'問数':>5s} {'語数':>6s} {'音変化':>6s} {'縮約':>6s} {'イディオム':>6s} {'語/秒':>6s}")
+    for name in sorted(set(axis)):
+        m = axis == name
+        print(f"{name:12s} {m.sum():5d} {features['words'][m].mean():6.1f} "
+              f"{features['reduction'][m].mean():6.2f} {features['contraction'][m].mean():6.2f} "
+              f"{features['idiom'][m].mean():6.2f} {np.nanmean(features['wps'][m]):6.2f}")
+
+
+def bench(questions, n, durations=None):
+    base = questions
+    questions = [base[i % len(base)] for i in range(n)]
+    started = time.perf_counter()
+    features = extract_features(questions, durations=durations)
+    flag_labels(questions, features)
+    prelabel(features)
+    elapsed = time.perf_counter() - started
+    print(f"{n:,} 問: {elapsed * 1000:.0f} ms（特徴量抽出 + ラベル検証 + 事前ラベル）")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="特徴量抽出と axis / diff ラベルの検証")
+    parser.add_argument("--limit", type=int, default=30, help="食い違いの表示件数（デフォルト: 30）")
+    parser.add_argument("--bench", type=int, default=None, metavar="N",
+                        help="N 問に複製して処理時間を計測")
+    args = parser.parse_args()
+
+    if np is None:
+        print("ERROR: numpy がインストールされていません")
+        print("  pip3 install numpy")
+        sys.exit(1)
+
+    with open_store() as store:
+        questions = list(store.iter_questions())
+        # 索引に無い音声は duration が NaN になるので、先に変わったファイルだけ読み直す
+        audio_meta.update_index(store)
+        durations = store.audio_durations()
+    if not questions:
+        print("問題がありません")
+        sys.exit(0)
+
+    if args.bench:
+        bench(questions, args.bench, durations)
+        return
+
+    features = extract_features(questions, durations=durations)
+    print_summary(questions, features)
+
+    labels = prelabel(features)
+    axis = [q.get("axis") for q in questions]
+    agree = sum(1 for a, p in zip(axis, labels) if p and a == p)
+    print(f"\n事前ラベル: {sum(1 for p in labels if p)} 問（既存の axis と一致 {agree} 問）")
+
+    flags = flag_labels(questions, features)
+    print(f"\n特徴量と食い違うラベル: {len(flags)} 件")
+    for i, reason in flags[:args.limit]:
+        q = questions[i]
+        wps = features["wps"][i]
+        wps_str = f"{wps:.1f}語/秒" if np.isfinite(wps) else "音声なし"
+        print(f"  [{q['diff']}/{q.get('axis', '-')}] {reason}（{features['words'][i]}語・{wps_str}）")
+        print(f"      {q['text'][:80]}")
+
+
+if __name__ == "__main__":
+    main()
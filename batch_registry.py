@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+batch_registry.py - 投入済み Batch API ジョブの一覧（listening/batch_state.json）
+
+generate_questions.py --batch が投入のたびにジョブを登録し、check_batch.py が
+完了したジョブから個別に取り込んで登録を外す。複数のジョブを同時に走らせられる。
+
+  {"version": 2, "jobs": {"msgbatch_...": {"batch_id", "model", "count",
+                                            "axis_only", "submitted_at", "requests"}}}
+
+旧形式（ジョブ1件だけの {"batch_id": ...}）は読み込み時に自動で変換する。
+
+Usage:
+  python3 batch_registry.py          # 登録中のジョブ一覧
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from lib import file_lock
+
+REPO_ROOT = Path(__file__).parent
+BATCH_STATE = REPO_ROOT / "listening" / "batch_state.json"
+REGISTRY_LOCK = REPO_ROOT / "listening" / ".batch_state.lock"
+
+REGISTRY_VERSION = 2
+
+
+def load_registry():
+    """{batch_id: job} を返す（ファイルが無ければ空）"""
+    if not BATCH_STATE.exists():
+        return {}
+    data = json.loads(BATCH_STATE.read_text(encoding="utf-8"))
+    if "batch_id" in data:                      # 旧形式（単一ジョブ）
+        return {data["batch_id"]: data}
+    return data.get("jobs", {})
+
+
+def save_registry(jobs):
+    """ジョブ一覧をアトミックに書き込む（空ならファイルごと削除）"""
+    if not jobs:
+        BATCH_STATE.unlink(missing_ok=True)
+        return
+    tmp = BATCH_STATE.with_name(BATCH_STATE.name + ".tmp")
+    tmp.write_text(
+        json.dumps({"version": REGISTRY_VERSION, "jobs": jobs}, ensure_ascii=False, indent=2) + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp, BATCH_STATE)
+
+
+def register_job(batch_id, model, count, requests, axis_only=None):
+    """投入したジョブを登録する
+
+    requests: [{"custom_id", "count", "lv": [lv1..lv5]}, ...]
+    """
+    job = {
+        "batch_id": batch_id,
+        "model": model,
+        "count": count,
+        "axis_only": sorted(axis_only) if axis_only else None,
+        "submitted_at": datetime.now(timezone.utc).isoformat(),
+        "requests": requests,
+    }
+    with file_lock(REGISTRY_LOCK, wait=True):
+        jobs = load_registry()
+        jobs[batch_id] = job
+        save_registry(jobs)
+    return job
+
+
+def remove_job(batch_id):
+    """取り込みが済んだジョブの登録を外す"""
+    with file_lock(REGISTRY_LOCK, wait=True):
+        jobs = load_registry()
+        if jobs.pop(batch_id, None) is not None:
+            save_registry(jobs)
+
+
+def print_jobs(jobs):
+    for job in sorted(jobs.values(), key=lambda j: j.get("submitted_at", "")):
+        axis = ",".join(job["axis_only"]) if job.get("axis_only") else "全 axis"
+        print(f"  {job['batch_id']}  {job.get('submitted_at', '不明')[:19]}  "
+              f"{job['count']}問  {job.get('model', '不明')}  {axis}")
+
+
+def main():
+    jobs = load_registry()
+    if not jobs:
+        print("登録中の Batch ジョブはありません")
+        return
+    print(f"登録中の Batch ジョブ: {len(jobs)} 件")
+    print_jobs(jobs)
+
+
+if __name__ == "__main__":
+    main()
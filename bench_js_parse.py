@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+bench_js_parse.py - 問題データの読み込み（パース）時間のベンチマーク
+
+現在の問題を複製して 800 / 5,000 / 20,000 問の合成データを一時ディレクトリに作り、
+ローカルの Node.js（V8）で次の形式のパース + 評価時間を比較する。
+
+  literal    : 従来の questions.js（const DATA = [ { diff: "lv1", ... } ];）
+  json.parse : questions.js の JSON.parse 形式（question_store.py --format json）
+  .json      : シャードと同じ JSON ファイルを fetch した後の JSON.parse（本文の取得時間は含まない）
+
+JSON.parse 形式は JS の文字列リテラルとして一度読んでから JSON パーサーに渡すので、
+件数が増えると文字列の走査分だけ有利さが薄れる。fetch した本文をそのまま JSON.parse する
+.json（クイズのシャード読み込み）が最も速い。
+
+クイズはシャード（.json）を読むので、questions.js の形式（literal / json.parse）の差が出るのは
+questions.js を直接読む外部の利用者と、シャードのマニフェストが取れないときのフォールバックだけ。
+
+同じソースを2回コンパイルすると V8 のコンパイルキャッシュに当たるので、
+試行ごとに末尾のコメントを変えて毎回コンパイルさせる。
+
+Usage:
+  python3 bench_js_parse.py
+  python3 bench_js_parse.py --sizes 800 5000 --repeat 9 --node /usr/local/bin/node
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from lib import load_questions_js
+from question_shards import serialize, to_record
+from question_store import QUESTIONS_JS, iter_js_chunks
+
+DEFAULT_SIZES = [800, 5_000, 20_000]
+
+# node harness.js <ファイル> <形式> <試行回数> → {"min": ms, "median": ms, "count": 問題数}
+HARNESS = r"""
+const fs = require('fs');
+const vm = require('vm');
+const { performance } = require('perf_hooks');
+const [file, form, repeat] = process.argv.slice(2);
+const source = fs.readFileSync(file, 'utf8');
+const times = [];
+let count = 0;
+for (let i = 0; i < Number(repeat); i++) {
+  if (form === 'json') {
+    const started = performance.now();
+    const data = JSON.parse(source);
+    times.push(performance.now() - started);
+    count = data.length;
+  } else {
+    const ctx = vm.createContext({});
+    const code = `${source}\n;globalThis.__n = DATA.length; // ${i}`;
+    const started = performance.now();
+    new vm.Script(code).runInContext(ctx);
+    times.push(performance.now() - started);
+    count = ctx.__n;
+  }
+}
+times.sort((a, b) => a - b);
+console.log(JSON.stringify({ min: times[0], median: times[times.length >> 1], count }));
+"""
+
+# (表示名, ハーネスでの読み方)  js: スクリプトとして評価  json: JSON.parse
+FORMS = (("literal", "js"), ("json.parse", "js"), (".json", "json"))
+
+
+def synthetic_questions(base, n):
+    """base の問題を繰り返して n 問にする（text は一意にする）"""
+    out = []
+    for i in range(n):
+        q = dict(base[i % len(base)])
+        if i >= len(base):
+            q["text"] = f"{q['text']} ({i // len(base)})"
+        out.append(q)
+    return out
+
+
+def write_forms(questions, workdir):
+    """{形式: ファイルパス}"""
+    n = len(questions)
+    paths = {}
+    for label, fmt in (("literal", "literal"), ("json.parse", "json")):
+        path = workdir / f"questions_{n}_{fmt}.js"
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(iter_js_chunks(questions, n, fmt))
+        paths[label] = path
+    path = workdir / f"questions_{n}.json"
+    path.write_bytes(serialize([to_record(q) for q in questions]))
+    paths[".json"] = path
+    return paths
+
+
+def run_node(node, harness, path, form, repeat):
+    result = subprocess.run([node, str(harness), str(path), form, str(repeat)],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"ERROR: node の実行に失敗しました\n{result.stderr}", file=sys.stderr)
+        sys.exit(1)
+    return json.loads(result.stdout)
+
+
+def bench(node, harness, base, n, repeat, workdir):
+    questions = synthetic_questions(base, n)
+    paths = write_forms(questions, workdir)
+    print(f"\n{n:,} 問")
+    baseline = None
+    for label, form in FORMS:
+        path = paths[label]
+        r = run_node(node, harness, path, form, repeat)
+        if r["count"] != n:
+            print(f"ERROR: {label} の件数が一致しません（{r['count']} != {n}）", file=sys.stderr)
+            sys.exit(1)
+        baseline = baseline or r["median"]
+        print(f"  {label:10s}: 中央値 {r['median']:8.1f} ms  最短 {r['min']:8.1f} ms"
+              f"  {path.stat().st_size / 1024 / 1024:6.2f} MB  （literal 比 {r['median'] / baseline:5.2f}x）")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="問題データのパース時間のベンチマーク（Node.js）")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="問題数（デフォルト: 800 5000 20000）")
+    parser.add_argument("--repeat", type=int, default=7, help="各形式の試行回数（中央値と最短を表示）")
+    parser.add_argument("--node", default=shutil.which("node"), help="Node.js の実行ファイル")
+    args = parser.parse_args()
+
+    if not args.node:
+        print("ERROR: node が見つかりません（--node で指定してください）", file=sys.stderr)
+        sys.exit(1)
+    if not QUESTIONS_JS.exists():
+        print(f"ERROR: {QUESTIONS_JS} が見つかりません", file=sys.stderr)
+        sys.exit(1)
+
+    version = subprocess.run([args.node, "--version"], capture_output=True, text=True).stdout.strip()
+    print(f"Node.js {version}（{args.node}）")
+    base = load_questions_js(QUESTIONS_JS)
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        harness = workdir / "harness.js"
+        harness.write_text(HARNESS, encoding="utf-8")
+        for n in args.sizes:
+            bench(args.node, harness, base, n, args.repeat, workdir)
+
+
+if __name__ == "__main__":
+    main()
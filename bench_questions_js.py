@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+bench_questions_js.py - questions.js 読み込み方式のベンチマーク
+
+現在の questions.js を複製して 800 / 10,000 / 50,000 問の合成ファイルを一時
+ディレクトリに作り、次の方式の所要時間を比較する。
+
+  regex(text)     : 従来の text フィールドだけの正規表現抽出
+  regex(per-line) : 従来の classify_axis 方式（1行ずつ text / diff を正規表現抽出）
+  tokenizer       : lib.iter_questions_js（全フィールドを型付きで取得）
+  cache(cold)     : lib.load_questions_js の初回（パース + キャッシュ書き込み）
+  cache(warm)     : lib.load_questions_js の2回目以降（キャッシュ読み込みのみ）
+
+Usage:
+  python3 bench_questions_js.py
+  python3 bench_questions_js.py --sizes 800 5000 --repeat 5
+"""
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from lib import format_question_js, iter_questions_js, load_questions_js
+
+QUESTIONS_JS = Path(__file__).parent / "listening" / "questions.js"
+DEFAULT_SIZES = [800, 10_000, 50_000]
+
+_TEXT_RE = re.compile(r'\btext:\s*"((?:[^"\\]|\\.)*)"')
+_DIFF_RE = re.compile(r'\bdiff:\s*"(lv[1-5])"')
+
+
+def make_questions_js(base, n):
+    """base の問題を繰り返して n 問の questions.js 文字列を作る（text は一意にする）"""
+    lines = []
+    for i in range(n):
+        q = dict(base[i % len(base)])
+        if i >= len(base):
+            q["text"] = f"{q['text']} ({i // len(base)})"
+        lines.append(format_question_js(q))
+    return f"// questions.js — {n} questions\nconst DATA = [\n" + ",\n".join(lines) + "\n];\n"
+
+
+def regex_texts(content):
+    return _TEXT_RE.findall(content)
+
+
+def regex_lines(content):
+    out = []
+    for line in content.split("\n"):
+        text_m = _TEXT_RE.search(line)
+        diff_m = _DIFF_RE.search(line)
+        if text_m and diff_m:
+            out.append({"text": text_m.group(1), "diff": diff_m.group(1)})
+    return out
+
+
+def best_of(fn, repeat):
+    """repeat 回実行して最短時間（秒）と最後の戻り値を返す"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def bench(base, n, repeat, workdir):
+    path = workdir / f"questions_{n}.js"
+    cache = workdir / f"questions_{n}.cache"
+    path.write_text(make_questions_js(base, n), encoding="utf-8")
+
+    def read():
+        return path.read_text(encoding="utf-8")
+
+    def cold():
+        cache.unlink(missing_ok=True)
+        return load_questions_js(path, cache)
+
+    rows = [
+        ("regex(text)", lambda: regex_texts(read())),
+        ("regex(per-line)", lambda: regex_lines(read())),
+        ("tokenizer", lambda: list(iter_questions_js(read()))),
+        ("cache(cold)", cold),
+        ("cache(warm)", lambda: load_questions_js(path, cache)),
+    ]
+    size_mb = path.stat().st_size / 1024 / 1024
+    print(f"\n{n:,} 問（{size_mb:.1f} MB）")
+    baseline = None
+    for label, fn in rows:
+        elapsed, result = best_of(fn, repeat)
+        if len(result) != n:
+            print(f"ERROR: {label} の件数が一致しません（{len(result)} != {n}）", file=sys.stderr)
+            sys.exit(1)
+        baseline = baseline or elapsed
+        print(f"  {label:15s}: {elapsed * 1000:9.1f} ms  （regex(text) 比 {elapsed / baseline:5.2f}x）")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="questions.js 読み込み方式のベンチマーク")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="問題数（デフォルト: 800 10000 50000）")
+    parser.add_argument("--repeat", type=int, default=3, help="各方式の試行回数（最短時間を採用）")
+    args = parser.parse_args()
+
+    if not QUESTIONS_JS.exists():
+        print(f"ERROR: {QUESTIONS_JS} が見つかりません", file=sys.stderr)
+        sys.exit(1)
+
+    base = load_questions_js(QUESTIONS_JS)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            bench(base, n, args.repeat, Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
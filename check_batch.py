@@ -2,16 +2,36 @@
 """
 check_batch.py - Batch API の結果を確認 → staging.json に保存 → add_questions.py を自動実行
 
+batch_state.json（batch_registry.py）に登録された複数のジョブのうち、ended に
+なったものだけをまとめて取り込む。未完了のジョブは登録されたまま次回に回る。
+
+結果は1件ずつ届いた順にパース・重複除去し、custom_id ごとに
+listening/batch_results/<batch_id>.jsonl へ追記する（チェックポイント）。
+途中で中断・エラー終了しても、再実行すると取り込み済みの custom_id を飛ばして続きから処理する。
+
+--watch を付けると ended になるまでポーリングし（指数バックオフ + ジッター）、
+完了した時点で staging.json → 音声生成 → 公開まで自動で進める。取り込み〜公開の間だけ
+ロックファイル（listening/.publish.lock）を取るので、watch を二重に起動しても二重公開されず、
+待機中の watch が他の取り込み・公開（手動の --batch-id・audio_check.py --gc）を止めることもない。
+ポーリングは接続エラー・429・5xx だけを再試行し、それ以外の 4xx（認証エラーなど）は中止する。
+見つからない（404）ジョブは今回の対象から外す。
+
 Usage:
   python3 check_batch.py           # 状態確認 + 完了なら自動処理
   python3 check_batch.py --status  # 状態確認のみ（staging.json に保存しない）
+  python3 check_batch.py --watch   # 完了まで待って自動で取り込み・公開
+  python3 check_batch.py --batch-id msgbatch_xxx   # 指定ジョブだけ取り込む
 """
 
 import argparse
+import contextlib
 import json
 import os
+import random
 import subprocess
 import sys
+import time
+from datetime import datetime
 from pathlib import Path
 
 try:
@@ -26,118 +46,362 @@ try:
 except ImportError:
     pass
 
-from lib import parse_response  # noqa: E402
+from lib import add_usage, file_lock, held_lock_env, parse_response, print_usage, usage_to_dict  # noqa: E402
+from batch_registry import load_registry, remove_job  # noqa: E402
+from dedup_index import load_index  # noqa: E402
 
 REPO_ROOT = Path(__file__).parent
 STAGING_JSON = REPO_ROOT / "listening" / "staging.json"
-BATCH_STATE = REPO_ROOT / "listening" / "batch_state.json"
+CHECKPOINT_DIR = REPO_ROOT / "listening" / "batch_results"
+PUBLISH_LOCK = REPO_ROOT / "listening" / ".publish.lock"
 
+# --watch のポーリング間隔（秒）。Batch は数分〜24時間かかるので上限は長めに取る
+WATCH_INTERVAL = 60.0
+WATCH_MAX_INTERVAL = 1800.0
 
-def deduplicate(questions):
-    """text フィールドで重複を除去"""
-    seen = set()
+
+def deduplicate(questions, seen=None, index=None):
+    """text フィールドで重複を除去
+
+    seen を渡すと既出テキストの集合として使い回す（結果を逐次処理する用）
+    index (dedup_index.NearDupIndex) を渡すと既存問題バンクとの類似重複も除去する
+    """
+    seen = set() if seen is None else seen
     unique = []
     for q in questions:
         t = q["text"].strip().lower()
-        if t not in seen:
-            seen.add(t)
-            unique.append(q)
+        if t in seen:
+            continue
+        if index is not None:
+            if index.find_duplicate(q["text"]):
+                continue
+            index.add(q["text"])
+        seen.add(t)
+        unique.append(q)
     return unique
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Batch API の結果確認・取得")
-    parser.add_argument("--status", action="store_true", help="状態確認のみ（保存しない）")
-    args = parser.parse_args()
+def checkpoint_path(batch_id):
+    return CHECKPOINT_DIR / f"{batch_id}.jsonl"
 
-    if not BATCH_STATE.exists():
-        print("未処理の Batch ジョブがありません")
-        print("先に python3 generate_questions.py --batch を実行してください")
-        sys.exit(0)
 
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
-    if not api_key:
-        print("ERROR: ANTHROPIC_API_KEY が設定されていません")
-        sys.exit(1)
+def load_checkpoint(path):
+    """チェックポイントを読み込む（1行 = 1 custom_id の取り込み結果）
 
-    state = json.loads(BATCH_STATE.read_text())
-    batch_id = state["batch_id"]
-    submitted_at = state.get("submitted_at", "不明")
+    書き込み途中で落ちた末尾の壊れた行は切り詰める。
+    戻り値: [{"custom_id", "type", "questions", "usage"}, ...]
+    """
+    if not path.exists():
+        return []
+    records = []
+    good_end = 0
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+            if not line.endswith(b"\n"):
+                records.pop()
+                break
+            good_end += len(line)
+    if good_end != path.stat().st_size:
+        with open(path, "r+b") as f:
+            f.truncate(good_end)
+    return records
 
-    print(f"Batch ID: {batch_id}")
-    print(f"投入日時: {submitted_at}")
-    print(f"予定問題数: {state['count']} 問")
-    print(f"モデル: {state.get('model', '不明')}")
 
-    client = anthropic.Anthropic(api_key=api_key)
+def iter_checkpoint_questions(path):
+    """チェックポイントから問題を1問ずつ返す（全件をメモリに載せない）"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            yield from json.loads(line).get("questions", [])
 
-    # ステータス確認
-    batch = client.messages.batches.retrieve(batch_id)
-    status = batch.processing_status
 
-    counts = batch.request_counts
-    print(f"\n処理状況: {status}")
-    print(f"  処理済み: {counts.succeeded} 件 / 全{counts.succeeded + counts.errored + counts.canceled + counts.expired} 件")
-    if counts.errored:
-        print(f"  エラー: {counts.errored} 件")
+def write_staging(questions):
+    """問題を1件ずつ staging.json（JSON 配列）に書き出す（戻り値: 件数）"""
+    n = 0
+    tmp = STAGING_JSON.with_name(STAGING_JSON.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write("[")
+        for q in questions:
+            f.write(",\n  " if n else "\n  ")
+            f.write(json.dumps(q, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+            n += 1
+        f.write("\n]\n" if n else "]\n")
+    os.replace(tmp, STAGING_JSON)
+    return n
 
-    if status != "ended":
-        print("\nまだ処理中です。しばらく待ってから再度実行してください。")
-        sys.exit(0)
 
-    if args.status:
-        print("\n--status モードのため保存をスキップします")
-        sys.exit(0)
+def ingest_results(client, batch_id, path, seen, index, usage):
+    """Batch の結果をチェックポイントに取り込む（取り込み済みの custom_id は飛ばす）
 
-    # 結果取得
-    print("\n結果を取得中...")
-    all_questions = []
+    seen / index / usage は複数ジョブで共有し、ジョブをまたいだ重複も除去する。
+    戻り値: (取得問題数, 失敗リクエスト数, 重複除去数)
+    """
+    CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
+    done = set()
+    kept = 0
     error_count = 0
+    removed = 0
 
-    for result in client.messages.batches.results(batch_id):
-        if result.result.type == "succeeded":
-            raw = result.result.message.content[0].text
-            questions = parse_response(raw, raise_on_error=False)
-            all_questions.extend(questions)
-            print(f"  {result.custom_id}: {len(questions)} 問 取得")
-        else:
+    # 取り込み済みの結果で重複判定の状態を復元
+    for rec in load_checkpoint(path):
+        done.add(rec["custom_id"])
+        add_usage(usage, rec.get("usage"))
+        if rec["type"] != "succeeded":
             error_count += 1
-            print(f"  {result.custom_id}: ERROR ({result.result.type})", file=sys.stderr)
+        for q in rec.get("questions", []):
+            seen.add(q["text"].strip().lower())
+            index.add(q["text"])
+            kept += 1
+        removed += rec.get("removed", 0)
+    if done:
+        print(f"  チェックポイントから再開: {len(done)} 件取り込み済み（{kept} 問）")
+
+    with open(path, "a", encoding="utf-8") as out:
+        # 結果は1件ずつ届くので、届いた順にパース・重複除去して追記する
+        for result in client.messages.batches.results(batch_id):
+            if result.custom_id in done:
+                continue
+            rec = {"custom_id": result.custom_id, "type": result.result.type}
+            if result.result.type == "succeeded":
+                raw = result.result.message.content[0].text
+                rec["usage"] = usage_to_dict(result.result.message.usage)
+                add_usage(usage, rec["usage"])
+                questions = parse_response(raw, raise_on_error=False)
+                unique = deduplicate(questions, seen, index)
+                rec["questions"] = unique
+                rec["removed"] = len(questions) - len(unique)
+                removed += rec["removed"]
+                kept += len(unique)
+                print(f"  {result.custom_id}: {len(unique)} 問 取得")
+            else:
+                error_count += 1
+                print(f"  {result.custom_id}: ERROR ({result.result.type})", file=sys.stderr)
+            out.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            out.flush()
+            done.add(result.custom_id)
+
+    return kept, error_count, removed
+
+
+def batch_totals(batch):
+    """(完了件数, 全件数)"""
+    counts = batch.request_counts
+    done = counts.succeeded + counts.errored + counts.canceled + counts.expired
+    return done, done + counts.processing
+
+
+def print_status(job, batch):
+    done, total = batch_totals(batch)
+    errored = f" / エラー {batch.request_counts.errored} 件" if batch.request_counts.errored else ""
+    print(f"  {job['batch_id']}  {batch.processing_status:12s} {done}/{total} 件{errored}"
+          f"  （{job['count']}問・{job.get('model', '不明')}・投入 {job.get('submitted_at', '不明')[:19]}）")
+
+
+def is_retryable(e):
+    """時間をおけば直る API エラーか（接続エラー・429・5xx）"""
+    if isinstance(e, anthropic.APIConnectionError):
+        return True
+    return e.status_code == 429 or e.status_code >= 500
+
+
+def retrieve_all(client, batch_ids):
+    """ジョブの状態を取得する。戻り値: ({batch_id: batch}, [見つからない batch_id])
+
+    接続エラー・429・5xx のジョブは警告して今回の結果から外す（次のポーリングで再試行）。
+    404 のジョブは見つからないものとして返す。それ以外の 4xx（認証・権限など）は
+    再試行しても直らないので中止する。
+    """
+    batches = {}
+    missing = []
+    for batch_id in batch_ids:
+        try:
+            batches[batch_id] = client.messages.batches.retrieve(batch_id)
+        except (anthropic.APIConnectionError, anthropic.APIStatusError) as e:
+            if is_retryable(e):
+                print(f"  WARNING: {batch_id} の状態取得に失敗: {type(e).__name__} {e}", file=sys.stderr)
+            elif e.status_code == 404:
+                print(f"  WARNING: {batch_id} が見つかりません（削除済み・別のワークスペースのジョブ）"
+                      f"→ 今回の対象から外します", file=sys.stderr)
+                missing.append(batch_id)
+            else:
+                print(f"ERROR: {batch_id} の状態取得に失敗しました: {type(e).__name__} {e}", file=sys.stderr)
+                sys.exit(1)
+    return batches, missing
+
+
+def watch(client, jobs, interval=WATCH_INTERVAL, max_interval=WATCH_MAX_INTERVAL):
+    """いずれかのジョブが ended になるまでポーリングする（指数バックオフ + ジッター）
+
+    進捗があれば間隔を interval に戻し、変化がなければ max_interval まで倍々に伸ばす。
+    接続エラー・429・5xx は同じ間隔で再試行する（それ以外の 4xx は retrieve_all が中止する）。
+    戻り値: (ended になった batch_id のリスト, 見つからず外した batch_id のリスト)
+    """
+    jobs = list(jobs)
+    gone = []
+    delay = interval
+    last_done = None
+    while True:
+        batches, missing = retrieve_all(client, jobs)
+        if missing:
+            gone += missing
+            jobs = [bid for bid in jobs if bid not in missing]
+            if not jobs:
+                return [], gone
+        now = datetime.now().strftime("%H:%M:%S")
+        ended = [bid for bid, b in batches.items() if b.processing_status == "ended"]
+        done = sum(batch_totals(b)[0] for b in batches.values())
+        total = sum(batch_totals(b)[1] for b in batches.values())
+        print(f"  [{now}] 完了 {done}/{total} 件（ended {len(ended)}/{len(jobs)} ジョブ）")
+        if ended:
+            return ended, gone
+        if batches and done != last_done:
+            delay = interval
+            last_done = done
+
+        wait = delay * random.uniform(0.8, 1.2)
+        print(f"  {wait:.0f}秒後に再確認します")
+        time.sleep(wait)
+        delay = min(delay * 2, max_interval)
+
+
+@contextlib.contextmanager
+def publish_lock():
+    """取り込み〜公開の排他ロック（他のプロセスが公開中なら終わるまで待つ）"""
+    with file_lock(PUBLISH_LOCK) as locked:
+        if locked:
+            yield
+            return
+    print("\n別のプロセスが取り込み・公開中です。終わるまで待ちます（listening/.publish.lock）")
+    with file_lock(PUBLISH_LOCK, wait=True):
+        yield
+
+
+def harvest(client, batch_ids):
+    """ended のジョブから結果を取り込み、staging.json に保存して add_questions.py を実行
+
+    戻り値: 公開まで進んだか（有効な問題が無ければ False）
+    """
+    # 結果取得（ジョブごとのチェックポイントに追記しながら）
+    seen = set()
+    index = load_index()
+    usage = {}
+    kept = error_count = removed = 0
+    paths = []
+    for batch_id in batch_ids:
+        print(f"\n{batch_id} の結果を取得中...")
+        path = checkpoint_path(batch_id)
+        k, e, r = ingest_results(client, batch_id, path, seen, index, usage)
+        kept, error_count, removed = kept + k, error_count + e, removed + r
+        paths.append(path)
+
+    print_usage(usage)
 
     if error_count:
         print(f"\nWARNING: {error_count} 件のリクエストが失敗しました")
 
-    if not all_questions:
-        print("ERROR: 有効な問題を取得できませんでした", file=sys.stderr)
-        sys.exit(1)
-
-    # 重複除去
-    before = len(all_questions)
-    all_questions = deduplicate(all_questions)
-    removed = before - len(all_questions)
     if removed:
-        print(f"\n重複除去: {removed} 問を除去（{before} → {len(all_questions)} 問）")
+        print(f"\n重複除去（完全一致・類似）: {removed} 問を除去（{kept + removed} → {kept} 問）")
 
-    # staging.json に保存
-    STAGING_JSON.write_text(
-        json.dumps(all_questions, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-    )
-    print(f"\n✅ {len(all_questions)} 問を listening/staging.json に保存しました")
+    if kept:
+        # staging.json に保存（チェックポイントから1問ずつ書き出す）
+        n = write_staging(q for path in paths for q in iter_checkpoint_questions(path))
+        print(f"\n✅ {n} 問を listening/staging.json に保存しました")
+
+    # 取り込んだジョブの登録とチェックポイントを削除
+    for batch_id, path in zip(batch_ids, paths):
+        remove_job(batch_id)
+        path.unlink(missing_ok=True)
+    print(f"✅ batch_state.json から {len(batch_ids)} 件のジョブを外しました")
 
-    # batch_state.json を削除
-    BATCH_STATE.unlink()
-    print("✅ batch_state.json を削除しました")
+    if not kept:
+        print("ERROR: 有効な問題を取得できませんでした", file=sys.stderr)
+        return False
 
-    # add_questions.py を自動実行
+    # add_questions.py を自動実行（保持中の公開ロックを引き継ぐ）
     print("\nadd_questions.py を実行します...")
     result = subprocess.run(
         [sys.executable, str(REPO_ROOT / "add_questions.py")],
         cwd=str(REPO_ROOT),
+        env=held_lock_env(PUBLISH_LOCK),
     )
     if result.returncode != 0:
         print("ERROR: add_questions.py が失敗しました", file=sys.stderr)
         sys.exit(1)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch API の結果確認・取得")
+    parser.add_argument("--status", action="store_true", help="状態確認のみ（保存しない）")
+    parser.add_argument("--batch-id", action="append", default=None, metavar="ID",
+                        help="対象のジョブを限定（複数指定可。デフォルト: 登録中の全ジョブ）")
+    parser.add_argument("--watch", action="store_true",
+                        help="完了までポーリングし、完了したジョブから自動で取り込み・公開する")
+    parser.add_argument("--interval", type=float, default=WATCH_INTERVAL,
+                        help=f"--watch の初回ポーリング間隔秒（デフォルト: {WATCH_INTERVAL:g}）")
+    parser.add_argument("--max-interval", type=float, default=WATCH_MAX_INTERVAL,
+                        help=f"--watch のポーリング間隔の上限秒（デフォルト: {WATCH_MAX_INTERVAL:g}）")
+    args = parser.parse_args()
+
+    jobs = load_registry()
+    if not jobs:
+        print("未処理の Batch ジョブがありません")
+        print("先に python3 generate_questions.py --batch を実行してください")
+        sys.exit(0)
+    if args.batch_id:
+        unknown = [bid for bid in args.batch_id if bid not in jobs]
+        if unknown:
+            print(f"ERROR: 登録されていない Batch ID: {', '.join(unknown)}", file=sys.stderr)
+            sys.exit(1)
+        jobs = {bid: jobs[bid] for bid in args.batch_id}
+
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        print("ERROR: ANTHROPIC_API_KEY が設定されていません")
+        sys.exit(1)
+
+    client = anthropic.Anthropic(api_key=api_key)
+
+    # ステータス確認
+    batches, missing = retrieve_all(client, jobs)
+    print(f"Batch ジョブ: {len(jobs)} 件")
+    for batch_id, batch in batches.items():
+        print_status(jobs[batch_id], batch)
+    ended = [bid for bid, b in batches.items() if b.processing_status == "ended"]
+
+    if args.status:
+        print("\n--status モードのため保存をスキップします")
+        sys.exit(0)
+
+    if not ended and not args.watch:
+        print("\nまだ処理中です。しばらく待ってから再度実行するか、--watch で完了を待ってください。")
+        sys.exit(0)
+
+    pending = set(jobs) - set(missing)
+    while True:
+        if ended:
+            # 取り込み〜公開の間だけ1プロセスに限定する（watch 同士・手動実行との二重公開を防ぐ）。
+            # 完了待ちのポーリングはロックの外で行い、他の取り込み・公開を止めない
+            with publish_lock():
+                # ロック待ちの間に他プロセスが取り込んだジョブは除く
+                registered = load_registry()
+                harvestable = [bid for bid in ended if bid in registered]
+                if harvestable:
+                    harvest(client, harvestable)
+        pending &= set(load_registry())
+        pending -= set(ended)
+        if not args.watch or not pending:
+            break
+        print(f"\n残り {len(pending)} ジョブの完了を待機します"
+              f"（{args.interval:g}〜{args.max_interval:g}秒間隔）")
+        ended, gone = watch(client, sorted(pending), args.interval, args.max_interval)
+        pending -= set(gone)
+
+    if not args.watch and len(ended) < len(jobs):
+        print(f"\n未完了のジョブが {len(jobs) - len(ended)} 件あります。完了後に再度実行してください。")
 
 
 if __name__ == "__main__":
@@ -13,13 +13,24 @@ axis の定義:
   python3 classify_axis.py            # 全問を分類（Haiku 使用、~100円/460問）
   python3 classify_axis.py --dry-run  # 最初の30問だけ試す（本番変更なし）
   python3 classify_axis.py --model claude-sonnet-4-6  # モデル指定
+  python3 classify_axis.py --concurrency 8            # 並列モード（レート制限は自動調整）
+  python3 classify_axis.py --batch                    # Batch API に一括投入（50%オフ）
+  python3 classify_axis.py --batch-check              # 投入済みバッチの結果を取り込んで反映
+  python3 classify_axis.py --all --concurrency 8      # 付与済みも含めて全問を分類し直す
+  python3 classify_axis.py --no-prelabel              # 特徴量による事前ラベルを使わない
+
+明らかな reduction / speed の問題は axis_features.py の特徴量で事前にラベルを付け、
+API には送らない（numpy が無ければ全問 API で分類する）。
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
 import os
 import re
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
 try:
@@ -35,43 +46,139 @@ try:
 except ImportError:
     pass
 
+import audio_meta  # noqa: E402
+import axis_features  # noqa: E402
+from lib import AsyncRateLimiter, retry_wait  # noqa: E402
+from question_store import open_store  # noqa: E402
+
 REPO_ROOT = Path(__file__).parent
-QUESTIONS_JS = REPO_ROOT / "listening" / "questions.js"
-AXIS_CACHE = REPO_ROOT / "listening" / "axis_cache.json"  # 途中経過保存
+AXIS_CACHE = REPO_ROOT / "listening" / "axis_cache.jsonl"  # 途中経過保存（追記型ジャーナル）
+LEGACY_AXIS_CACHE = REPO_ROOT / "listening" / "axis_cache.json"
+AXIS_BATCH_STATE = REPO_ROOT / "listening" / "axis_batch_state.json"
 
 DEFAULT_MODEL = "claude-sonnet-4-6"
 BATCH_SIZE = 30
 VALID_AXES = {"speed", "reduction", "vocab", "context", "distractor"}
 
+# 並列モードの設定
+DEFAULT_RPM = 50        # 1分あたりのリクエスト上限
+ASYNC_RETRIES = 4       # 429 / 529 / 接続エラー時のリトライ回数
+ASYNC_BACKOFF = 2.0     # retry-after が無い場合の待機の基準秒数
+
+
+class AxisJournal:
+    """分類結果の追記型ジャーナル（キー = text の sha1、1行 = {"h", "axis"}）
+
+    保存は新しく分類した分だけを末尾に追記するので、キャッシュが大きくなっても
+    1バッチあたりの I/O は一定。同じキーの行が溜まったら（行数が件数の
+    COMPACT_RATIO 倍を超えたら）最新値だけを書き直して圧縮する。
+    """
+
+    COMPACT_RATIO = 2
+    COMPACT_MIN_LINES = 1000
+
+    def __init__(self, path=AXIS_CACHE):
+        self.path = path
+        self._axes = {}
+        self._pending = []
+        self._lines = 0
+        if not path.exists():
+            return
+        good_end = 0
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break               # 書き込み途中で落ちた行
+                rec = json.loads(line)
+                self._axes[rec["h"]] = rec["axis"]
+                self._lines += 1
+                good_end += len(line)
+        if good_end != path.stat().st_size:
+            with open(path, "r+b") as f:
+                f.truncate(good_end)
+
+    @staticmethod
+    def key(text):
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def __contains__(self, text):
+        return self.key(text) in self._axes
+
+    def __getitem__(self, text):
+        return self._axes[self.key(text)]
+
+    def __setitem__(self, text, axis):
+        h = self.key(text)
+        if self._axes.get(h) != axis:
+            self._axes[h] = axis
+            self._pending.append(h)
+
+    def __len__(self):
+        return len(self._axes)
+
+    def get(self, text, default=None):
+        return self._axes.get(self.key(text), default)
+
+    def values(self):
+        return self._axes.values()
+
+    def flush(self):
+        """未保存の分類結果を追記（必要なら圧縮）"""
+        if not self._pending:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            for h in dict.fromkeys(self._pending):
+                f.write(json.dumps({"h": h, "axis": self._axes[h]}) + "\n")
+                self._lines += 1
+        self._pending = []
+        if self._lines > max(self.COMPACT_MIN_LINES, len(self._axes) * self.COMPACT_RATIO):
+            self.compact()
+
+    def compact(self):
+        """最新値だけのジャーナルに書き直す"""
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for h, axis in self._axes.items():
+                f.write(json.dumps({"h": h, "axis": axis}) + "\n")
+        os.replace(tmp, self.path)
+        self._lines = len(self._axes)
 
-def load_questions_raw():
-    """questions.js から各行を読み込む（1行 = 1問）"""
-    content = QUESTIONS_JS.read_text(encoding="utf-8")
-    lines = content.split("\n")
-    return lines
 
+def load_cache():
+    """分類結果のジャーナルを読み込む（旧形式の axis_cache.json は取り込んで置き換える）"""
+    cache = AxisJournal()
+    if LEGACY_AXIS_CACHE.exists():
+        legacy = json.loads(LEGACY_AXIS_CACHE.read_text(encoding="utf-8"))
+        for text, axis in legacy.items():
+            cache[text] = axis
+        cache.flush()
+        LEGACY_AXIS_CACHE.unlink()
+        print(f"axis_cache.json（{len(legacy)}件）を axis_cache.jsonl に移行しました")
+    return cache
 
-def parse_question_from_line(line):
-    """1行から text, diff を抽出して返す"""
-    text_m = re.search(r'\btext:\s*"((?:[^"\\]|\\.)*)"', line)
-    diff_m = re.search(r'\bdiff:\s*"(lv[1-5])"', line)
-    if not text_m or not diff_m:
-        return None
-    return {
-        "text": text_m.group(1).replace('\\"', '"').replace("\\\\", "\\"),
-        "diff": diff_m.group(1),
-    }
 
+def save_cache(cache):
+    cache.flush()
 
-def load_cache():
-    """axis_cache.json から既存の分類結果を読み込む"""
-    if AXIS_CACHE.exists():
-        return json.loads(AXIS_CACHE.read_text(encoding="utf-8"))
-    return {}
 
+def apply_prelabels(todo, cache, durations=None):
+    """特徴量で明らかな reduction / speed の問題はその場で分類する
 
-def save_cache(cache):
-    AXIS_CACHE.write_text(json.dumps(cache, ensure_ascii=False, indent=2), encoding="utf-8")
+    戻り値: (API に送る問題, {text: axis}（事前ラベルを付けた分）)
+    """
+    if axis_features.np is None:
+        print("（numpy が無いため事前ラベルを省略します）")
+        return todo, {}
+    labels = axis_features.prelabel_questions(todo, durations)
+    if not labels:
+        return todo, {}
+    for text, axis in labels.items():
+        cache[text] = axis
+    save_cache(cache)
+    counts = {axis: sum(1 for a in labels.values() if a == axis) for axis in sorted(set(labels.values()))}
+    detail = "、".join(f"{axis} {n}問" for axis, n in counts.items())
+    print(f"事前ラベル: {len(labels)}問を API なしで分類（{detail}）")
+    return [q for q in todo if q["text"] not in labels], labels
 
 
 def build_classify_prompt(questions):
@@ -108,6 +215,19 @@ def build_classify_prompt(questions):
 """
 
 
+def parse_classify_response(raw):
+    """分類レスポンス（JSON 配列）を {id: axis} に変換"""
+    raw = raw.strip()
+    raw = re.sub(r'^```[a-z]*\n?', '', raw)
+    raw = re.sub(r'\n?```$', '', raw.strip())
+
+    results = json.loads(raw)
+    axis_map = {}
+    for item in results:
+        axis_map[item["id"]] = item["axis"]
+    return axis_map
+
+
 def classify_batch(client, model, questions):
     """1バッチを分類してaxisのリストを返す"""
     prompt = build_classify_prompt(questions)
@@ -116,52 +236,182 @@ def classify_batch(client, model, questions):
         max_tokens=1024,
         messages=[{"role": "user", "content": prompt}],
     )
-    raw = response.content[0].text.strip()
-    raw = re.sub(r'^```[a-z]*\n?', '', raw)
-    raw = re.sub(r'\n?```$', '', raw.strip())
+    return parse_classify_response(response.content[0].text)
+
+
+def apply_axis_map(batch, axis_map, cache):
+    """分類結果をキャッシュに反映（無効な axis は vocab にフォールバック）"""
+    for idx, q in enumerate(batch):
+        axis = axis_map.get(idx + 1)
+        if axis in VALID_AXES:
+            cache[q["text"]] = axis
+        else:
+            print(f"\n  WARNING: 無効なaxis '{axis}' → vocab にフォールバック")
+            cache[q["text"]] = "vocab"
+
+
+def chunked(todo):
+    return [todo[i:i + BATCH_SIZE] for i in range(0, len(todo), BATCH_SIZE)]
+
+
+def classify_sequential(client, model, todo, cache):
+    """1バッチずつ順番に分類（従来の動作）"""
+    batches = chunked(todo)
+    for batch_i, batch in enumerate(batches):
+        print(f"バッチ {batch_i+1}/{len(batches)}（{len(batch)}問）...", end=" ", flush=True)
+
+        try:
+            axis_map = classify_batch(client, model, batch)
+            apply_axis_map(batch, axis_map, cache)
+            save_cache(cache)
+            print(f"OK（キャッシュ保存済み）")
+        except Exception as e:
+            print(f"\nERROR: {e}")
+            print("  途中まで axis_cache.jsonl に保存済み。再実行すると続きから処理されます")
+            break
 
-    results = json.loads(raw)
-    axis_map = {}
-    for item in results:
-        axis_map[item["id"]] = item["axis"]
-    return axis_map
 
+async def _classify_batch_async(client, limiter, model, batch):
+    """1バッチを分類（レート制限・リトライ付き）"""
+    prompt = build_classify_prompt(batch)
+    for attempt in range(ASYNC_RETRIES + 1):
+        await limiter.acquire()
+        try:
+            response = await client.messages.create(
+                model=model,
+                max_tokens=1024,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            return parse_classify_response(response.content[0].text)
+        except Exception as e:
+            wait = retry_wait(e, limiter, attempt, ASYNC_BACKOFF)
+            if wait is None or attempt == ASYNC_RETRIES:
+                raise
+            print(f"  RETRY: {type(e).__name__} → {wait:.1f}秒待機 ({attempt + 1}/{ASYNC_RETRIES})")
+            limiter.pause(wait)
+
+
+async def classify_async(api_key, model, todo, cache, concurrency, rpm=DEFAULT_RPM):
+    """並列モード: 最大 concurrency バッチを同時に分類（戻り値: 失敗したバッチ数）"""
+    # リトライは limiter と協調させたいので SDK 側の自動リトライは無効化
+    client = anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
+    limiter = AsyncRateLimiter(rpm, burst=concurrency)
+    sem = asyncio.Semaphore(concurrency)
+    batches = chunked(todo)
+    failed = 0
+    done = 0
+
+    async def one(batch_i, batch):
+        nonlocal failed, done
+        async with sem:
+            try:
+                axis_map = await _classify_batch_async(client, limiter, model, batch)
+            except Exception as e:
+                failed += 1
+                print(f"  バッチ {batch_i+1}/{len(batches)} ERROR: {type(e).__name__} {e}",
+                      file=sys.stderr)
+                return
+        apply_axis_map(batch, axis_map, cache)
+        save_cache(cache)
+        done += 1
+        print(f"  バッチ {batch_i+1}/{len(batches)}（{len(batch)}問）OK"
+              f"（完了 {done}/{len(batches)}）")
+
+    await asyncio.gather(*(one(i, b) for i, b in enumerate(batches)))
+    await client.close()
+    if failed:
+        print(f"\nWARNING: {failed}/{len(batches)} バッチが失敗しました。"
+              "再実行すると未分類の問題だけ処理されます")
+    return failed
+
+
+def submit_batch(client, model, todo, reclassify_all=False):
+    """Batch モード: 全バッチの分類プロンプトを一括投入（結果は --batch-check で取得）"""
+    if AXIS_BATCH_STATE.exists():
+        state = json.loads(AXIS_BATCH_STATE.read_text(encoding="utf-8"))
+        print(f"ERROR: 未処理の分類バッチが存在します (ID: {state['batch_id']})")
+        print("  先に python3 classify_axis.py --batch-check を実行してください")
+        sys.exit(1)
 
-def inject_axis_into_js(lines, text_to_axis):
-    """questions.js の各行に axis フィールドを注入"""
-    new_lines = []
-    injected = 0
-    skipped = 0
-    for line in lines:
-        if 'axis:' in line:
-            new_lines.append(line)
-            skipped += 1
+    batches = chunked(todo)
+    requests = [
+        {
+            "custom_id": f"axis-{i}",
+            "params": {
+                "model": model,
+                "max_tokens": 1024,
+                "messages": [{"role": "user", "content": build_classify_prompt(batch)}],
+            },
+        }
+        for i, batch in enumerate(batches)
+    ]
+    print(f"\nBatch API に分類ジョブ投入中... ({len(requests)} リクエスト)")
+    batch_job = client.messages.batches.create(requests=requests)
+
+    state = {
+        "batch_id": batch_job.id,
+        "model": model,
+        "all": reclassify_all,
+        "submitted_at": datetime.now(timezone.utc).isoformat(),
+        "requests": {
+            r["custom_id"]: [q["text"] for q in batch]
+            for r, batch in zip(requests, batches)
+        },
+    }
+    AXIS_BATCH_STATE.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"✅ Batch 投入完了（ID: {batch_job.id}、{len(todo)}問）")
+    print("  完了後に python3 classify_axis.py --batch-check を実行してください")
+
+
+def harvest_batch(client, cache):
+    """分類バッチの結果を axis_cache.jsonl に取り込む
+
+    戻り値: 取り込んだ state（未完了なら None）
+    """
+    state = json.loads(AXIS_BATCH_STATE.read_text(encoding="utf-8"))
+    batch_job = client.messages.batches.retrieve(state["batch_id"])
+    print(f"分類バッチ {state['batch_id']}: {batch_job.processing_status}")
+    if batch_job.processing_status != "ended":
+        print("まだ処理中です。しばらく待ってから再度実行してください。")
+        return None
+
+    errors = 0
+    for result in client.messages.batches.results(state["batch_id"]):
+        texts = state["requests"].get(result.custom_id)
+        if texts is None:
             continue
-        text_m = re.search(r'\btext:\s*"((?:[^"\\]|\\.)*)"', line)
-        if not text_m:
-            new_lines.append(line)
+        batch = [{"text": t} for t in texts]
+        try:
+            if result.result.type != "succeeded":
+                raise ValueError(result.result.type)
+            axis_map = parse_classify_response(result.result.message.content[0].text)
+        except Exception as e:
+            errors += 1
+            print(f"  {result.custom_id}: ERROR {type(e).__name__} {e}", file=sys.stderr)
             continue
-        text = text_m.group(1).replace('\\"', '"').replace("\\\\", "\\")
-        if text in text_to_axis:
-            axis = text_to_axis[text]
-            # diff: "lv3", の直後に axis: "xxx", を挿入
-            new_line = re.sub(
-                r'(\bdiff:\s*"lv[1-5]")',
-                rf'\1, axis: "{axis}"',
-                line,
-                count=1,
-            )
-            new_lines.append(new_line)
-            injected += 1
-        else:
-            new_lines.append(line)
-    return new_lines, injected, skipped
+        apply_axis_map(batch, axis_map, cache)
+    save_cache(cache)
+    AXIS_BATCH_STATE.unlink()
+    if errors:
+        print(f"WARNING: {errors} リクエストが失敗しました。再実行すると未分類の問題だけ処理されます")
+    return state
 
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--model", default=DEFAULT_MODEL)
     parser.add_argument("--dry-run", action="store_true", help="最初のバッチのみ実行・ファイル非更新")
+    parser.add_argument("--all", action="store_true",
+                        help="axis 付与済み・キャッシュ済みの問題も含めて全問を分類し直す")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="同時に分類するバッチ数（2以上で並列モード、デフォルト: 1）")
+    parser.add_argument("--rpm", type=int, default=DEFAULT_RPM,
+                        help=f"並列モードの1分あたりリクエスト上限（デフォルト: {DEFAULT_RPM}）")
+    parser.add_argument("--batch", action="store_true", help="Batch API に一括投入（50%%オフ）")
+    parser.add_argument("--batch-check", action="store_true",
+                        help="投入済みの分類バッチの結果を取り込んで反映")
+    parser.add_argument("--no-prelabel", action="store_true",
+                        help="特徴量による事前ラベルを使わず、全問を API で分類する")
     args = parser.parse_args()
 
     api_key = os.environ.get("ANTHROPIC_API_KEY")
@@ -170,50 +420,59 @@ def main():
         sys.exit(1)
 
     client = anthropic.Anthropic(api_key=api_key)
-    lines = load_questions_raw()
+    store = open_store()
     cache = load_cache()
 
-    # axis 未付与の問題を収集
-    todo = []
-    for line in lines:
-        if 'axis:' in line:
-            continue
-        q = parse_question_from_line(line)
-        if q and q["text"] not in cache:
-            todo.append(q)
-
-    print(f"分類対象: {len(todo)}問（キャッシュ済み: {len(cache)}問）")
-
-    if args.dry_run:
-        todo = todo[:BATCH_SIZE]
-        print(f"--dry-run: 最初の {len(todo)} 問のみ処理します")
-
-    # バッチ処理
-    total_batches = (len(todo) + BATCH_SIZE - 1) // BATCH_SIZE
-    for batch_i in range(total_batches):
-        batch = todo[batch_i * BATCH_SIZE:(batch_i + 1) * BATCH_SIZE]
-        print(f"バッチ {batch_i+1}/{total_batches}（{len(batch)}問）...", end=" ", flush=True)
-
-        try:
-            axis_map = classify_batch(client, args.model, batch)
-            for idx, q in enumerate(batch):
-                axis = axis_map.get(idx + 1)
-                if axis in VALID_AXES:
-                    cache[q["text"]] = axis
-                else:
-                    print(f"\n  WARNING: 無効なaxis '{axis}' → vocab にフォールバック")
-                    cache[q["text"]] = "vocab"
-            save_cache(cache)
-            print(f"OK（キャッシュ保存済み）")
-        except Exception as e:
-            print(f"\nERROR: {e}")
-            print("  途中まで axis_cache.json に保存済み。再実行すると続きから処理されます")
-            break
+    missing = store.missing_axis()
+    reclassify_all = args.all
+
+    if args.batch_check:
+        if not AXIS_BATCH_STATE.exists():
+            print("未処理の分類バッチがありません")
+            sys.exit(0)
+        state = harvest_batch(client, cache)
+        if state is None:
+            sys.exit(0)
+        reclassify_all = state.get("all", False)
+        todo = [{"text": t} for texts in state["requests"].values() for t in texts]
+    else:
+        if reclassify_all:
+            todo = list(store.iter_questions())
+        else:
+            # axis 未付与の問題を収集（ストアのインデックス付きクエリ）
+            todo = [q for q in missing if q["text"] not in cache]
+
+        print(f"分類対象: {len(todo)}問（キャッシュ済み: {len(cache)}問）")
+
+        todo_api, prelabels = todo, {}
+        if args.dry_run:
+            todo = todo_api = todo[:BATCH_SIZE]
+            print(f"--dry-run: 最初の {len(todo)} 問のみ処理します")
+        elif not args.no_prelabel:
+            # 索引に無い音声は speed の判定に使えないので、先に変わったファイルだけ読み直す
+            audio_meta.update_index(store)
+            todo_api, prelabels = apply_prelabels(todo, cache, store.audio_durations())
+
+        if args.batch:
+            if not args.dry_run and todo_api:
+                submit_batch(client, args.model, todo_api, reclassify_all)
+            # 事前ラベル分はバッチの完了を待たずに反映する
+            if prelabels and store.set_axis(prelabels, only_missing=not reclassify_all):
+                store.emit_js()
+            return
+        if args.concurrency > 1:
+            asyncio.run(classify_async(api_key, args.model, todo_api, cache, args.concurrency, args.rpm))
+        else:
+            classify_sequential(client, args.model, todo_api, cache)
 
-    # questions.js に反映
+    # questions.js に反映（--all のときは今回分類した問題だけ上書き）
     if not args.dry_run:
-        lines_updated, injected, skipped = inject_axis_into_js(lines, cache)
-        QUESTIONS_JS.write_text("\n".join(lines_updated), encoding="utf-8")
+        targets = {q["text"]: cache[q["text"]]
+                   for q in (todo if reclassify_all else missing) if q["text"] in cache}
+        injected = store.set_axis(targets, only_missing=not reclassify_all)
+        if injected:
+            store.emit_js()
+        skipped = 0 if reclassify_all else store.count() - len(missing)
         print(f"\n✅ questions.js 更新完了: {injected}問にaxis付与（既存スキップ: {skipped}問）")
     else:
         print(f"\n[dry-run] questions.js は変更しませんでした")
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+daily_sets.py - 日付ごとの「今日の問題セット」を先に作っておく
+
+登録ユーザーは1日15問までなのに、クイズは出題のために全問題（シャード）を取得して
+絞り込んでいる。ここでは今日から N 日分のセットを前もって決め、1日1ファイルの小さな
+JSON に書き出す。クイズは索引で今日のファイルを調べ、その1ファイルだけを取得して出題する。
+
+  listening/daily/2026-10-18.json   # その日の問題の配列（シャードと同じフィールド）
+  listening/daily/index.json        # クライアント用の索引（今日以降の分だけ）
+      {"version": 1, "per_day": 15, "window": 30,
+       "days": {"2026-10-18": {"file": "daily/2026-10-18.json", "count", "bytes", "hash"}}}
+
+選び方:
+  - 日付（UTC。クイズの getToday と同じ）から決まる順序で選ぶので、何度作り直しても同じ結果になる
+  - diff ごとに同じ数ずつ（割り切れない分は日ごとに順番に）、その中で axis が偏らないように選ぶ
+  - 直近 window 日のセットに出た問題は選ばない（足りないときは最後に出た日が古い問題から）
+
+公開済みの今日までのセットは書き換えず（--rebuild を除く）、明日以降の分だけを
+今の問題で作り直す（内容が変わったファイルだけ書き換える）。window より古いファイルは削除する。
+add_questions.py の問題追加のたびと、毎週の GitHub Actions（.github/workflows/daily-sets.yml）で
+呼ばれるので、問題の追加が止まっても先の分が切れない。日数などの設定はストアの meta
+（daily_days / daily_per_day / daily_window）に保存する（Actions にはストアが無いのでデフォルト値になる）。
+
+それでも索引に今日の日付が無いとき、クイズは索引にある日のセットを日付の通し番号
+（1970-01-01 からの日数）を日数で割った余りで選んで使う（同じ日なら全員が同じセット）。
+索引が取れなければ通常のレベル別の出題になる。
+
+Usage:
+  python3 daily_sets.py                 # 今日から N 日分のセットを作る（デフォルト 21 日）
+  python3 daily_sets.py --days 30       # 作る日数を変える（設定を保存）
+  python3 daily_sets.py --per-day 15 --window 30   # 1日の問題数・重複させない日数（設定を保存）
+  python3 daily_sets.py --rebuild       # 今日の分も含めて作り直す
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from question_shards import serialize, to_record
+
+REPO_ROOT = Path(__file__).parent
+LISTENING_DIR = REPO_ROOT / "listening"
+DAILY_DIR = LISTENING_DIR / "daily"
+DAILY_INDEX = DAILY_DIR / "index.json"
+
+INDEX_VERSION = 1
+DEFAULTS = {"days": 21, "per_day": 15, "window": 30}   # days は週1回の自動生成（daily-sets.yml）の間隔より十分長く
+
+
+def today_utc():
+    return datetime.now(timezone.utc).date()
+
+
+def _rank(day, key):
+    """日付ごとに決まる並び順（同じ日・同じ問題なら常に同じ値）"""
+    return hashlib.sha1(f"{day.isoformat()}:{key}".encode("utf-8")).hexdigest()
+
+
+def settings(store):
+    return {k: int(store.get_meta(f"daily_{k}", v)) for k, v in DEFAULTS.items()}
+
+
+def select_day(day, questions, last_used, per_day, window):
+    """day のセットを選ぶ。戻り値: 問題のリスト（diff 順）
+
+    questions: 問題のリスト（audio で識別する）
+    last_used: {audio: 最後にセットに出た日付}。選んだ問題はここに記録する
+    """
+    by_diff = defaultdict(list)
+    for q in questions:
+        by_diff[q["diff"]].append(q)
+    diffs = sorted(by_diff)
+    if not diffs:
+        return []
+
+    # diff ごとの問題数（余りは日ごとに別の diff から順に割り当てる）
+    base, extra = divmod(per_day, len(diffs))
+    offset = day.toordinal() % len(diffs)
+    quota = {d: base + (1 if (i - offset) % len(diffs) < extra else 0) for i, d in enumerate(diffs)}
+
+    cutoff = day - timedelta(days=window)
+    picked = []
+    axis_count = Counter()
+    for d in diffs:
+        fresh = defaultdict(list)     # axis → 直近 window 日に出ていない問題
+        stale = []
+        for q in by_diff[d]:
+            used = last_used.get(q["audio"])
+            if used is None or used <= cutoff:
+                fresh[q.get("axis")].append(q)
+            elif used < day:
+                stale.append(q)
+        for pool in fresh.values():
+            pool.sort(key=lambda q: _rank(day, q["audio"]))
+        # 新しい問題が足りなければ、最後に出た日が古い順に使う
+        stale.sort(key=lambda q: (last_used[q["audio"]], _rank(day, q["audio"])))
+
+        for _ in range(quota[d]):
+            axes = [a for a, pool in fresh.items() if pool]
+            if axes:
+                # セット全体でまだ少ない axis から（同数なら日付で決まる順）
+                axis = min(axes, key=lambda a: (axis_count[a], _rank(day, a)))
+                q = fresh[axis].pop(0)
+            elif stale:
+                q = stale.pop(0)
+            else:
+                break
+            axis_count[q.get("axis")] += 1
+            picked.append(q)
+
+    for q in picked:
+        last_used[q["audio"]] = day
+    return picked
+
+
+def _read_day(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def build(store, days=None, per_day=None, window=None, rebuild=False, start=None):
+    """start（デフォルトは今日）から days 日分のセットを書き出す
+
+    戻り値: (索引, 書き換えた日付のリスト)
+    """
+    conf = settings(store)
+    days = conf["days"] if days is None else days
+    per_day = conf["per_day"] if per_day is None else per_day
+    window = conf["window"] if window is None else window
+    start = start or today_utc()
+    end = start + timedelta(days=days)
+
+    durations = store.emit_durations()
+    questions = []
+    for q in store.iter_questions():
+        if q.get("audio") in durations:
+            q["dur"] = round(durations[q["audio"]], 2)
+        questions.append(to_record(q))
+
+    DAILY_DIR.mkdir(parents=True, exist_ok=True)
+    existing = {}
+    for path in DAILY_DIR.glob("*.json"):
+        if path == DAILY_INDEX:
+            continue
+        try:
+            existing[date.fromisoformat(path.stem)] = path
+        except ValueError:
+            continue
+
+    # 公開済みのセット（今日まで。--rebuild なら昨日まで）を履歴として読む
+    keep_until = start - timedelta(days=1) if rebuild else start
+    last_used = {}
+    for day in sorted(existing):
+        if day <= keep_until:
+            for q in _read_day(existing[day]):
+                last_used[q["audio"]] = day
+
+    index = {"version": INDEX_VERSION, "per_day": per_day, "window": window, "days": {}}
+    written = []
+    day = start
+    while day < end:
+        path = DAILY_DIR / f"{day.isoformat()}.json"
+        if day <= keep_until and day in existing:
+            data = path.read_bytes()
+        else:
+            data = serialize(select_day(day, questions, last_used, per_day, window))
+            if not (path.exists() and path.read_bytes() == data):
+                tmp = path.with_name(path.name + ".tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+                written.append(day.isoformat())
+        index["days"][day.isoformat()] = {
+            "file": f"daily/{path.name}", "count": len(json.loads(data)), "bytes": len(data),
+            "hash": hashlib.sha1(data).hexdigest()[:10],
+        }
+        day += timedelta(days=1)
+
+    # window より古い日と、今回の範囲より先の日（--days を減らしたとき）のファイルを削除
+    for old, path in existing.items():
+        if old < start - timedelta(days=window) or old >= end:
+            path.unlink()
+
+    tmp = DAILY_INDEX.with_name(DAILY_INDEX.name + ".tmp")
+    tmp.write_text(json.dumps(index, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+    os.replace(tmp, DAILY_INDEX)
+    return index, written
+
+
+def print_index(index, written):
+    days = index["days"]
+    if not days:
+        print("今日の問題セット: 0 日分")
+        return
+    sizes = [d["bytes"] for d in days.values()]
+    print(f"今日の問題セット: {len(days)} 日分（1日 {index['per_day']} 問・{index['window']} 日間は重複なし、"
+          f"書き換え {len(written)} 日）")
+    print(f"  {min(days)} 〜 {max(days)}  1日あたり {min(sizes) / 1024:.1f}〜{max(sizes) / 1024:.1f} KB")
+    for entry in days.values():
+        if entry["count"] < index["per_day"]:
+            print(f"  WARNING: {entry['file']} は {entry['count']} 問しかありません", file=sys.stderr)
+    print(f"索引: {DAILY_INDEX.relative_to(REPO_ROOT)}（{DAILY_INDEX.stat().st_size / 1024:.1f} KB）")
+
+
+def main():
+    from question_store import open_store
+
+    parser = argparse.ArgumentParser(description="日付ごとの「今日の問題セット」を先に作っておく")
+    parser.add_argument("--days", type=int, help=f"今日から何日分作るか（設定を保存。デフォルト: {DEFAULTS['days']}）")
+    parser.add_argument("--per-day", type=int, help=f"1日の問題数（設定を保存。デフォルト: {DEFAULTS['per_day']}）")
+    parser.add_argument("--window", type=int,
+                        help=f"同じ問題を出さない日数（設定を保存。デフォルト: {DEFAULTS['window']}）")
+    parser.add_argument("--rebuild", action="store_true", help="今日の分も含めて作り直す")
+    args = parser.parse_args()
+
+    for name in ("days", "per_day", "window"):
+        value = getattr(args, name)
+        if value is not None and value < 1:
+            print(f"ERROR: --{name.replace('_', '-')} は 1 以上を指定してください", file=sys.stderr)
+            sys.exit(1)
+
+    with open_store() as store:
+        changed = {k: getattr(args, k) for k in DEFAULTS if getattr(args, k) is not None}
+        if changed:
+            with store.conn:
+                for k, v in changed.items():
+                    store.set_meta(f"daily_{k}", v)
+        started = time.perf_counter()
+        index, written = build(store, rebuild=args.rebuild)
+        elapsed = time.perf_counter() - started
+    print_index(index, written)
+    print(f"（{elapsed:.2f}秒）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+dedup_index.py - 問題文の類似重複検出インデックス（MinHash + LSH）
+
+questions.js の全 text を文字 n-gram の MinHash シグネチャにし、LSH のバケットで
+候補だけを引いて類似度を推定する。完全一致ではなく言い換え・語順の入れ替え程度の
+重複も拾え、問題数が数万になっても1件あたりの照会はほぼ一定時間で済む。
+
+  listening/dedup_index.json  # シグネチャの永続化（ローカル専用・再構築可能）
+
+generate_questions.py / check_batch.py / add_questions.py が生成・取り込み時に参照し、
+add_questions.py が公開時に新問題を追加登録する。
+
+Usage:
+  python3 dedup_index.py                     # インデックスを最新化して統計表示
+  python3 dedup_index.py --rebuild           # 作り直し
+  python3 dedup_index.py --query "Can you turn that down a little?"
+  python3 dedup_index.py --report            # 既存問題どうしの類似ペアを列挙
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+from pathlib import Path
+
+from question_store import open_store
+
+REPO_ROOT = Path(__file__).parent
+QUESTIONS_JS = REPO_ROOT / "listening" / "questions.js"
+INDEX_PATH = REPO_ROOT / "listening" / "dedup_index.json"
+
+INDEX_VERSION = 1
+NUM_PERM = 64          # MinHash の関数数
+BANDS = 16             # LSH のバンド数（NUM_PERM = BANDS × ROWS）
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 4       # 文字 n-gram の n
+DUP_THRESHOLD = 0.6    # 推定 Jaccard 類似度がこれ以上なら重複とみなす
+
+# shake_256 の出力を NUM_PERM 個の 32bit 値として読み、各位置の最小値を取る。
+# 1 shingle あたりハッシュ計算1回で NUM_PERM 個の独立なハッシュが得られる。
+_unpack_hashes = struct.Struct(f"<{NUM_PERM}I").unpack
+
+
+def normalize_text(text):
+    """小文字化・記号除去・空白正規化（アポストロフィは縮約形のため残す）"""
+    text = text.lower().replace("’", "'")
+    return " ".join(re.findall(r"[a-z0-9']+", text))
+
+
+def shingles(text):
+    norm = normalize_text(text)
+    if len(norm) <= SHINGLE_SIZE:
+        return {norm}
+    return {norm[i:i + SHINGLE_SIZE] for i in range(len(norm) - SHINGLE_SIZE + 1)}
+
+
+def minhash(text):
+    """テキストの MinHash シグネチャ（NUM_PERM 個の int）"""
+    rows = [
+        _unpack_hashes(hashlib.shake_256(s.encode("utf-8")).digest(NUM_PERM * 4))
+        for s in shingles(text)
+    ]
+    return [min(col) for col in zip(*rows)]
+
+
+def similarity(sig_a, sig_b):
+    """シグネチャの一致率 = Jaccard 類似度の推定値"""
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+
+def _band_keys(sig):
+    return [(b, tuple(sig[b * ROWS:(b + 1) * ROWS])) for b in range(BANDS)]
+
+
+def load_bank_texts():
+    """問題ストアから全問題の text を取得（ID 順）"""
+    if not QUESTIONS_JS.exists():
+        return []
+    with open_store() as store:
+        return store.texts()
+
+
+class NearDupIndex:
+    """MinHash シグネチャ + LSH バケット"""
+
+    def __init__(self):
+        self.texts = []
+        self.signatures = []
+        self._norms = {}      # 正規化テキスト → id（完全一致の高速判定用）
+        self._buckets = {}    # (band, rows) → [id, ...]
+        self.source = None    # 取り込んだ questions.js の (size, mtime_ns)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def add(self, text, sig=None):
+        sig = sig or minhash(text)
+        idx = len(self.texts)
+        self.texts.append(text)
+        self.signatures.append(sig)
+        self._norms.setdefault(normalize_text(text), idx)
+        for key in _band_keys(sig):
+            self._buckets.setdefault(key, []).append(idx)
+        return idx
+
+    def query(self, text, threshold=DUP_THRESHOLD, sig=None):
+        """類似度 threshold 以上の既存テキストを [(類似度, text), ...] で返す（降順）"""
+        exact = self._norms.get(normalize_text(text))
+        if exact is not None:
+            return [(1.0, self.texts[exact])]
+        sig = sig or minhash(text)
+        candidates = set()
+        for key in _band_keys(sig):
+            candidates.update(self._buckets.get(key, ()))
+        hits = []
+        for idx in candidates:
+            sim = similarity(sig, self.signatures[idx])
+            if sim >= threshold:
+                hits.append((sim, self.texts[idx]))
+        hits.sort(reverse=True)
+        return hits
+
+    def find_duplicate(self, text, threshold=DUP_THRESHOLD):
+        """最も近い重複 (類似度, text) を返す（無ければ None）"""
+        hits = self.query(text, threshold)
+        return hits[0] if hits else None
+
+    def sync(self, texts):
+        """未登録のテキストだけを追加（戻り値: 追加件数）"""
+        added = 0
+        known = set(self.texts)
+        for t in texts:
+            if t not in known:
+                self.add(t)
+                known.add(t)
+                added += 1
+        return added
+
+    def save(self, path=INDEX_PATH):
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps({
+            "version": INDEX_VERSION,
+            "num_perm": NUM_PERM,
+            "shingle": SHINGLE_SIZE,
+            "source": self.source,
+            "texts": self.texts,
+            "signatures": self.signatures,
+        }, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def from_file(cls, path=INDEX_PATH):
+        """保存済みインデックスを読み込む（形式が違う・壊れている場合は None）"""
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if (data.get("version") != INDEX_VERSION or data.get("num_perm") != NUM_PERM
+                or data.get("shingle") != SHINGLE_SIZE):
+            return None
+        index = cls()
+        for text, sig in zip(data["texts"], data["signatures"]):
+            index.add(text, sig)
+        index.source = data.get("source")
+        return index
+
+
+def _source_stamp():
+    st = QUESTIONS_JS.stat()
+    return [st.st_size, st.st_mtime_ns]
+
+
+def load_index(rebuild=False, save=True):
+    """インデックスを読み込み、questions.js が更新されていれば差分だけ追加する"""
+    index = None if rebuild else NearDupIndex.from_file()
+    if index is None:
+        index = NearDupIndex()
+    if not QUESTIONS_JS.exists():
+        return index
+    stamp = _source_stamp()
+    if index.source != stamp:
+        added = index.sync(load_bank_texts())
+        index.source = stamp
+        if save:
+            index.save()
+        if added:
+            print(f"類似重複インデックス: {added} 問を追加登録（計 {len(index)} 問）")
+    return index
+
+
+def register_published(texts, index=None):
+    """公開した問題をインデックスに追加して保存（add_questions.py から呼ぶ）"""
+    if index is None:
+        index = NearDupIndex.from_file() or NearDupIndex()
+    index.sync(texts)
+    if QUESTIONS_JS.exists():
+        index.source = _source_stamp()
+    index.save()
+    return index
+
+
+def filter_near_duplicates(questions, index, threshold=DUP_THRESHOLD):
+    """既存バンク＋同じリスト内で類似重複する問題を除外
+
+    通過した問題はメモリ上の index に追加される（保存はしない）。
+    戻り値: (通過した問題, [(除外した問題, 類似度, 似ている既存 text), ...])
+    """
+    kept = []
+    rejected = []
+    for q in questions:
+        hit = index.find_duplicate(q["text"], threshold)
+        if hit:
+            rejected.append((q, hit[0], hit[1]))
+            continue
+        index.add(q["text"])
+        kept.append(q)
+    return kept, rejected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="類似重複検出インデックスの更新・照会")
+    parser.add_argument("--rebuild", action="store_true", help="インデックスを作り直す")
+    parser.add_argument("--query", default=None, help="指定した英文に似た既存問題を表示")
+    parser.add_argument("--threshold", type=float, default=DUP_THRESHOLD,
+                        help=f"重複とみなす類似度（デフォルト: {DUP_THRESHOLD}）")
+    parser.add_argument("--report", action="store_true", help="既存問題どうしの類似ペアを列挙")
+    args = parser.parse_args()
+
+    if not QUESTIONS_JS.exists():
+        print(f"ERROR: {QUESTIONS_JS} が見つかりません", file=sys.stderr)
+        sys.exit(1)
+
+    index = load_index(rebuild=args.rebuild)
+    print(f"インデックス: {len(index)} 問（{NUM_PERM} perm / {BANDS} bands）")
+
+    if args.query:
+        hits = index.query(args.query, args.threshold)
+        if not hits:
+            print("類似する既存問題はありません")
+        for sim, text in hits[:10]:
+            print(f"  {sim:.2f}  {text}")
+
+    if args.report:
+        pairs = 0
+        for idx, (text, sig) in enumerate(zip(index.texts, index.signatures)):
+            candidates = set()
+            for key in _band_keys(sig):
+                candidates.update(index._buckets.get(key, ()))
+            for other in sorted(c for c in candidates if c > idx):
+                sim = similarity(sig, index.signatures[other])
+                if sim >= args.threshold:
+                    pairs += 1
+                    print(f"  {sim:.2f}  {text}\n        {index.texts[other]}")
+        print(f"類似ペア: {pairs} 組（類似度 {args.threshold} 以上）")
+
+
+if __name__ == "__main__":
+    main()
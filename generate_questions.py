@@ -6,22 +6,28 @@ generate_questions.py - Claude API で問題を自動生成 → staging.json に
   python3 generate_questions.py --count 100
   python3 generate_questions.py --count 100 --model claude-sonnet-4-6
 
+並列モード（バッチを同時にリクエスト・レート制限は自動調整）:
+  python3 generate_questions.py --count 300 --concurrency 5
+  python3 generate_questions.py --count 300 --concurrency 5 --rpm 30
+
 axis 指定モード（特定の axis だけ集中生成）:
   python3 generate_questions.py --count 100 --axis-only speed,reduction
   python3 generate_questions.py --count 50 --axis-only speed
 
-Batch モード（24時間以内・50%オフ）:
+除外リストの形式（デフォルト: digest = 場面別ダイジェストで全問題をカバー）:
+  python3 generate_questions.py --count 100 --exclude full   # 英文リストを直近3000問まで列挙
+
+Batch モード（24時間以内・50%オフ。未取り込みのジョブがあっても続けて投入できる）:
   python3 generate_questions.py --count 100 --batch
   python3 generate_questions.py --count 100 --batch --model claude-sonnet-4-6
-  → 翌日: python3 check_batch.py
+  → 翌日: python3 check_batch.py（完了したジョブから取り込む）
 """
 
 import argparse
+import asyncio
 import json
 import os
-import re
 import sys
-from datetime import datetime, timezone
 from pathlib import Path
 
 try:
@@ -37,31 +43,40 @@ try:
 except ImportError:
     pass
 
-from lib import VALID_FIELDS, VALID_DIFFS, parse_response  # noqa: E402
+from lib import (  # noqa: E402
+    AsyncRateLimiter, QuestionStreamParser, add_usage, iter_stream_questions, print_usage,
+    retry_wait,
+)
+from dedup_index import load_index  # noqa: E402
+from batch_registry import load_registry, register_job  # noqa: E402
+from question_store import open_store  # noqa: E402
+from scene_digest import build_digest  # noqa: E402
 
 REPO_ROOT = Path(__file__).parent
 QUESTIONS_JS = REPO_ROOT / "listening" / "questions.js"
 STAGING_JSON = REPO_ROOT / "listening" / "staging.json"
-BATCH_STATE = REPO_ROOT / "listening" / "batch_state.json"
 
 DEFAULT_MODEL = "claude-sonnet-4-6"
 MAX_TOKENS = 8192
 BATCH_SIZE = 30
 
+# 並列モードの設定
+DEFAULT_RPM = 50        # 1分あたりのリクエスト上限（トークンバケット）
+ASYNC_RETRIES = 4       # 429 / 529 / 接続エラー時のリトライ回数
+ASYNC_BACKOFF = 2.0     # retry-after が無い場合の待機の基準秒数
+
 # exclude リストの上限（プロンプトサイズを 200K トークン以下に抑えるため）
 # 1問 ≈ 25 tokens、200K / 25 ≈ 8,000問が限界。余裕をもって 3,000 問に制限。
 EXCLUDE_LIMIT = 3000
 
 
-def load_existing_texts():
+def load_existing_texts(limit=EXCLUDE_LIMIT):
+    """既存問題の text 一覧（limit=None なら全問）"""
     if not QUESTIONS_JS.exists():
         return []
-    content = QUESTIONS_JS.read_text(encoding="utf-8")
-    texts = re.findall(r'\btext:\s*"((?:[^"\\]|\\.)*)"', content)
-    # 直近 EXCLUDE_LIMIT 問のみ渡す（プロンプトサイズ抑制）
-    if len(texts) > EXCLUDE_LIMIT:
-        texts = texts[-EXCLUDE_LIMIT:]
-    return texts
+    # 直近 limit 問のみ渡す（プロンプトサイズ抑制）
+    with open_store() as store:
+        return store.texts(limit=limit)
 
 
 AXIS_DESCRIPTIONS = {
@@ -73,33 +88,40 @@ AXIS_DESCRIPTIONS = {
 }
 
 
-def build_prompt(count, lv1, lv2, lv3, lv4, lv5, existing_texts, axis_only=None):
+def build_exclusion(existing_texts, mode="digest"):
+    """既存問題の除外セクション本文
+
+    digest: scene_digest による場面別ダイジェスト（全問をカバーし1桁小さい）
+    full  : 英文リストをそのまま列挙
+    """
+    if mode == "digest":
+        return build_digest(existing_texts)
     existing_list = json.dumps(existing_texts, ensure_ascii=False, indent=2)
+    return f"""以下は既存問題の英文リストです。同じ英文・同じ場面・同じシチュエーションの問題は
+絶対に作らないでください（完全一致だけでなく類似した場面も避けること）：
 
-    if axis_only:
-        per = count // len(axis_only)
-        axis_lines = "\n".join(f"- {AXIS_DESCRIPTIONS[a]}" for a in axis_only)
-        axis_instruction = (
-            f"各問題に以下の axis のいずれかを割り当て、{count}問全体で均等に分散させること"
-            f"（各約{per}問）：\n{axis_lines}"
-        )
-    else:
-        axis_lines = "\n".join(f"- {d}" for d in AXIS_DESCRIPTIONS.values())
-        axis_instruction = (
-            f"各問題に以下のいずれかを1つ割り当て、{count}問全体で均等に分散させること（各約{count//5}問）：\n{axis_lines}"
-        )
+{existing_list}"""
 
-    return f"""以下のJSON形式でリスニングクイズの問題を{count}問生成してください。
 
-## 難易度の内訳
-- lv1（超簡単・日常の短い1文）: {lv1}問
-- lv2（簡単）: {lv2}問
-- lv3（普通）: {lv3}問
-- lv4（難しい）: {lv4}問
-- lv5（非常に難しい・速い/崩れた英語）: {lv5}問
+def build_prompt_prefix(exclusion):
+    """全バッチ共通の固定部分（指示 + 既存問題の除外セクション）
 
-## 難易度の微差（axis フィールド）
-{axis_instruction}
+    1回の実行中はバイト単位で同一になるようにし、cache_control でキャッシュさせる。
+    """
+    axis_lines = "\n".join(f"- {d}" for d in AXIS_DESCRIPTIONS.values())
+
+    return f"""あなたは英語リスニングクイズの問題作成者です。以下のルールに従い、
+最後の「今回の生成内容」で指定された問題数・難易度・axis で問題を生成してください。
+
+## 難易度の目安
+- lv1（超簡単・日常の短い1文）
+- lv2（簡単）
+- lv3（普通）
+- lv4（難しい）
+- lv5（非常に難しい・速い/崩れた英語）
+
+## 難易度の微差（axis フィールド）の定義
+{axis_lines}
 
 ## 出力形式（JSONのみ出力、他の文章は不要）
 [
@@ -124,12 +146,63 @@ def build_prompt(count, lv1, lv2, lv3, lv4, lv5, existing_texts, axis_only=None)
 - 既存テーマとの重複を避けること（テーマ例: 交通・飲食店・職場・家庭・天気・ショッピング・健康）
 - JSON のみ出力（説明文・コードブロック記号不要）
 
-## 既存問題リスト（重複禁止）
-以下は既存問題の英文リストです。同じ英文・同じ場面・同じシチュエーションの問題は
-絶対に作らないでください（完全一致だけでなく類似した場面も避けること）：
+## 既存問題（重複禁止）
+{exclusion}
+"""
+
 
-{existing_list}
+def build_prompt_suffix(count, lv1, lv2, lv3, lv4, lv5, axis_only=None, new_texts=None):
+    """バッチごとに変わる部分（問題数・難易度内訳・axis 指定・今回生成済みの英文）"""
+    if axis_only:
+        per = count // len(axis_only)
+        axis_instruction = (
+            f"各問題に次の axis のいずれかを割り当て、{count}問全体で均等に分散させること"
+            f"（各約{per}問）：{', '.join(axis_only)}"
+        )
+    else:
+        axis_instruction = (
+            f"各問題に5種類の axis のいずれかを1つ割り当て、{count}問全体で均等に分散させること（各約{count//5}問）"
+        )
+
+    suffix = f"""## 今回の生成内容
+上記のJSON形式でリスニングクイズの問題を{count}問生成してください。
+
+### 難易度の内訳
+- lv1: {lv1}問
+- lv2: {lv2}問
+- lv3: {lv3}問
+- lv4: {lv4}問
+- lv5: {lv5}問
+
+### axis の割り当て
+{axis_instruction}
 """
+    if new_texts:
+        suffix += f"""
+### 今回すでに生成済みの問題（これらとも重複禁止）
+{json.dumps(new_texts, ensure_ascii=False, indent=2)}
+"""
+    return suffix
+
+
+def build_prompt(count, lv1, lv2, lv3, lv4, lv5, exclusion, axis_only=None, new_texts=None):
+    """user メッセージの content ブロックを返す
+
+    先頭ブロック（固定部分）に cache_control を付け、2回目以降のバッチでは
+    キャッシュ読み込みになるようにする。
+    """
+    return [
+        {
+            "type": "text",
+            "text": build_prompt_prefix(exclusion),
+            "cache_control": {"type": "ephemeral"},
+        },
+        {
+            "type": "text",
+            "text": build_prompt_suffix(count, lv1, lv2, lv3, lv4, lv5,
+                                        axis_only=axis_only, new_texts=new_texts),
+        },
+    ]
 
 
 def split_levels(total_lv, remaining, batch_count):
@@ -142,31 +215,79 @@ def split_levels(total_lv, remaining, batch_count):
     return batch
 
 
-def run_normal(client, model, count, lv, existing_texts, axis_only=None):
-    """通常モード: 即時実行"""
-    all_questions = []
+def plan_batches(count, lv):
+    """count 問を BATCH_SIZE ごとに分割し、各バッチの (問題数, レベル内訳) を返す"""
+    plan = []
     remaining_lv = list(lv)
     remaining = count
-    batch_num = 1
-    total_batches = -(-count // BATCH_SIZE)
-
     while remaining > 0:
         batch_count = min(remaining, BATCH_SIZE)
         bl = split_levels(remaining_lv, remaining, batch_count)
+        plan.append((batch_count, bl))
+        for i in range(5):
+            remaining_lv[i] = max(0, remaining_lv[i] - bl[i])
+        remaining -= batch_count
+    return plan
+
+
+def accept_question(q, seen, index=None):
+    """完全一致・類似重複のどちらでもなければ登録して True を返す"""
+    key = q["text"].strip().lower()
+    if key in seen:
+        return False
+    if index is not None and index.find_duplicate(q["text"]):
+        return False
+    seen.add(key)
+    if index is not None:
+        index.add(q["text"])
+    return True
+
+
+def run_normal(client, model, count, lv, existing_texts, axis_only=None, usage=None, index=None,
+               exclusion=None):
+    """通常モード: 即時実行"""
+    if exclusion is None:
+        exclusion = build_exclusion(existing_texts, "full")
+    all_questions = []
+    plan = plan_batches(count, lv)
+    total_batches = len(plan)
+    seen = {t.strip().lower() for t in existing_texts}
+
+    for batch_num, (batch_count, bl) in enumerate(plan, 1):
         bl1, bl2, bl3, bl4, bl5 = bl
 
         print(f"\n[{batch_num}/{total_batches}] {batch_count}問 "
               f"(lv1:{bl1} lv2:{bl2} lv3:{bl3} lv4:{bl4} lv5:{bl5}) 生成中...")
 
-        exclude = existing_texts + [q["text"] for q in all_questions]
-        prompt = build_prompt(batch_count, bl1, bl2, bl3, bl4, bl5, exclude, axis_only=axis_only)
+        # 除外セクションは固定（キャッシュされる）、今回の生成分だけ可変部分に載せる
+        new_texts = [q["text"] for q in all_questions]
+        prompt = build_prompt(batch_count, bl1, bl2, bl3, bl4, bl5, exclusion,
+                              axis_only=axis_only, new_texts=new_texts)
 
         try:
-            resp = client.messages.create(
+            # ストリーミングで受信し、閉じ括弧が届いた問題から順に重複チェックする
+            questions = []
+            duplicates = 0
+            parser = QuestionStreamParser()
+            with client.messages.stream(
                 model=model, max_tokens=MAX_TOKENS,
                 messages=[{"role": "user", "content": prompt}],
-            )
-            questions = parse_response(resp.content[0].text)
+            ) as stream:
+                for q in iter_stream_questions(stream.text_stream, parser):
+                    if not accept_question(q, seen, index):
+                        duplicates += 1
+                        continue
+                    questions.append(q)
+                final = stream.get_final_message()
+            if usage is not None:
+                add_usage(usage, final.usage)
+
+            if not parser.parsed:
+                raise ValueError("レスポンスから問題を1問も取得できませんでした")
+            if parser.pending or final.stop_reason == "max_tokens":
+                print(f"  WARNING: レスポンスが途中で切れたため完結した {parser.parsed} 問のみ取得")
+            if parser.rejected or duplicates:
+                print(f"  除外: 不正 {parser.rejected}問 / 重複 {duplicates}問")
             all_questions.extend(questions)
             print(f"  ✅ {len(questions)}問 取得（累計: {len(all_questions)}問）")
         except Exception as e:
@@ -176,34 +297,127 @@ def run_normal(client, model, count, lv, existing_texts, axis_only=None):
                 break
             sys.exit(1)
 
-        for i in range(5):
-            remaining_lv[i] = max(0, remaining_lv[i] - bl[i])
-        remaining -= batch_count
-        batch_num += 1
+    return all_questions
 
+
+async def _generate_batch_async(client, limiter, model, prompt):
+    """1バッチをストリーミング生成（レート制限・リトライ付き）"""
+    for attempt in range(ASYNC_RETRIES + 1):
+        await limiter.acquire()
+        parser = QuestionStreamParser()
+        questions = []
+        try:
+            async with client.messages.stream(
+                model=model, max_tokens=MAX_TOKENS,
+                messages=[{"role": "user", "content": prompt}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    questions.extend(parser.feed(text))
+                final = await stream.get_final_message()
+                limiter.observe_headers(getattr(stream.response, "headers", None))
+            if not parser.parsed:
+                raise ValueError("レスポンスから問題を1問も取得できませんでした")
+            return questions, parser, final
+        except Exception as e:
+            wait = retry_wait(e, limiter, attempt, ASYNC_BACKOFF)
+            if wait is None or attempt == ASYNC_RETRIES:
+                raise
+            print(f"  RETRY: {type(e).__name__} → {wait:.1f}秒待機 ({attempt + 1}/{ASYNC_RETRIES})")
+            limiter.pause(wait)
+
+
+async def _warm_prompt_cache(client, limiter, model, exclusion, usage):
+    """固定部分だけを max_tokens=1 で送り、並列バッチの前にキャッシュを書き込んでおく
+
+    これをしないと最初の同時リクエストが全部キャッシュ書き込みになる。
+    """
+    block = build_prompt(1, 0, 0, 1, 0, 0, exclusion)[0]
+    await limiter.acquire()
+    try:
+        resp = await client.messages.create(
+            model=model, max_tokens=1,
+            messages=[{"role": "user", "content": [block]}],
+        )
+        if usage is not None:
+            add_usage(usage, resp.usage)
+    except Exception as e:
+        print(f"  WARNING: キャッシュの事前書き込みに失敗（続行します）: {type(e).__name__} {e}")
+
+
+async def run_async(api_key, model, count, lv, existing_texts, axis_only=None,
+                    concurrency=4, rpm=DEFAULT_RPM, usage=None, index=None, exclusion=None):
+    """並列モード: split_levels の内訳どおりのバッチを同時にリクエスト
+
+    結果が届いた順に全バッチ横断で重複除去する。失敗したバッチがあっても
+    成功分はすべて返す（失敗分の内訳は表示のみ）。
+    """
+    if exclusion is None:
+        exclusion = build_exclusion(existing_texts, "full")
+    # リトライは limiter と協調させたいので SDK 側の自動リトライは無効化
+    client = anthropic.AsyncAnthropic(api_key=api_key, max_retries=0)
+    limiter = AsyncRateLimiter(rpm, burst=concurrency)
+    sem = asyncio.Semaphore(concurrency)
+    plan = plan_batches(count, lv)
+    total_batches = len(plan)
+    seen = {t.strip().lower() for t in existing_texts}
+    all_questions = []
+    failed = []
+
+    if len(plan) > 1 and existing_texts:
+        await _warm_prompt_cache(client, limiter, model, exclusion, usage)
+
+    async def one(batch_num, batch_count, bl):
+        prompt = build_prompt(batch_count, *bl, exclusion, axis_only=axis_only)
+        async with sem:
+            print(f"[{batch_num}/{total_batches}] {batch_count}問 "
+                  f"(lv1:{bl[0]} lv2:{bl[1]} lv3:{bl[2]} lv4:{bl[3]} lv5:{bl[4]}) 生成開始")
+            try:
+                questions, parser, final = await _generate_batch_async(client, limiter, model, prompt)
+                if usage is not None:
+                    add_usage(usage, final.usage)
+            except Exception as e:
+                failed.append((batch_num, batch_count, bl))
+                print(f"  [{batch_num}/{total_batches}] ERROR: {type(e).__name__} {e}", file=sys.stderr)
+                return
+
+        duplicates = 0
+        for q in questions:
+            if not accept_question(q, seen, index):
+                duplicates += 1
+                continue
+            all_questions.append(q)
+        note = ""
+        if parser.pending or final.stop_reason == "max_tokens":
+            note += "（途中で切れたため一部のみ）"
+        if parser.rejected or duplicates:
+            note += f"（除外: 不正 {parser.rejected}問 / 重複 {duplicates}問）"
+        print(f"  [{batch_num}/{total_batches}] ✅ {len(questions) - duplicates}問 取得"
+              f"（累計: {len(all_questions)}問）{note}")
+
+    await asyncio.gather(*(one(i, c, bl) for i, (c, bl) in enumerate(plan, 1)))
+    await client.close()
+
+    if failed:
+        missing = [sum(bl[i] for _, _, bl in failed) for i in range(5)]
+        print(f"\nWARNING: {len(failed)}/{total_batches} バッチが失敗しました"
+              f"（未生成 lv1:{missing[0]} lv2:{missing[1]} lv3:{missing[2]} "
+              f"lv4:{missing[3]} lv5:{missing[4]}）")
+        print(f"  成功した {len(all_questions)} 問は保存します。不足分は --lv1〜--lv5 で再実行してください")
     return all_questions
 
 
-def run_batch(client, model, count, lv, existing_texts, axis_only=None):
+def run_batch(client, model, count, lv, existing_texts, axis_only=None, exclusion=None):
     """Batch モード: ジョブ投入のみ（結果は check_batch.py で取得）"""
-    if BATCH_STATE.exists():
-        state = json.loads(BATCH_STATE.read_text())
-        print(f"ERROR: 未処理のバッチが存在します (ID: {state['batch_id']})")
-        print("  先に python3 check_batch.py を実行してください")
-        sys.exit(1)
+    if exclusion is None:
+        exclusion = build_exclusion(existing_texts, "full")
 
     # 全リクエストのプロンプトを一括作成
     requests = []
-    remaining_lv = list(lv)
-    remaining = count
-    req_idx = 0
 
-    while remaining > 0:
-        batch_count = min(remaining, BATCH_SIZE)
-        bl = split_levels(remaining_lv, remaining, batch_count)
+    for req_idx, (batch_count, bl) in enumerate(plan_batches(count, lv)):
         bl1, bl2, bl3, bl4, bl5 = bl
 
-        prompt = build_prompt(batch_count, bl1, bl2, bl3, bl4, bl5, existing_texts, axis_only=axis_only)
+        prompt = build_prompt(batch_count, bl1, bl2, bl3, bl4, bl5, exclusion, axis_only=axis_only)
         requests.append({
             "custom_id": f"req-{req_idx}",
             "params": {
@@ -211,14 +425,9 @@ def run_batch(client, model, count, lv, existing_texts, axis_only=None):
                 "max_tokens": MAX_TOKENS,
                 "messages": [{"role": "user", "content": prompt}],
             },
-            "_meta": {"count": batch_count, "lv": bl},  # 後で取り除く
+            "_meta": {"count": batch_count, "lv": bl, "axis_only": axis_only},  # 後で取り除く
         })
 
-        for i in range(5):
-            remaining_lv[i] = max(0, remaining_lv[i] - bl[i])
-        remaining -= batch_count
-        req_idx += 1
-
     # _meta は Anthropic API に渡さない
     api_requests = [
         {"custom_id": r["custom_id"], "params": r["params"]}
@@ -229,22 +438,18 @@ def run_batch(client, model, count, lv, existing_texts, axis_only=None):
     print(f"\nBatch API にジョブ投入中... ({len(api_requests)} リクエスト)")
     batch = client.messages.batches.create(requests=api_requests)
 
-    state = {
-        "batch_id": batch.id,
-        "model": model,
-        "count": count,
-        "submitted_at": datetime.now(timezone.utc).isoformat(),
-        "requests": [
-            {"custom_id": cid, **meta}
-            for cid, meta in meta_map.items()
-        ],
-    }
-    BATCH_STATE.write_text(json.dumps(state, ensure_ascii=False, indent=2))
+    register_job(
+        batch.id, model, count,
+        [{"custom_id": cid, **meta} for cid, meta in meta_map.items()],
+        axis_only=axis_only,
+    )
+    outstanding = len(load_registry())
 
     print(f"✅ Batch 投入完了")
     print(f"   Batch ID: {batch.id}")
     print(f"   リクエスト数: {len(api_requests)} 件（合計 {count} 問）")
     print(f"   処理時間: 最大24時間")
+    print(f"   未取り込みのジョブ: {outstanding} 件（このジョブを含む）")
     print(f"\n翌日以降に以下を実行してください:")
     print(f"  cd /Users/yusuke/projects/claude/native-real && python3 check_batch.py")
 
@@ -263,6 +468,12 @@ def main():
                         help=f"使用モデル（デフォルト: {DEFAULT_MODEL}）")
     parser.add_argument("--axis-only", default=None,
                         help="生成する axis をカンマ区切りで指定（例: speed,reduction）")
+    parser.add_argument("--exclude", choices=["digest", "full"], default="digest",
+                        help="既存問題の渡し方（digest: 場面別ダイジェスト / full: 英文リスト）")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="通常モードで同時に投げるバッチ数（2以上で並列モード）")
+    parser.add_argument("--rpm", type=int, default=DEFAULT_RPM,
+                        help=f"並列モードの1分あたりリクエスト上限（デフォルト: {DEFAULT_RPM}）")
     args = parser.parse_args()
 
     VALID_AXES = {"speed", "reduction", "vocab", "context", "distractor"}
@@ -290,21 +501,43 @@ def main():
         lv[4] = count - sum(lv[:4])
 
     lv1, lv2, lv3, lv4, lv5 = lv
-    mode = "Batch（50%オフ・24時間）" if args.batch else "通常（即時）"
+    if args.batch:
+        mode = "Batch（50%オフ・24時間）"
+    elif args.concurrency > 1:
+        mode = f"並列（同時 {args.concurrency} バッチ・{args.rpm} rpm）"
+    else:
+        mode = "通常（即時）"
     print(f"生成設定: {count}問 (lv1:{lv1} lv2:{lv2} lv3:{lv3} lv4:{lv4} lv5:{lv5})")
     print(f"モデル: {args.model}  モード: {mode}")
     if axis_only:
         print(f"axis 指定: {axis_only}（これらのみ生成）")
 
-    existing_texts = load_existing_texts()
+    # digest は全問から集計する（full は直近 EXCLUDE_LIMIT 問に制限）
+    existing_texts = load_existing_texts(limit=None if args.exclude == "digest" else EXCLUDE_LIMIT)
     print(f"既存問題数: {len(existing_texts)} 問")
+    exclusion = build_exclusion(existing_texts, args.exclude)
+    print(f"除外セクション: {args.exclude}（{len(exclusion.encode('utf-8')):,} bytes）")
 
     client = anthropic.Anthropic(api_key=api_key)
+    usage = {}
+    # 全問題バンクに対する類似重複チェック（プロンプトに載らない古い問題も対象）
+    index = None if args.batch else load_index()
 
     if args.batch:
-        run_batch(client, args.model, count, lv, existing_texts, axis_only=axis_only)
+        run_batch(client, args.model, count, lv, existing_texts, axis_only=axis_only,
+                  exclusion=exclusion)
     else:
-        all_questions = run_normal(client, args.model, count, lv, existing_texts, axis_only=axis_only)
+        if args.concurrency > 1:
+            all_questions = asyncio.run(run_async(
+                api_key, args.model, count, lv, existing_texts, axis_only=axis_only,
+                concurrency=args.concurrency, rpm=args.rpm, usage=usage, index=index,
+                exclusion=exclusion,
+            ))
+        else:
+            all_questions = run_normal(client, args.model, count, lv, existing_texts,
+                                       axis_only=axis_only, usage=usage, index=index,
+                                       exclusion=exclusion)
+        print_usage(usage)
         if not all_questions:
             print("ERROR: 問題を1問も生成できませんでした", file=sys.stderr)
             sys.exit(1)
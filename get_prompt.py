@@ -5,15 +5,18 @@ get_prompt.py - Claude.ai 用プロンプト生成スクリプト
 Usage:
   python3 get_prompt.py --count 100
   python3 get_prompt.py --count 100 --lv1 15 --lv2 25 --lv3 30 --lv4 20 --lv5 10
+  python3 get_prompt.py --count 100 --exclude full   # 既存問題を英文リストで全件列挙
 """
 
 import argparse
 import json
-import re
 import subprocess
 import sys
 from pathlib import Path
 
+from question_store import open_store
+from scene_digest import build_digest
+
 QUESTIONS_JS = Path(__file__).parent / "listening" / "questions.js"
 
 
@@ -23,22 +26,25 @@ def load_existing_texts():
         print(f"ERROR: {QUESTIONS_JS} が見つかりません", file=sys.stderr)
         sys.exit(1)
 
-    content = QUESTIONS_JS.read_text(encoding="utf-8")
+    with open_store() as store:
+        return store.texts()
 
-    # text フィールドを正規表現で抽出
-    # questions.js は JavaScript オブジェクト記法（キーにクォートなし）
-    texts = re.findall(r'\btext:\s*"((?:[^"\\]|\\.)*)"', content)
-    if not texts:
-        # シングルクォートの場合も試みる
-        texts = re.findall(r"\btext:\s*'((?:[^'\\]|\\.)*)'", content)
 
-    return texts
+def build_prompt(count, lv1, lv2, lv3, lv4, lv5, existing_texts, exclude="digest"):
+    """Claude.ai 用プロンプトを生成
 
+    exclude="digest": 既存問題を場面別ダイジェストで渡す（全問カバー・小さい）
+    exclude="full"  : 既存問題の英文リストをそのまま渡す
+    """
 
-def build_prompt(count, lv1, lv2, lv3, lv4, lv5, existing_texts):
-    """Claude.ai 用プロンプトを生成"""
+    if exclude == "digest":
+        existing_section = build_digest(existing_texts)
+    else:
+        existing_list = json.dumps(existing_texts, ensure_ascii=False, indent=2)
+        existing_section = f"""以下は既存問題の英文リストです。同じ英文・同じ場面・同じシチュエーションの問題は
+絶対に作らないでください（完全一致だけでなく類似した場面も避けること）：
 
-    existing_list = json.dumps(existing_texts, ensure_ascii=False, indent=2)
+{existing_list}"""
 
     prompt = f"""以下のJSON形式でリスニングクイズの問題を{count}問生成してください。
 
@@ -79,11 +85,8 @@ def build_prompt(count, lv1, lv2, lv3, lv4, lv5, existing_texts):
 - 既存テーマとの重複を避けてください（テーマ例: 交通・飲食店・職場・家庭・天気・ショッピング・健康）
 - JSON のみ出力（説明文・コードブロック記号不要）
 
-## 既存問題リスト（重複禁止）
-以下は既存問題の英文リストです。同じ英文・同じ場面・同じシチュエーションの問題は
-絶対に作らないでください（完全一致だけでなく類似した場面も避けること）：
-
-{existing_list}
+## 既存問題（重複禁止）
+{existing_section}
 """
     return prompt
 
@@ -112,6 +115,8 @@ def main():
     parser.add_argument("--lv3", type=int, default=None, help="lv3 問題数")
     parser.add_argument("--lv4", type=int, default=None, help="lv4 問題数")
     parser.add_argument("--lv5", type=int, default=None, help="lv5 問題数")
+    parser.add_argument("--exclude", choices=["digest", "full"], default="digest",
+                        help="既存問題の渡し方（digest: 場面別ダイジェスト / full: 英文リスト）")
     args = parser.parse_args()
 
     count = args.count
@@ -145,7 +150,7 @@ def main():
 
     print(f"\n生成設定: {count}問 (lv1:{lv1} lv2:{lv2} lv3:{lv3} lv4:{lv4} lv5:{lv5})")
 
-    prompt = build_prompt(count, lv1, lv2, lv3, lv4, lv5, existing_texts)
+    prompt = build_prompt(count, lv1, lv2, lv3, lv4, lv5, existing_texts, exclude=args.exclude)
 
     if copy_to_clipboard(prompt):
         print("\n✅ プロンプトをクリップボードにコピーしました。")
@@ -1,18 +1,352 @@
 #!/usr/bin/env python3
 """lib.py - 問題パイプライン共通ユーティリティ"""
 
+import asyncio
+import contextlib
+import fcntl
+import hashlib
 import json
+import marshal
+import os
 import re
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import anthropic
+except ImportError:     # add_questions.py など API を使わないスクリプトからも import される
+    anthropic = None
 
 VALID_FIELDS = {"diff", "text", "ja", "answer", "choices", "expl", "kp"}
 VALID_DIFFS = {"lv1", "lv2", "lv3", "lv4", "lv5"}
 
+# load_questions_js のキャッシュ形式（パース結果の形を変えたら上げる）
+QUESTIONS_CACHE_VERSION = 1
+
+# questions.js（JS オブジェクトリテラル）→ JSON 変換用のトークン
+#   1: ダブルクォート文字列  2: シングルクォート文字列  3: クォートなしのキー  4: 末尾カンマ
+_JS_TOKEN = re.compile(
+    r'("[^"\\\n]*(?:\\.[^"\\\n]*)*")'
+    r"|('[^'\\\n]*(?:\\.[^'\\\n]*)*')"
+    r"|([A-Za-z_$][\w$]*)(?=\s*:)"
+    r"|(,)(?=\s*[\]}])",
+    re.S,
+)
+
+# オブジェクト内で意味を持つ文字（文字列・エスケープ・括弧）
+_OBJ_SPECIAL = re.compile(r'[{}"\\]')
+_STR_SPECIAL = re.compile(r'["\\]')
+
+
+def is_valid_question(q):
+    """必須フィールド・diff・choices(5要素) を満たすか"""
+    if not isinstance(q, dict):
+        return False
+    if VALID_FIELDS - set(q.keys()):
+        return False
+    if q.get("diff") not in VALID_DIFFS:
+        return False
+    if not isinstance(q.get("choices"), list) or len(q["choices"]) != 5:
+        return False
+    return True
+
+
+_JSON_ESCAPES = set('"\\/bfnrtu')
+
+
+def _js_escape_to_json(m):
+    esc = m.group(1)
+    if esc is None:                 # シングルクォート文字列内の裸の "
+        return '\\"'
+    c = esc[0]
+    if c in _JSON_ESCAPES:
+        return m.group(0)
+    if c == "x":
+        return "\\u00" + esc[1:]
+    if c == "\n":                   # 行継続
+        return ""
+    if c == "v":
+        return "\\u000b"
+    if c == "0":
+        return "\\u0000"
+    return c                        # \' など JSON に無いエスケープは文字そのもの
+
+
+_JS_STR_PART = re.compile(r'\\(x[0-9a-fA-F]{2}|.)|"', re.S)
+
+
+def _js_token_to_json(m):
+    dq, sq, key, _trailing = m.groups()
+    if dq is not None:
+        if "\\" not in dq:
+            return dq
+        return '"' + _JS_STR_PART.sub(_js_escape_to_json, dq[1:-1]) + '"'
+    if sq is not None:
+        return '"' + _JS_STR_PART.sub(_js_escape_to_json, sq[1:-1]) + '"'
+    if key is not None:
+        return f'"{key}"'
+    return ""                       # 末尾カンマ
+
+
+# questions.js のオブジェクト境界を探すための走査（文字列内の括弧は文字列ごと読み飛ばす）
+_JS_SCAN = re.compile(r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"|\'[^\'\\\n]*(?:\\.[^\'\\\n]*)*\'|[{}\]]', re.S)
+
+# const DATA = JSON.parse('...') 形式（question_store.py --format json）
+_JSON_PARSE_START = re.compile(r"DATA\s*=\s*JSON\.parse\(\s*(?=')")
+_JS_SQ_STRING = re.compile(r"'[^'\\\n]*(?:\\.[^'\\\n]*)*'", re.S)
+
+
+def js_single_quote(s):
+    """文字列を JS のシングルクォート文字列リテラルの中身としてエスケープする
+
+    JSON.parse に渡す JSON テキスト用（改行などの制御文字は JSON 側で既にエスケープ済み）。
+    U+2028 / U+2029 は ES2019 より前のエンジンでは文字列内でも改行扱いなので \\u 表記にする。
+    """
+    return (s.replace("\\", "\\\\")
+             .replace("'", "\\'")
+             .replace("\u2028", "\\u2028")
+             .replace("\u2029", "\\u2029"))
+
+
+def iter_questions_js(content):
+    """questions.js の const DATA = [...]; から問題 dict を1件ずつ返す
+
+    括弧の深さでトップレベルのオブジェクトを切り出し、JS オブジェクトリテラル
+    （クォートなしキー・末尾カンマ・シングルクォート）を JSON に変換して json.loads する。
+    1行1問である必要はなく、全フィールドをエスケープ解除済みの型付きの値で返す。
+    const DATA = JSON.parse('...') 形式なら文字列リテラルを戻してそのまま json.loads する。
+    """
+    head = content.find("DATA")
+    m = _JSON_PARSE_START.match(content, head) if head >= 0 else None
+    if m:
+        literal = _JS_SQ_STRING.match(content, m.end())
+        if literal is None:
+            raise ValueError("questions.js の JSON.parse の文字列が閉じられていません")
+        text = json.loads('"' + _JS_STR_PART.sub(_js_escape_to_json, literal.group()[1:-1]) + '"')
+        yield from json.loads(text)
+        return
+
+    start = content.find("[", content.find("DATA"))
+    if start < 0:
+        raise ValueError("questions.js に const DATA = [ ... ] が見つかりません")
+    depth = 0
+    obj_start = 0
+    for m in _JS_SCAN.finditer(content, start + 1):
+        c = m.group()
+        if c == "{":
+            if depth == 0:
+                obj_start = m.start()
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                obj = content[obj_start:m.end()]
+                yield json.loads(_JS_TOKEN.sub(_js_token_to_json, obj))
+        elif c == "]" and depth == 0:
+            return
+    raise ValueError("questions.js の DATA 配列が閉じられていません")
+
+
+def parse_questions_js(content):
+    """questions.js の全問題を dict のリストにパース"""
+    return list(iter_questions_js(content))
+
+
+def _file_fingerprint(path):
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def load_questions_js(path, cache_path=None):
+    """questions.js を読み込む（パース結果をディスクにキャッシュ）
+
+    キャッシュはファイルサイズ + mtime が一致すればそのまま使い、mtime だけ
+    変わった場合（git checkout 等）は内容の sha1 で照合する。形式は marshal。
+    戻り値: 問題 dict のリスト
+    """
+    path = Path(path)
+    if cache_path is None:
+        cache_path = path.with_name(f".{path.name}.cache")
+    size, mtime = _file_fingerprint(path)
+
+    cached = None
+    try:
+        # marshal.load(ファイル) は細切れに読むため遅い。一括で読んでから loads する
+        cached = marshal.loads(Path(cache_path).read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    if isinstance(cached, dict) and cached.get("version") == QUESTIONS_CACHE_VERSION:
+        if (cached["size"], cached["mtime"]) == (size, mtime):
+            return cached["questions"]
+
+    raw = path.read_bytes()
+    digest = hashlib.sha1(raw).hexdigest()
+    if isinstance(cached, dict) and cached.get("version") == QUESTIONS_CACHE_VERSION \
+            and cached["sha1"] == digest:
+        questions = cached["questions"]
+    else:
+        questions = parse_questions_js(raw.decode("utf-8"))
+
+    cache_path = Path(cache_path)
+    tmp = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp.write_bytes(marshal.dumps({
+            "version": QUESTIONS_CACHE_VERSION, "size": size, "mtime": mtime,
+            "sha1": digest, "questions": questions,
+        }))
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass                        # キャッシュが書けなくても読み込み自体は成功させる
+    return questions
+
+
+def _js_escape(s):
+    return (s.replace("\\", "\\\\")
+             .replace('"', '\\"')
+             .replace("\n", "\\n")
+             .replace("\r", "\\r")
+             .replace("\t", "\\t"))
+
+
+# format_question_js が決まった位置に書くフィールドと、出力しないストアの ID
+_JS_FIXED_FIELDS = ("diff", "axis", "text", "ja", "answer", "choices", "audio", "expl", "kp", "dur", "id")
+_JS_KEY = re.compile(r"[A-Za-z_$][\w$]*")
+
+
+def _compact_json(v):
+    return json.dumps(v, ensure_ascii=False, separators=(",", ":"))
+
+
+def format_question_js(q):
+    """問題オブジェクトを questions.js 形式の1行文字列に変換
+
+    choices / kp は既存の questions.js と同じく空白なしの区切り（","）で書く
+    （区切りが変わると再生成のたびに全行が差分になる）。
+    それ以外のキー（ストアの extra 列）も kp の後ろにそのまま書き、取り込み直しで失われないようにする。
+    """
+    choices_str = _compact_json(q["choices"])
+    kp_str = _compact_json(q["kp"])
+    esc = _js_escape
+
+    axis_part = f', axis: "{esc(q["axis"])}"' if q.get("axis") else ""
+    extra_part = "".join(
+        f", {k if _JS_KEY.fullmatch(k) else _compact_json(k)}: {_compact_json(v)}"
+        for k, v in q.items() if k not in _JS_FIXED_FIELDS
+    )
+    dur_part = f", dur: {q['dur']}" if q.get("dur") is not None else ""
+
+    return (
+        f'  {{ diff: "{q["diff"]}"{axis_part}, text: "{esc(q["text"])}", ja: "{esc(q["ja"])}", '
+        f'answer: "{esc(q["answer"])}", choices: {choices_str}, '
+        f'audio: "{esc(q["audio"])}", '
+        f'expl: "{esc(q["expl"])}", kp: {kp_str}{extra_part}{dur_part} }}'
+    )
+
+
+class QuestionStreamParser:
+    """JSON 配列の問題リストを逐次パースする
+
+    messages.stream の text delta を feed() に渡すと、閉じ括弧 } が届いた
+    オブジェクトから順にバリデーション済みの問題を返す。配列の外側
+    （``` フェンス・[ ] ・区切りの ,）は読み飛ばすため、途中で切れた出力でも
+    完結したオブジェクトはすべて回収できる。
+
+        parser = QuestionStreamParser()
+        for delta in stream.text_stream:
+            for q in parser.feed(delta):
+                ...
+    """
+
+    def __init__(self):
+        self._buf = []        # 現在のオブジェクトの断片
+        self._depth = 0       # { } のネスト深さ（0 = オブジェクト外）
+        self._in_str = False
+        self._escape = False
+        self.parsed = 0       # 完結したオブジェクト数
+        self.rejected = 0     # バリデーション・JSON エラーで捨てた数
+
+    @property
+    def pending(self):
+        """閉じていないオブジェクトを保持しているか（= 出力が途中で切れた）"""
+        return self._depth > 0
+
+    def feed(self, chunk):
+        """chunk を取り込み、完結した有効な問題のリストを返す"""
+        out = []
+        pos = 0
+        n = len(chunk)
+        while pos < n:
+            if self._depth == 0:
+                start = chunk.find("{", pos)
+                if start < 0:
+                    break
+                self._buf = []
+                self._depth = 1
+                self._in_str = False
+                self._escape = False
+                seg_start = start
+                pos = start + 1
+            else:
+                seg_start = pos
+
+            # オブジェクト内: 特殊文字だけを拾って状態を進める
+            while pos < n and self._depth > 0:
+                if self._escape:
+                    self._escape = False
+                    pos += 1
+                    continue
+                m = (_STR_SPECIAL if self._in_str else _OBJ_SPECIAL).search(chunk, pos)
+                if not m:
+                    pos = n
+                    break
+                c = m.group()
+                pos = m.end()
+                if c == "\\":
+                    self._escape = self._in_str
+                elif c == '"':
+                    self._in_str = not self._in_str
+                elif c == "{":
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+
+            self._buf.append(chunk[seg_start:pos])
+            if self._depth == 0:
+                q = self._finish("".join(self._buf))
+                self._buf = []
+                if q is not None:
+                    out.append(q)
+        return out
+
+    def _finish(self, raw):
+        self.parsed += 1
+        try:
+            q = json.loads(raw)
+        except json.JSONDecodeError:
+            self.rejected += 1
+            return None
+        if not is_valid_question(q):
+            self.rejected += 1
+            return None
+        return q
+
+
+def iter_stream_questions(chunks, parser=None):
+    """テキスト断片のイテラブルから有効な問題を到着順に yield"""
+    parser = parser or QuestionStreamParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+
 
 def parse_response(raw, *, raise_on_error=True):
     """APIレスポンスの文字列を問題リストにパース・バリデーション
 
-    raise_on_error=True (デフォルト): JSON パース失敗時に例外を再送出
-    raise_on_error=False: JSON パース失敗時に [] を返す（check_batch.py 用）
+    raise_on_error=True (デフォルト): 1問も回収できない場合に JSON エラーを再送出
+    raise_on_error=False: 1問も回収できない場合に [] を返す（check_batch.py 用）
+
+    配列全体が JSON として壊れている（途中で切れた等）場合も、
+    QuestionStreamParser で完結しているオブジェクトをすべて回収する。
     """
     raw = raw.strip()
     raw = re.sub(r'^```[a-z]*\n?', '', raw)
@@ -21,27 +355,232 @@ def parse_response(raw, *, raise_on_error=True):
     try:
         questions = json.loads(raw)
     except json.JSONDecodeError:
-        last_obj_end = raw.rfind("},")
-        if last_obj_end > 0:
-            try:
-                questions = json.loads(raw[:last_obj_end + 1] + "\n]")
-                print(f"  WARNING: レスポンスが途中で切れたため {len(questions)} 問のみ取得")
-                return questions
-            except json.JSONDecodeError:
-                pass
+        parser = QuestionStreamParser()
+        questions = parser.feed(raw)
+        if questions:
+            print(f"  WARNING: レスポンスが途中で切れたため {len(questions)} 問のみ取得")
+            return questions
         if raise_on_error:
             raise
         return []
 
-    valid = []
-    for q in questions:
-        if not isinstance(q, dict):
-            continue
-        if VALID_FIELDS - set(q.keys()):
-            continue
-        if q.get("diff") not in VALID_DIFFS:
-            continue
-        if not isinstance(q.get("choices"), list) or len(q["choices"]) != 5:
-            continue
-        valid.append(q)
-    return valid
+    if not isinstance(questions, list):
+        questions = [questions]
+    return [q for q in questions if is_valid_question(q)]
+
+
+USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+)
+
+
+def add_usage(totals, usage):
+    """API レスポンスの usage（または usage_to_dict の dict）を totals (dict) に加算"""
+    if usage is None:
+        return totals
+    get = usage.get if isinstance(usage, dict) else lambda f: getattr(usage, f, None)
+    for field in USAGE_FIELDS:
+        totals[field] = totals.get(field, 0) + (get(field) or 0)
+    totals["requests"] = totals.get("requests", 0) + 1
+    return totals
+
+
+def usage_to_dict(usage):
+    """API レスポンスの usage を JSON 保存用の dict に変換"""
+    return {field: getattr(usage, field, None) or 0 for field in USAGE_FIELDS}
+
+
+def print_usage(totals):
+    """トークン使用量（プロンプトキャッシュの読み書きを含む）を表示"""
+    if not totals.get("requests"):
+        return
+    read = totals.get("cache_read_input_tokens", 0)
+    write = totals.get("cache_creation_input_tokens", 0)
+    uncached = totals.get("input_tokens", 0)
+    total_in = read + write + uncached
+    hit = read / total_in * 100 if total_in else 0.0
+    print(f"\nトークン使用量（{totals['requests']} リクエスト）:")
+    print(f"  入力: {total_in:,}（キャッシュ読込 {read:,} / キャッシュ書込 {write:,} / 通常 {uncached:,}）")
+    print(f"  出力: {totals.get('output_tokens', 0):,}")
+    print(f"  キャッシュヒット率: {hit:.1f}%")
+
+
+RETRYABLE_STATUS = (429, 500, 502, 503, 529)
+
+
+def retry_wait(e, limiter, attempt, backoff):
+    """API 例外がリトライ可能なら待機秒数を返す（不可なら None）
+
+    retry-after / レート制限ヘッダがあればそれに従い、無ければ指数バックオフ。
+    """
+    status = getattr(e, "status_code", None)
+    retryable = status in RETRYABLE_STATUS or (
+        anthropic is not None
+        and isinstance(e, (anthropic.RateLimitError, anthropic.APIConnectionError))
+    )
+    if not retryable:
+        return None
+    response = getattr(e, "response", None)
+    wait = limiter.observe_headers(response.headers if response is not None else None)
+    return wait or backoff * (2 ** attempt)
+
+
+class AsyncRateLimiter:
+    """リクエスト数のトークンバケット + API の rate-limit ヘッダによる一時停止
+
+    rpm: 1分あたりのリクエスト上限（バケット容量 = 同時に許すバースト数）
+    acquire() で1トークン消費。observe_headers() / pause() で retry-after や
+    anthropic-ratelimit-*-reset が指す時刻まで全ワーカーの送信を止める。
+    """
+
+    _LIMIT_KINDS = ("requests", "tokens", "input-tokens", "output-tokens")
+
+    def __init__(self, rpm, burst=None):
+        self.rate = rpm / 60.0
+        self.capacity = float(burst or max(1, min(rpm, 10)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return now
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = self._refill()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds):
+        """seconds 秒間、新規リクエストを止める"""
+        if seconds and seconds > 0:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def observe_headers(self, headers):
+        """レスポンスヘッダから retry-after / 残量ゼロのリセット時刻を読み取って反映
+
+        戻り値: 停止した秒数（停止不要なら 0）
+        """
+        if not headers:
+            return 0.0
+        wait = 0.0
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                pass
+        for kind in self._LIMIT_KINDS:
+            remaining = headers.get(f"anthropic-ratelimit-{kind}-remaining")
+            reset = headers.get(f"anthropic-ratelimit-{kind}-reset")
+            if remaining is None or reset is None or remaining.strip() != "0":
+                continue
+            try:
+                reset_at = datetime.fromisoformat(reset.replace("Z", "+00:00"))
+            except ValueError:
+                continue
+            wait = max(wait, (reset_at - datetime.now(timezone.utc)).total_seconds())
+        self.pause(wait)
+        return max(wait, 0.0)
+
+
+# 親プロセスが保持中のロック（"親の pid:ロックファイルの絶対パス"）。held_lock_env で子に渡す
+HELD_LOCK_ENV = "NATIVE_REAL_HELD_LOCK"
+
+
+def held_lock_env(path):
+    """path のロックを保持したまま子プロセスを起動するときの環境変数
+
+    子プロセスの file_lock(path) は取得済みとして通る（同じロックを取りに行って待ち続けない）。
+    """
+    return {**os.environ, HELD_LOCK_ENV: f"{os.getpid()}:{os.path.realpath(path)}"}
+
+
+@contextlib.contextmanager
+def file_lock(path, wait=False):
+    """排他ロック（flock）。取得できれば True、他プロセスが保持中なら False を yield する
+
+    wait=True なら解放されるまで待つ（常に True）。
+    プロセスが落ちればロックは OS が解放するので、古いロックファイルが残っても問題ない。
+    親プロセスが held_lock_env で同じロックを渡していれば、取得せずに True を yield する。
+    """
+    if os.environ.get(HELD_LOCK_ENV) == f"{os.getppid()}:{os.path.realpath(path)}":
+        yield True
+        return
+    path = Path(path)
+    with open(path, "a+", encoding="utf-8") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX if wait else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        f.seek(0)
+        f.truncate()
+        f.write(f"{os.getpid()}\n")
+        f.flush()
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+# MPEG Layer III のビットレート表（kbps）とサンプリングレート表
+_MP3_BITRATES = {
+    "mpeg1": (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    "mpeg2": (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def id3v2_size(buf):
+    """先頭の ID3v2 タグのバイト数（タグが無ければ 0）"""
+    if len(buf) < 10 or buf[:3] != b"ID3":
+        return 0
+    size = (buf[6] & 0x7F) << 21 | (buf[7] & 0x7F) << 14 | (buf[8] & 0x7F) << 7 | (buf[9] & 0x7F)
+    return 10 + size + (10 if buf[5] & 0x10 else 0)
+
+
+def mp3_frame_header(buf, pos):
+    """buf[pos:] の MPEG Layer III フレームヘッダを読む（デコードはしない）
+
+    戻り値: (フレーム長バイト, ビットレート kbps, サンプリングレート, 1フレームのサンプル数)
+    フレーム同期が取れない・Layer III 以外なら None
+    """
+    if pos + 4 > len(buf):
+        return None
+    b1, b2 = buf[pos + 1], buf[pos + 2]
+    if buf[pos] != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version = (b1 >> 3) & 3             # 3: MPEG1  2: MPEG2  0: MPEG2.5  1: 予約
+    bitrate_idx = b2 >> 4
+    rate_idx = (b2 >> 2) & 3
+    if version == 1 or (b1 >> 1) & 3 != 1 or bitrate_idx in (0, 15) or rate_idx == 3:
+        return None
+    mpeg1 = version == 3
+    kbps = _MP3_BITRATES["mpeg1" if mpeg1 else "mpeg2"][bitrate_idx]
+    rate = _MP3_SAMPLE_RATES[version][rate_idx]
+    samples = 1152 if mpeg1 else 576
+    return samples // 8 * kbps * 1000 // rate + ((b2 >> 1) & 1), kbps, rate, samples
+
+
+def mp3_is_info_frame(buf, pos, length):
+    """Xing / Info フレーム（LAME が先頭に置くヘッダ）か
+
+    音声データを持たず、ビットレートも本体と違うことがあるので長さの計算から除く。
+    """
+    head = bytes(buf[pos + 4:pos + min(length, 40)])
+    return b"Xing" in head or b"Info" in head
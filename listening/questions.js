@@ -1,4 +1,4 @@
-// questions.js — 732 questions
+// questions.js — 800 questions
 const DATA = [
   { diff: "lv2", axis: "context", text: "Ugh, the line is so long. I've been standing here for twenty minutes already.", ja: "うーん、並んでる人が多すぎる。もう20分も立ってるよ。", answer: "列に並んで待ちくたびれている", choices: ["列に並んで待ちくたびれている","バスが来なくて困っている","遊園地のアトラクションを待っている","レジが混んでいるのを見ている","受付で手続きを待っている"], audio: "audio/q01.mp3", expl: "「twenty minutes already」と既に20分待っていることと、「Ugh」という不満の声から、長時間待ちくたびれている状態が判明する。", kp: ["the line is so long","been standing here"] },
   { diff: "lv1", axis: "context", text: "Can you turn that down a little? I'm trying to get some sleep.", ja: "ちょっと音量下げてくれない？寝ようとしてるんだけど。", answer: "音がうるさくて眠れないと訴えている", choices: ["音がうるさくて眠れないと訴えている","テレビのボリュームを上げようとしている","隣人に静かにするよう頼んでいる","子どもに早く寝るよう言っている","音楽を変えてほしいとお願いしている"], audio: "audio/q02.mp3", expl: "「turn that down」は音量を下げるという意味で、「trying to get some sleep」と組み合わせることで、音がうるさくて眠れない状況が伝わる。", kp: ["turn that down","trying to get some sleep"] },
@@ -732,72 +732,72 @@ const DATA = [
   { diff: "lv4", axis: "speed", text: "So I getcha, the venue locked us out 'cause the deposit cleared too late. Now we're scrambling to find somewhere for forty people with two weeks out.", ja: "つまり、デポジットの着金が遅れて会場に締め出されたってこと？40人の場所を2週間で探し直さないといけない。", answer: "入金遅延で会場が使えなくなり、急いで別会場を探している", choices: ["入金遅延で会場が使えなくなり、急いで別会場を探している","会場側が追加料金を要求しているため交渉している","イベントの人数が増えたため会場変更を検討している","会場の鍵を紛失して入れなかったと報告している","デポジットの返金を会場に求めている"], audio: "audio/q730.mp3", expl: "\"I getcha\" は \"I get you / I understand\" の速い発話形。\"cleared too late\" は入金処理が遅かったことを指し、\"scrambling\" から緊急の状況が伝わる。", kp: ["I getcha","scrambling to find somewhere"] },
   { diff: "lv4", axis: "reduction", text: "I dunno how we're s'posed to finalize the speaker lineup when the event coordinator's been outta office for a week an' nobody else has the authority to sign off on the contracts.", ja: "コーディネーターが1週間不在で、他に契約を承認できる人もいないのに、どうやって登壇者を確定しろってんだ。", answer: "担当者不在と承認権限の問題で登壇者確定が止まっていると嘆いている", choices: ["担当者不在と承認権限の問題で登壇者確定が止まっていると嘆いている","イベントのスピーカーを自分で選ぼうとしている","コーディネーターに早く帰ってきてほしいと頼んでいる","契約書の内容に異議を唱えている","イベント自体をキャンセルしようと提案している"], audio: "audio/q731.mp3", expl: "\"s'posed to\" は \"supposed to\" の短縮形、\"outta\" は \"out of\" の音変化。契約承認者が不在なため業務が止まっているという職場の困難を訴えている。", kp: ["s'posed to finalize","nobody else has the authority to sign off"] },
   { diff: "lv5", axis: "speed", text: "Look, I toldja this'd happen — the wholething's been limping along for months an' nobody wanted to call it, an' now we're staring down a deadline with half the deliverables still outstanding an' the client already breathing down our necks.", ja: "だから言ったじゃないか、こうなるって。何ヶ月もガタガタのまま誰も認めようとしなかった。今じゃ納品物の半分も未完成なのに締め切りが迫って、クライアントにも催促されてる。", answer: "問題を放置した結果、締め切り直前に多くの未完成タスクとクライアントの圧力に直面していると訴えている", choices: ["問題を放置した結果、締め切り直前に多くの未完成タスクとクライアントの圧力に直面していると訴えている","クライアントからの要件変更によって締め切りが延びたと説明している","プロジェクトの成功を祝いながら課題を振り返っている","チームメンバーに残業をお願いしている","締め切りの延長をクライアントに交渉しようと提案している"], audio: "audio/q732.mp3", expl: "\"toldja\" は \"told you\" の速い発話形、\"wholething's\" はリンキングで繋がった形。\"limping along\"（ダメなまま続く）\"breathing down our necks\"（プレッシャーをかける）などの慣用句が重なり、高難度の聴き取りになっている。", kp: ["toldja this'd happen","breathing down our necks"] },
-  { diff: "lv5", axis: "speed", text: "Aright, so I'm tryna figure out if we're still on for the thing on Sunday or if everyone's just gonna bail like last time.", ja: "日曜日の件がどうなるか、また全員すっぽかすのか確認しようとしてる。", answer: "日曜の集まりが実現するか心配している", choices: ["日曜の集まりが実現するか心配している", "日曜日の予定をキャンセルしたいと言っている", "先週みんなに迷惑をかけたと謝っている", "日曜日に用事ができて行けないと伝えている", "集まりの時間や場所を確認しようとしている"], audio: "audio/q733.mp3", expl: "「tryna figure out」（trying to figure out）と「gonna bail」（すっぽかす）が速い口調で崩れており、前回の件から今回の集まりへの不安を表現している。", kp: ["tryna figure out", "gonna bail like last time"] },
-  { diff: "lv5", axis: "reduction", text: "Shoulda told 'im sooner. Woulda saved us a lotta trouble if we'da just been upfront from the get-go.", ja: "もっと早く彼に言うべきだった。最初から正直にしていれば面倒を避けられた。", answer: "最初から正直に話すべきだったと後悔している", choices: ["最初から正直に話すべきだったと後悔している", "相手の不誠実な態度に怒っている", "問題を早期に発見できなかったと嘆いている", "もっと早く助けを求めるべきだったと言っている", "誰かを責任者として指名すべきだったと提案している"], audio: "audio/q734.mp3", expl: "「Shoulda」「Woulda」「we'da」はそれぞれ should have / would have / we had の縮約形で、後悔を表す仮定法の連続が速く崩れている。", kp: ["Shoulda told 'im sooner", "from the get-go"] },
-  { diff: "lv5", axis: "vocab", text: "The whole negotiation went sideways the moment they started moving the goalposts. We're back to square one now.", ja: "交渉は相手が条件を変え始めた瞬間に崩れ、今は振り出しに戻った。", answer: "交渉が条件変更で破談になり最初からやり直しになった", choices: ["交渉が条件変更で破談になり最初からやり直しになった", "ゴールが設定されて交渉がようやく前進した", "交渉相手が途中で別のチームに交代した", "交渉の場所が変わり条件の見直しを求められた", "交渉が順調に進んだが最終段階で延期になった"], audio: "audio/q735.mp3", expl: "「moving the goalposts」は「条件・基準を後出しで変える」こと、「back to square one」は「振り出しに戻る」というイディオムで、どちらも語彙力がないと誤解しやすい。", kp: ["moving the goalposts", "back to square one"] },
-  { diff: "lv5", axis: "context", text: "Yeah, no, I get it. Really. You don't have to explain.", ja: "うん、わかってる。本当に。説明しなくていいよ。", answer: "表面上は理解を示しているが実際には傷ついている", choices: ["表面上は理解を示しているが実際には傷ついている", "相手の事情を完全に理解して納得している", "これ以上話し合うことを提案している", "相手の謝罪を素直に受け入れている", "今は忙しいのであとで話したいと言っている"], audio: "audio/q736.mp3", expl: "「Yeah, no」は表面上の同意と否定が混在するパターンで、「You don't have to explain」は口調・文脈によって冷たい拒絶や傷心を示す。トーンを読まないと表面の言葉に惑わされる。", kp: ["Yeah, no", "You don't have to explain"] },
-  { diff: "lv5", axis: "distractor", text: "I'm not saying it's your fault, but someone's gotta take ownership of this mess.", ja: "あなたのせいとは言わないけど、誰かがこの混乱に責任を持たないといけない。", answer: "責任者が誰もいない問題を暗に誰かに押しつけようとしている", choices: ["責任者が誰もいない問題を暗に誰かに押しつけようとしている", "自分が責任を取ると申し出ている", "相手のミスを直接指摘して謝罪を求めている", "チーム全体で問題を共有すべきだと言っている", "問題はすでに誰かが解決済みだと伝えている"], audio: "audio/q737.mp3", expl: "「I'm not saying it's your fault」と言いながら「someone's gotta take ownership」と続けることで、相手に暗示的に責任を向けている。表面的な否定に惑わされる典型的なパターン。", kp: ["I'm not saying it's your fault", "take ownership"] },
-  { diff: "lv5", axis: "speed", text: "Yknow, I was thinkin' we'd just driveover, grabba quick bite, an' be back b'fore eight, but now it's lookin' like it's gonna be way later than that.", ja: "ドライブして軽く食事して8時前に戻れると思ってたけど、もっと遅くなりそう。", answer: "当初の予定より帰りが大幅に遅くなりそうだと言っている", choices: ["当初の予定より帰りが大幅に遅くなりそうだと言っている", "8時までに食事の予約を取ってほしいと頼んでいる", "ドライブは中止にして家で食べようと提案している", "8時に戻れるよう急ぐつもりだと言っている", "外食ではなく近所で済ませようと言っている"], audio: "audio/q738.mp3", expl: "「driveover」「grabba」「b'fore」など多数の音が脱落・連結されており、速度も速いためフレーズ全体の意味を追うことが難しい。", kp: ["b'fore eight", "way later than that"] },
-  { diff: "lv5", axis: "reduction", text: "Lemmie jus' double-check 'cause I coulda sworn we haddit scheduled for the fourteenth, not the fifteenth.", ja: "確認させて。14日に入れてたと思ってたんだけど、15日じゃなかったっけ。", answer: "スケジュールの日付を15日ではなく14日と記憶していた", choices: ["スケジュールの日付を15日ではなく14日と記憶していた", "15日の予定を14日に変更してほしいと頼んでいる", "スケジュールが確認できないので相手に聞いている", "14日と15日の両方に予定が入っていると言っている", "14日の予定がキャンセルされたことに気づいていない"], audio: "audio/q739.mp3", expl: "「Lemmie jus'」「coulda sworn」「haddit」は let me just / could have sworn / had it の縮約で、特に「coulda sworn」は「絶対〜だと思っていた」という確信の表現。", kp: ["coulda sworn", "haddit scheduled"] },
-  { diff: "lv5", axis: "vocab", text: "She really threw me under the bus in front of everyone. I can't believe she'd do that after everything I did for her.", ja: "彼女はみんなの前で私を犠牲にした。あれだけしてあげたのに信じられない。", answer: "恩のある相手にみんなの前で裏切られて怒っている", choices: ["恩のある相手にみんなの前で裏切られて怒っている", "バスの中で誰かに怒鳴られて動揺している", "失敗の原因を人のせいにされていると嘆いている", "誰かが自分の功績を横取りしたと訴えている", "友人関係がいつのまにか壊れていたことを知った"], audio: "audio/q740.mp3", expl: "「threw me under the bus」は「自分を守るために他人を犠牲にする・なすりつける」というイディオム。busを文字通りに解釈すると完全に誤読する。", kp: ["threw me under the bus", "after everything I did for her"] },
-  { diff: "lv5", axis: "context", text: "Oh, that's... great. Really. Must be nice.", ja: "へえ、それは…すごいね。本当に。いいね。", answer: "嫉妬や皮肉を込めた返答をしている", choices: ["嫉妬や皮肉を込めた返答をしている", "相手の知らせを心から喜んでいる", "もっと詳しく教えてほしいと興味を示している", "相手の成功に驚いて感動している", "自分も同じ経験があると共感を示している"], audio: "audio/q741.mp3", expl: "「That's... great.」の間や「Must be nice」という言い回しはトーンによって強い皮肉・羨望を表す。文字通りに読むと称賛に見えるが、感情的文脈が重要。", kp: ["Must be nice", "Really（間を置いた言い方）"] },
-  { diff: "lv5", axis: "distractor", text: "Look, I hear you. I totally do. But the numbers just aren't there yet.", ja: "言いたいことはわかる。本当に。でもまだ数字が伴っていない。", answer: "相手の意見は認めつつも承認できないと断っている", choices: ["相手の意見は認めつつも承認できないと断っている", "データの収集方法について相手に助言している", "数字の計算ミスを指摘して修正を求めている", "相手の提案に完全に同意して前進しようとしている", "もう少し時間をくれれば数字を揃えると約束している"], audio: "audio/q742.mp3", expl: "「I hear you」は同意ではなく「言っていることはわかる」という共感の表現。「But the numbers just aren't there yet」で却下していることが真意で、誤答と紛らわしい構造。", kp: ["I hear you", "the numbers just aren't there yet"] },
-  { diff: "lv5", axis: "speed", text: "I dunno man, I mean I toldim we'd handleit but now I'm not sure we can pull it off by Friday without more resources.", ja: "対応するって言っちゃったけど、リソースなしに金曜までに終わらせる自信がない。", answer: "金曜の締め切りに間に合わせられるか自信がなくなっている", choices: ["金曜の締め切りに間に合わせられるか自信がなくなっている", "リソース不足について金曜日に上司に報告すると言っている", "自分では対応できないので別の人に頼むべきだと言っている", "チームに金曜の締め切りを延ばすよう依頼するつもりだ", "リソースを確保できれば金曜に余裕で終わると言っている"], audio: "audio/q743.mp3", expl: "「toldim」「handleit」はそれぞれ told him / handle it の連結で、速いテンポで発話されているため分解が難しい。文脈から約束と不安の両立を読み取る必要がある。", kp: ["toldim we'd handleit", "pull it off by Friday"] },
-  { diff: "lv5", axis: "reduction", text: "Kinda feels like we're jus' spinnin' our wheels at this point, y'know? Gotta figure out a way forward.", ja: "このままでは空回りしてる気がする。前に進む方法を考えないといけない。", answer: "進展がなく努力が無駄になっていると感じている", choices: ["進展がなく努力が無駄になっていると感じている", "車のタイヤが滑って動けない状況を説明している", "仕事のやり方を根本から変える必要があると訴えている", "もっとペースを落として慎重に進むべきだと言っている", "前に進みたいが誰も協力してくれないと嘆いている"], audio: "audio/q744.mp3", expl: "「spinnin' our wheels」は「空回りする・無駄な努力をする」というイディオムで、reduction（spinnin'）とイディオムが重なって難度が高い。", kp: ["spinnin' our wheels", "Gotta figure out a way forward"] },
-  { diff: "lv5", axis: "vocab", text: "He always manages to talk out of both sides of his mouth. You never know where he actually stands.", ja: "彼はいつも両面をしゃべる。本当の立場が全くわからない。", answer: "矛盾したことを言う人物で本音がつかめないと言っている", choices: ["矛盾したことを言う人物で本音がつかめないと言っている", "他人の話を盗み聞きする癖がある人を批判している", "口数が多すぎて要点がわからない人について話している", "どちらの立場にも立てる柔軟な人を称賛している", "二つの言語を使い分けて話す能力を説明している"], audio: "audio/q745.mp3", expl: "「talk out of both sides of his mouth」は「二枚舌を使う・矛盾したことを言う」という慣用句。物理的な意味に取ると完全に誤解する。", kp: ["both sides of his mouth", "where he actually stands"] },
-  { diff: "lv5", axis: "context", text: "Don't worry about me. I'll be fine. I always am.", ja: "私のことは心配しないで。大丈夫だから。いつもそうだもの。", answer: "強がっているが実際には助けを必要としている", choices: ["強がっているが実際には助けを必要としている", "自分は問題ないので別の人を助けるよう促している", "心配してくれた相手に純粋に感謝している", "自立していることを誇りに思って話している", "過去の困難を乗り越えた経験を話している"], audio: "audio/q746.mp3", expl: "「I always am」という付け加えが感情の疲れや孤立感を示す文脈的サイン。表面的には平静だが「いつも一人でやってきた」という諦めが滲む。", kp: ["I'll be fine", "I always am"] },
-  { diff: "lv5", axis: "distractor", text: "To be honest, I thought it was a long shot, but I figured it couldn't hurt to try.", ja: "正直あまり期待していなかったけど、やってみても損はないと思った。", answer: "成功する見込みは低かったが試みる価値はあると判断した", choices: ["成功する見込みは低かったが試みる価値はあると判断した", "遠距離なので実行は難しいと最初からあきらめていた", "失敗しても傷つかないと思って軽い気持ちで挑戦した", "努力すれば必ず成功すると信じていたと言っている", "長い時間がかかると予想して早めに準備を始めた"], audio: "audio/q747.mp3", expl: "「long shot」は「成功の見込みが薄い試み」を意味し、「it couldn't hurt to try」は「やってみて損はない」という表現。どちらも字義通りとは異なる意味を持つ。", kp: ["long shot", "it couldn't hurt to try"] },
-  { diff: "lv5", axis: "speed", text: "Wejus' gotta push through this week an' thenit'll slowdown — at least that's what I keep tellin' myself.", ja: "今週さえ乗り越えれば落ち着くはず…と自分に言い聞かせてる。", answer: "忙しい状況が続いており半ば自分に言い聞かせている", choices: ["忙しい状況が続いており半ば自分に言い聞かせている", "来週から仕事のペースを落とす計画を立てている", "今週中に全ての仕事を終わらせると宣言している", "自分を励ます言葉を相手にもかけようとしている", "チームに今週だけ残業するよう頼んでいる"], audio: "audio/q748.mp3", expl: "「Wejus'」は We just の連結、「thenit'll」は then it'll の速い縮約。「at least that's what I keep tellin' myself」で、信じ切れていない本音が出ている。", kp: ["push through this week", "keep tellin' myself"] },
-  { diff: "lv5", axis: "reduction", text: "I wanna say somethin' but I dunno how it's gonna come across. Last thing I need is for it to blow up in my face.", ja: "何か言いたいけど、どう受け取られるかわからない。逆効果になるのが一番怖い。", answer: "発言が誤解されて状況が悪化することを恐れている", choices: ["発言が誤解されて状況が悪化することを恐れている", "爆発物の近くにいて怖いと話している", "誰かへの本音を直接伝えるべきか迷っている", "会議で発言する機会がもらえず困っていると言っている", "自分の言葉が録音されていないか心配している"], audio: "audio/q749.mp3", expl: "「come across」は「（言葉が）どう伝わるか」という表現、「blow up in my face」は「裏目に出る・逆効果になる」というイディオムで、reductionも重なって難度が高い。", kp: ["come across", "blow up in my face"] },
-  { diff: "lv5", axis: "vocab", text: "They strung us along for months with vague promises and then just pulled the plug without any warning.", ja: "何ヶ月も曖昧な約束でつなぎとめておいて、突然打ち切られた。", answer: "漠然とした約束で引き延ばされた末に突然契約を打ち切られた", choices: ["漠然とした約束で引き延ばされた末に突然契約を打ち切られた", "長い準備期間の末にプロジェクトが承認された", "何ヶ月もかけて交渉し最終的に合意に至った", "プラグを抜いたことで機器が壊れたと報告している", "曖昧な説明のまま一方的に引っ越しを命じられた"], audio: "audio/q750.mp3", expl: "「strung us along」は「期待を持たせながら引き延ばす」、「pulled the plug」は「突然中止にする」という慣用句。両方とも比喩的意味が核心。", kp: ["strung us along", "pulled the plug"] },
-  { diff: "lv5", axis: "context", text: "Oh, you didn't have to do that. Really.", ja: "そんなことしてくれなくてよかったのに。本当に。", answer: "予想外の親切に照れつつ喜んでいる", choices: ["予想外の親切に照れつつ喜んでいる", "してほしくなかったことをされて怒っている", "行動が余計だったと相手をたしなめている", "相手の行動に困惑して断っている", "感謝の気持ちがなく形式的に返事している"], audio: "audio/q751.mp3", expl: "「You didn't have to do that」はトーンによって「そこまでしてくれなくていいのに（嬉しい）」という感謝・照れになる。文字通りに「すべきでなかった」と読むと誤解する。", kp: ["You didn't have to do that", "Really（柔らかいトーン）"] },
-  { diff: "lv5", axis: "distractor", text: "I'm not one to complain, but this is the third week in a row. Something has to change.", ja: "文句を言うタイプじゃないけど、3週連続はさすがにきつい。何か変えないといけない。", answer: "我慢強い性格だが限界に達して変化を求めている", choices: ["我慢強い性格だが限界に達して変化を求めている", "自分はいつも不満を口にしないと自慢している", "3週間同じことが続いているが特に問題はないと言っている", "何かを変えようとしているが誰も協力しないと嘆いている", "今週で3週連続の目標を達成したと喜んでいる"], audio: "audio/q752.mp3", expl: "「I'm not one to complain」は「私は普段文句を言わない」という前置きで、この後に不満を述べることで強調効果を生む。前半だけ聞くと真逆の印象を受ける。", kp: ["I'm not one to complain", "third week in a row"] },
-  { diff: "lv5", axis: "speed", text: "So basically what happened was, I getthere an' nobody's around, the lights're off, an' I'm like — wait, did I get the wrong day?", ja: "行ってみたら誰もいなくて電気も消えてて、「日にち間違えた？」ってなった。", answer: "到着したら誰もおらず自分が日付を間違えたか疑った", choices: ["到着したら誰もおらず自分が日付を間違えたか疑った", "停電が原因でイベントが中止になったと説明している", "自分が最初に会場に着いたので照明をつけたと言っている", "日程の変更を事前に知らされなかったと怒っている", "会場に着いたら鍵がかかっていて入れなかった"], audio: "audio/q753.mp3", expl: "「getthere」は get there の速い連結、「lights're off」も lights are の縮約。「I'm like」は口語的な「〜と思った」の表現で、全体がくだけた速度で流れる。", kp: ["getthere", "did I get the wrong day"] },
-  { diff: "lv5", axis: "reduction", text: "I woulda gone with you if I'da known you were gonna be there. Nobodytoldme.", ja: "あなたが来るって知ってたら一緒に行ったのに。誰も教えてくれなかった。", answer: "事前に知らされていれば一緒に行けたと残念に思っている", choices: ["事前に知らされていれば一緒に行けたと残念に思っている", "自分が情報を伝え忘れたことを謝っている", "一緒に行けなかったことを相手のせいにして怒っている", "次回は必ず一緒に行くと約束している", "なぜ誰も連絡をくれないのか全員に不満をぶつけている"], audio: "audio/q754.mp3", expl: "「woulda」「I'da」はそれぞれ would have / I had の縮約で仮定法を形成、「Nobodytoldme」は Nobody told me の素早い連結発音。", kp: ["woulda gone", "I'da known"] },
-  { diff: "lv5", axis: "vocab", text: "We really need to stop beating around the bush. Let's just lay our cards on the table and figure this out.", ja: "遠回しにするのはやめよう。全部正直に話して解決しよう。", answer: "遠回しな態度をやめて率直に話し合うことを求めている", choices: ["遠回しな態度をやめて率直に話し合うことを求めている", "カードゲームのルールについて説明しようとしている", "問題の周辺にある小さな課題を先に片付けようとしている", "全員で意見を出し合ってアイデアを整理しようと提案している", "重要な情報を隠している相手に開示を求めている"], audio: "audio/q755.mp3", expl: "「beating around the bush」は「遠回しにする」、「lay our cards on the table」は「手の内を明かす・率直に話す」という慣用句で、両方知らないと誤解しやすい。", kp: ["beating around the bush", "lay our cards on the table"] },
-  { diff: "lv5", axis: "context", text: "Hey, no pressure or anything. Take all the time you need.", ja: "プレッシャーじゃないけど。時間はいくらでも取って。", answer: "言葉と裏腹に急がせていることが行間から伝わる", choices: ["言葉と裏腹に急がせていることが行間から伝わる", "純粋に相手のペースを尊重している", "締め切りはないので急がなくていいと伝えている", "自分が待てる状況であることを説明している", "相手にリラックスして仕事に取り組むよう励ましている"], audio: "audio/q756.mp3", expl: "「No pressure or anything」と言いつつ「Take all the time you need」と続ける文脈は、しばしばやんわりとした催促として機能する。トーンや状況から真意を読み取る必要がある。", kp: ["No pressure or anything", "Take all the time you need"] },
-  { diff: "lv5", axis: "distractor", text: "Honestly, between you and me, I think they made the right call even if nobody wants to admit it.", ja: "正直、ここだけの話、誰も認めたくないけどあの判断は正しかったと思う。", answer: "公には言いにくいが内心では決断が正しかったと思っている", choices: ["公には言いにくいが内心では決断が正しかったと思っている", "みんなが正しいと言っているので自分も同意している", "二人で話し合って正しい判断を下したと喜んでいる", "誰も正しい選択をしなかったと批判している", "公式には正しいとされているが個人的には反対している"], audio: "audio/q757.mp3", expl: "「between you and me」は「ここだけの話」という内緒の前置き、「even if nobody wants to admit it」が主観的評価をさらに限定する。表面的な構文が複数の誤読を誘う。", kp: ["between you and me", "even if nobody wants to admit it"] },
-  { diff: "lv5", axis: "speed", text: "Aright, so didja talk to the rep or are we jus' gonna sit on this 'til it blows up inna our faces again?", ja: "担当者と話したの？またぐずぐずして問題が爆発するまで待つつもり？", answer: "担当者に連絡したか急かしている", choices: ["担当者に連絡したか急かしている", "担当者がミスを謝罪している", "会議をキャンセルしようとしている", "問題の原因を担当者のせいにしている", "担当者を褒めてフォローしている"], audio: "audio/q758.mp3", expl: "\"didja\"はdid you、\"jus'\"はjust、\"inna\"はinto theの縮約。話者は相手に担当者へ連絡したか確認しつつ、対処しなければ問題が再発すると警告している。", kp: ["didja talk to the rep", "sit on this 'til it blows up"] },
-  { diff: "lv5", axis: "speed", text: "I mean c'mon, we'rea team, aintwe? So why's everyone actin' like they dunno whatsa goin' on?", ja: "チームなのに、なんで全員わかってないふりをしてるの？", answer: "チームなのに誰も責任を取らないと不満を言っている", choices: ["チームなのに誰も責任を取らないと不満を言っている", "チームの成果を褒めてまとめようとしている", "チームの方針を新メンバーに説明している", "プロジェクトの進捗報告を求めている", "チームを解散させると宣言している"], audio: "audio/q759.mp3", expl: "\"we'rea\"はwe are a、\"aintwe\"はaren't we、\"whatsa goin' on\"はwhat's going onの連続した崩れ。話者はチームの連帯責任を問いながら、誰も把握していないふりをしていることへの苛立ちを表している。", kp: ["c'mon, we'rea team", "actin' like they dunno"] },
-  { diff: "lv5", axis: "speed", text: "Yknow, if weda caught it earlier we'da never been ina position we're in now. Thas all I'm sayin'.", ja: "もっと早く気づいてれば、今みたいな状況にはなってなかったのに。それだけ言いたいわけ。", answer: "早期発見できていれば現状の問題は防げたと後悔している", choices: ["早期発見できていれば現状の問題は防げたと後悔している", "今の状況は誰かの故意のミスだと断言している", "問題を発見した自分を褒めている", "現状に満足していて特に問題ないと伝えている", "チームの対応を今後変えると宣言している"], audio: "audio/q760.mp3", expl: "\"weda\"はwe would have、\"we'da\"はwe would have、\"ina\"はin aの急速な縮約。後悔を示しつつも「これ以上は言わない」という締めくくりのトーンが重要。", kp: ["weda caught it earlier", "we'da never been ina position"] },
-  { diff: "lv5", axis: "speed", text: "Basically whatit comes downto is nobody wantsta own it, so it jus' keeps gettin' kicked downna road.", ja: "要するに、誰も責任取りたくないから、ずっと先送りにされ続けてるわけ。", answer: "責任の所在が曖昧なまま問題が先送りされていると指摘している", choices: ["責任の所在が曖昧なまま問題が先送りされていると指摘している", "問題を解決した担当者を称賛している", "締め切りを延長することを提案している", "チームが協力して問題を分担していると評価している", "新しいリーダーを任命するよう求めている"], audio: "audio/q761.mp3", expl: "\"whatit comes downto\"はwhat it comes down to、\"wantsta\"はwants to、\"downna\"はdown theの音が連結・脱落。\"kicked down the road\"は「先送り」という重要イディオム。", kp: ["wantsta own it", "kicked downna road"] },
-  { diff: "lv5", axis: "speed", text: "Look, I toldja we'dn'ta gone through with it if I'da known it was gonna turn out like this. That's on them, not us.", ja: "こうなるってわかってたらそんなこと進めなかったって言ったじゃないか。あっちの責任であって、こっちのじゃない。", answer: "もし結果を知っていたら実行しなかったと弁明している", choices: ["もし結果を知っていたら実行しなかったと弁明している", "相手側の決断を全面的に支持していた過去を述べている", "自分たちが問題を引き起こしたと認めている", "相手に結果を事前に知らせなかったことを謝罪している", "今後は相手に全て任せると宣言している"], audio: "audio/q762.mp3", expl: "\"toldja\"はtold you、\"we'dn'ta\"はwe wouldn't have、\"I'da known\"はI'd have knownの三重の縮約。責任転嫁のトーンを文脈から読み取る必要がある。", kp: ["I'da known it was gonna turn out like this", "That's on them, not us"] },
-  { diff: "lv5", axis: "speed", text: "So getthis — they finally got back to us but now they're sayin' the whole deal's contingent on somethin' we can't even deliverby the deadline.", ja: "聞いてよ、向こうからやっと連絡来たと思ったら、期限までに対応不可能な条件が付いてきたんだよ。", answer: "相手から返事が来たが実現不可能な条件が提示されたと報告している", choices: ["相手から返事が来たが実現不可能な条件が提示されたと報告している", "交渉が成立し全ての条件に合意できたと喜んでいる", "相手からの連絡が途絶えたことを心配している", "締め切りを自分たちの都合で延ばしてほしいと頼んでいる", "相手の提示した条件が非常に好条件だと驚いている"], audio: "audio/q763.mp3", expl: "\"getthis\"はget this（「聞いてくれ」という導入表現）、\"deliverby\"はdeliver byの音連結。話者の落胆と困惑のトーンが「実現不可能な条件」という正解の根拠。", kp: ["get this", "contingent on somethin' we can't even deliverby the deadline"] },
-  { diff: "lv5", axis: "reduction", text: "Gonna hafta loop in compliance before we go any further — otherwise we're just askin' for trouble.", ja: "これ以上進む前にコンプライアンス部門を巻き込まないと、面倒なことになるよ。", answer: "進める前にコンプライアンス部門を関与させる必要があると言っている", choices: ["進める前にコンプライアンス部門を関与させる必要があると言っている", "コンプライアンス違反の責任を相手に押し付けようとしている", "コンプライアンス部門への報告を省略しても問題ないと言っている", "コンプライアンスの問題は既に解決済みだと報告している", "法務部門との連携をこれからやめると提案している"], audio: "audio/q764.mp3", expl: "\"gonna hafta\"はgoing to have toの縮約。\"loop in\"は「関与させる」というビジネス英語のイディオム。\"askin' for trouble\"は「わざわざ問題を招く」という慣用句。", kp: ["gonna hafta loop in", "askin' for trouble"] },
-  { diff: "lv5", axis: "reduction", text: "Kinda wanna bring it up but dunno if it's gonna go down well with the higher-ups, y'know?", ja: "提起したい気持ちはあるけど、上層部に受け入れられるかどうかわからなくて。", answer: "上層部の反応を恐れて問題提起をためらっている", choices: ["上層部の反応を恐れて問題提起をためらっている", "上層部から提案を却下されたことを報告している", "部下に意見を述べるよう促している", "上層部と良好な関係を築けていると喜んでいる", "会議での発言内容を事前に上司に確認している"], audio: "audio/q765.mp3", expl: "\"kinda wanna\"はkind of want to、\"dunno\"はdon't know、\"go down well\"は「うまく受け入れられる」という慣用句。話者の躊躇と不安が正解の根拠。", kp: ["kinda wanna bring it up", "go down well with the higher-ups"] },
-  { diff: "lv5", axis: "reduction", text: "I'm s'posed to be heading this up but lemme be real — I dunno the first thing about running a project this size.", ja: "自分がこれを取り仕切る立場なんだけど、正直言って、これだけ大きなプロジェクトの運営なんて全くわからない。", answer: "リーダー役を任されたが経験不足で困惑していると本音を語っている", choices: ["リーダー役を任されたが経験不足で困惑していると本音を語っている", "大規模プロジェクトの経験を買われてリーダーに選ばれた", "プロジェクトを辞退するつもりだと上司に伝えている", "部下のスキル不足を上司に報告している", "新しいプロジェクト管理ツールの導入を提案している"], audio: "audio/q766.mp3", expl: "\"s'posed to\"はsupposed to、\"lemme be real\"はlet me be realの縮約。\"don't know the first thing about\"は「〜について全く知らない」という強調イディオム。", kp: ["s'posed to be heading this up", "dunno the first thing about"] },
-  { diff: "lv5", axis: "reduction", text: "Honestly, wanna just cut our losses and walk away from the whole thing before it gets any worse.", ja: "正直、これ以上悪化する前に損切りして手を引いた方がいいと思う。", answer: "状況が悪化する前に撤退する方が得策だと提案している", choices: ["状況が悪化する前に撤退する方が得策だと提案している", "損失の原因を徹底的に調査するよう求めている", "より多くの資源を投入して状況を改善すべきだと言っている", "これ以上の損失は出ないと楽観的に見込んでいる", "相手側に損失の補填を要求しようとしている"], audio: "audio/q767.mp3", expl: "\"wanna\"はwant to、\"cut our losses\"は「損切りする・これ以上の損失を防ぐために撤退する」というビジネスイディオム。話者の諦めのトーンが重要。", kp: ["wanna cut our losses", "walk away from the whole thing"] },
-  { diff: "lv5", axis: "reduction", text: "Dunno how we're s'posed to keep everyone motivated when the goalposts keep movin' an' nobody's tellin' us why.", ja: "ゴールポストが動き続けて、理由も説明されない中でどうやってみんなのモチベーションを保てというんだか。", answer: "目標が頻繁に変わり説明もなくチームの士気維持が困難だと訴えている", choices: ["目標が頻繁に変わり説明もなくチームの士気維持が困難だと訴えている", "チームのモチベーションが非常に高く順調だと報告している", "新しい目標設定の方法を提案している", "目標の変更について上司に謝罪している", "チームに方針変更を直接説明するよう上司に求めている"], audio: "audio/q768.mp3", expl: "\"dunno\"はdon't know、\"s'posed to\"はsupposed to、\"movin'\"はmovingの音変化。\"goalposts keep moving\"は「目標や基準が頻繁に変わる」という重要なイディオム。", kp: ["s'posed to keep everyone motivated", "goalposts keep movin'"] },
-  { diff: "lv5", axis: "reduction", text: "Lemme put it this way — if we hadda do it all over again, we'da done things very differently from the start.", ja: "こう言わせてもらうと、もしやり直せるなら最初から全く違うやり方をしてたと思う。", answer: "振り返ると最初から別のアプローチを取るべきだったと反省している", choices: ["振り返ると最初から別のアプローチを取るべきだったと反省している", "今のやり方で正解だったと確信を持って語っている", "次のプロジェクトでも同じ手順を踏むつもりだと言っている", "他のチームのやり方を参考にすべきだと提案している", "過去の成功体験を誇らしげに振り返っている"], audio: "audio/q769.mp3", expl: "\"lemme\"はlet me、\"hadda\"はhad to、\"we'da\"はwe would haveの縮約。\"put it this way\"は「こう言えば」という前置き表現。後悔と反省のトーンが正解の鍵。", kp: ["lemme put it this way", "we'da done things very differently"] },
-  { diff: "lv5", axis: "vocab", text: "At this point I think we need to just bite the bullet and have the difficult conversation, even if it ruffles some feathers.", ja: "もうここまで来たら、多少波風が立っても、覚悟を決めて難しい話し合いをするしかないと思う。", answer: "覚悟を決めて摩擦を恐れずに困難な話し合いをすべきだと主張している", choices: ["覚悟を決めて摩擦を恐れずに困難な話し合いをすべきだと主張している", "議論を避けて問題をうやむやにするよう提案している", "難しい会話は専門家に任せるべきだと言っている", "全員が合意するまで話し合いを延期すべきだと言っている", "過去の困難な交渉を振り返って反省している"], audio: "audio/q770.mp3", expl: "\"bite the bullet\"は「覚悟を決める・歯を食いしばる」、\"ruffle some feathers\"は「波風を立てる・人を怒らせる」という慣用句。両方のイディオムを理解しないと正解できない。", kp: ["bite the bullet", "ruffles some feathers"] },
-  { diff: "lv5", axis: "vocab", text: "She's been flying under the radar for months, but sooner or later someone's gonna call her out on it.", ja: "彼女はずっと目立たないようにやってきたけど、遅かれ早かれ誰かに指摘されるよ。", answer: "目立たず問題を避けてきた人が遅かれ早かれ指摘されると述べている", choices: ["目立たず問題を避けてきた人が遅かれ早かれ指摘されると述べている", "彼女が長期出張から戻ってきたことを報告している", "彼女が航空会社に不当に扱われたと憤慨している", "彼女の優れた業績が社内で評価されていると喜んでいる", "彼女が会議での発言を控えているのは謙虚さゆえだと擁護している"], audio: "audio/q771.mp3", expl: "\"fly under the radar\"は「目立たずに問題を回避する」、\"call someone out\"は「公に指摘する・追及する」という重要スラング。ニュアンスを誤解すると誤答を選びやすい。", kp: ["flying under the radar", "call her out on it"] },
-  { diff: "lv5", axis: "vocab", text: "I get that we're strapped for cash, but gutting the training budget is just robbing Peter to pay Paul.", ja: "資金難なのはわかるけど、研修予算を大幅削減するのは、結局どこかにしわ寄せが行くだけだよ。", answer: "研修予算削減は一時しのぎで別の問題を生むだけだと警告している", choices: ["研修予算削減は一時しのぎで別の問題を生むだけだと警告している", "研修費を削減して資金難を解消すべきだと提案している", "ピーターとポールという社員が資金を横領したと報告している", "研修の費用対効果が低く廃止を検討すべきだと言っている", "外部資金調達で研修予算を補填できると楽観視している"], audio: "audio/q772.mp3", expl: "\"strapped for cash\"は「資金難の」、\"gutting\"は「大幅に削減する」、\"robbing Peter to pay Paul\"は「一方の問題を解決するために別の問題を作る」という慣用句。", kp: ["strapped for cash", "robbing Peter to pay Paul"] },
-  { diff: "lv5", axis: "vocab", text: "That was a real watershed moment for the team — things were never quite the same after that.", ja: "チームにとってあれは本当に転換点だった。あれ以降、何もかもがそれまでとは違ってしまった。", answer: "チームにとって大きな転換点となった出来事について話している", choices: ["チームにとって大きな転換点となった出来事について話している", "チームが川での研修で絆を深めたことを振り返っている", "チームの業績が急激に悪化した原因を分析している", "チームが解散する前の最後の会議を回想している", "チームが初めて目標を達成した喜びを語っている"], audio: "audio/q773.mp3", expl: "\"watershed moment\"は「重大な転換点・分岐点」という比喩的表現で、川（watershed）の地理的意味と混同しやすい。直後の\"things were never quite the same\"がニュアンスの確認に役立つ。", kp: ["watershed moment", "never quite the same after that"] },
-  { diff: "lv5", axis: "vocab", text: "I don't wanna be the one to rain on your parade, but the timeline you're proposing is completely unrealistic.", ja: "水を差したくはないんだけど、あなたが提案しているスケジュールは全く現実的じゃないよ。", answer: "相手の計画に水を差すようで悪いが現実的でないと伝えている", choices: ["相手の計画に水を差すようで悪いが現実的でないと伝えている", "雨天でのイベント中止をやむなく告げている", "相手の提案するスケジュールが優れていると褒めている", "タイムラインを自分が全面的に修正すると申し出ている", "相手の計画への賛同を保留したまま詳細を聞こうとしている"], audio: "audio/q774.mp3", expl: "\"rain on your parade\"は「水を差す・喜びを台無しにする」というイディオム。\"I don't wanna be the one to\"という前置きが批判を和らげようとするトーンを示している。", kp: ["rain on your parade", "completely unrealistic"] },
-  { diff: "lv5", axis: "vocab", text: "We've been going around in circles on this for weeks. Someone needs to just draw a line in the sand.", ja: "何週間もこれで堂々巡りしてる。誰かがはっきり一線を引かないといけない。", answer: "議論が堂々巡りで誰かが明確な立場を示す必要があると主張している", choices: ["議論が堂々巡りで誰かが明確な立場を示す必要があると主張している", "砂浜での会議を終わらせて室内に戻るよう促している", "議題を変えてもっと建設的な話し合いをしようと提案している", "全員が賛成するまで議論を続けるべきだと言っている", "チームが問題を一緒に解決しようと前向きに取り組んでいると評価している"], audio: "audio/q775.mp3", expl: "\"going around in circles\"は「堂々巡りをする」、\"draw a line in the sand\"は「明確な限界・立場を示す」という慣用句。どちらも文字通りに解釈すると誤答になる。", kp: ["going around in circles", "draw a line in the sand"] },
-  { diff: "lv5", axis: "context", text: "Oh. You're here earlier than I expected. The... uh... living room's a bit of a state right now. Sorry.", ja: "あ、思ったより早かったね。えっと……リビングがちょっと散らかってて。ごめんね。", answer: "突然の訪問に慌てて家の散らかりを謝罪している", choices: ["突然の訪問に慌てて家の散らかりを謝罪している", "仕事が早く終わったことを嬉しそうに報告している", "リビングの改装が完成したことを誇らしげに披露している", "早めに来てもらったことへの感謝を伝えている", "部屋の掃除を相手に手伝ってほしいと頼んでいる"], audio: "audio/q776.mp3", expl: "\"a bit of a state\"は「散らかった・乱れた状態」というイギリス英語的表現。\"earlier than I expected\"と語尾の\"Sorry\"から、驚きと慌てた様子を読み取る必要がある。", kp: ["earlier than I expected", "a bit of a state"] },
-  { diff: "lv5", axis: "context", text: "No, it's fine. It's completely fine. I'm fine. You don't need to apologize.", ja: "大丈夫、全然大丈夫。私は大丈夫だから。謝らなくていいよ。", answer: "傷ついているがそれを隠して大丈夫だと繰り返している", choices: ["傷ついているがそれを隠して大丈夫だと繰り返している", "本当に問題がなく謝罪は不要だと率直に伝えている", "相手の謝罪を受け入れて仲直りしようとしている", "感情的になっている相手を落ち着かせようとしている", "謝罪を受け入れるための条件を提示している"], audio: "audio/q777.mp3", expl: "\"fine\"を三回繰り返すことで、実際は傷ついているが強がっているというトーンを文脈から読み取る必要がある。表面的な意味で解釈すると正反対の選択肢を選びやすい。", kp: ["completely fine", "You don't need to apologize"] },
-  { diff: "lv5", axis: "context", text: "Ha. Yeah. I mean... sure. If that's what you think happened, then... sure.", ja: "はは。そうだね。まあ……そうかな。そう思うんならそれで……いいんじゃない。", answer: "相手の解釈に不満だが皮肉をこめて表面上は同意している", choices: ["相手の解釈に不満だが皮肉をこめて表面上は同意している", "相手の見方に心から同意して話を締めくくっている", "相手が言ったことを正確に理解できず確認している", "自分のミスを認めて謝罪しようとしている", "相手の説明に感心して素直に賞賛している"], audio: "audio/q778.mp3", expl: "\"If that's what you think happened\"という条件節と、\"sure\"の繰り返しが不満と皮肉のトーンを示す。声のトーンと文脈を読まなければ純粋な同意と誤解しやすい。", kp: ["If that's what you think happened", "then... sure"] },
-  { diff: "lv5", axis: "context", text: "Oh, don't worry about me. I'll manage. I always do. You go ahead.", ja: "私のことは気にしないで。なんとかなるから。いつもそうしてきたし。先に行って。", answer: "負担を押し付けられているが自己犠牲的に引き受けようとしている", choices: ["負担を押し付けられているが自己犠牲的に引き受けようとしている", "体調が優れず先に帰るよう相手に伝えている", "何も問題がなく自分で全てうまく処理できると自信満々に言っている", "相手の心配を素直に感謝して励ましている", "次回は自分が先に行く番だと順番を確認している"], audio: "audio/q779.mp3", expl: "\"I'll manage. I always do\"の繰り返しと\"You go ahead\"は、自己犠牲と軽い悲しみのトーンを持つ。純粋に問題ないと言っているように聞こえるが、文脈上は複雑な感情が込められている。", kp: ["I'll manage. I always do", "You go ahead"] },
-  { diff: "lv5", axis: "context", text: "Well, that's... unexpected. I honestly don't know what to say. Wow.", ja: "それは……予想外だったな。正直、何て言えばいいかわからない。すごいね。", answer: "驚きのあまり言葉が出ず複雑な感情を抱いている", choices: ["驚きのあまり言葉が出ず複雑な感情を抱いている", "相手の話に全く興味が持てず無視しようとしている", "嬉しいニュースを聞いて純粋に喜んでいる", "相手のプレゼンに対し率直なフィードバックを求めている", "驚いた理由を相手に詳しく説明しようとしている"], audio: "audio/q780.mp3", expl: "\"unexpected\"、\"I don't know what to say\"、\"Wow\"の組み合わせから強い驚きと複雑な感情が読み取れる。ポジティブかネガティブかは文脈によって異なるため、「複雑な感情」という正解が最も適切。", kp: ["that's... unexpected", "I don't know what to say"] },
-  { diff: "lv5", axis: "speed", text: "Aright, so I getcha — you're sayin' the whole rollout's on ice 'til legal clears it, but nobody's bothered tellin' the dev team yet, an' they're just sittin' there spinnin' their wheels. Someone's gotta loop 'em in before this blows up.", ja: "分かった、要するにリリース全体が法務の承認待ちで止まってるのに、開発チームには誰も伝えてないんでしょ。誰かが知らせないとまずいよ。", answer: "法務の承認を待つ間、開発チームに誰も連絡していない", choices: ["法務の承認を待つ間、開発チームに誰も連絡していない", "開発チームが自分たちで法務の問題を解決しようとしている", "リリースは既に完了したが、法務チームが事後確認中だ", "開発チームは問題を把握していて、法務の結果を静観している", "法務チームがリリースを中止するよう開発チームに直接指示した"], audio: "audio/q781.mp3", expl: "「on ice」は「保留中」、「loop 'em in」は「情報を共有する」の意。開発チームが何も知らされずに待機させられている状況を正確に把握できるかがポイント。", kp: ["on ice", "loop 'em in"] },
-  { diff: "lv5", axis: "reduction", text: "I dunno, I'm kinda thinkin' we shoulda pushed back harder when they first floated the idea, 'cause now we're basically hafta agree to terms that weren't anywhere near what we originally signed up for.", ja: "最初に案が出た時にもっと強く反対すべきだったよ。今や最初と全然違う条件を受け入れるしかなくなってる。", answer: "当初の合意とかけ離れた条件を受け入れざるを得ない状況だ", choices: ["当初の合意とかけ離れた条件を受け入れざるを得ない状況だ", "相手側の提案を最初から拒否していたので交渉が停滞している", "条件は変わっておらず、最初の合意がそのまま維持されている", "話者は新しい条件に満足しており、最初より良い結果になったと感じている", "相手が提示した条件を精査中で、まだ判断を保留している"], audio: "audio/q782.mp3", expl: "「shoulda pushed back」＝「反対すべきだった」、「hafta agree to terms」＝「条件に同意しなければならない」という短縮形と後悔のトーンを正確に聞き取ることがカギ。", kp: ["shoulda pushed back", "hafta agree to terms"] },
-  { diff: "lv5", axis: "vocab", text: "Honestly, the whole thing was a classic bait-and-switch. They reeled us in with the headline numbers and then buried the real costs in the small print. We should've done more due diligence before we signed.", ja: "完全に騙し売りだった。表向きの数字で引き寄せておいて、本当のコストは細かい文字で隠してあった。もっと事前調査をするべきだったね。", answer: "魅力的な条件で引きつけてから本当のコストを隠していた", choices: ["魅力的な条件で引きつけてから本当のコストを隠していた", "契約書の小さな誤字が原因で費用が予想外に高くなった", "相手方が誤った数字を誠意なく提示したが、すぐに謝罪し訂正した", "費用は最初から明示されていたが、話者が見落としていた", "広告の数字と実際のコストがほぼ一致しており、問題はなかった"], audio: "audio/q783.mp3", expl: "「bait-and-switch」は「おとり商法」、「due diligence」は「事前の十分な調査」を指すビジネス用語。これらのイディオムの意味を理解できるかが正解のカギ。", kp: ["bait-and-switch", "due diligence"] },
-  { diff: "lv5", axis: "context", text: "Oh, yeah. No, that's — that's a great idea. Really. Super excited about that.", ja: "ああ、うん。それは……それはすごくいいアイデアだね。本当に。すごく楽しみ。", answer: "話者は実際にはその提案に乗り気でない", choices: ["話者は実際にはその提案に乗り気でない", "話者は提案の内容を十分に理解できておらず困惑している", "話者は提案を心から支持しており、積極的に参加したい", "話者は提案には賛成だが、タイミングが悪いと感じている", "話者は提案に興奮しているが、実現は難しいと考えている"], audio: "audio/q784.mp3", expl: "「Really. Super excited.」という過剰なほどの相づちは、実は乗り気でないサインであることが多い。言葉の表面通りに受け取らず、わざとらしいトーンから感情を推測することが求められる。", kp: ["Really", "Super excited about that"] },
-  { diff: "lv5", axis: "distractor", text: "I'm not saying we should throw in the towel — I just think we need to take a step back and look at whether the juice is worth the squeeze at this point.", ja: "諦めろって言ってるわけじゃなくて、今の時点で労力に見合う成果が出るか、一歩引いて考える必要があると思う。", answer: "今の取り組みが労力に見合うか見直すべきだと提案している", choices: ["今の取り組みが労力に見合うか見直すべきだと提案している", "すでに限界を超えており、プロジェクトを中止すべきだと主張している", "チームが休憩を取り、エネルギーを回復させる必要があると言っている", "コスト削減のために作業の一部を外部に委託することを検討している", "搾りかすになるまで資源を使い切るべきだとアドバイスしている"], audio: "audio/q785.mp3", expl: "「throw in the towel」（諦める）を否定しているのに「諦める提案」と間違えやすく、「juice is worth the squeeze」（労力に見合う価値があるか）を文字通りに解釈させる誤答も混在させた。", kp: ["throw in the towel", "juice is worth the squeeze"] },
-  { diff: "lv5", axis: "speed", text: "Y'know, wejus' hadda sit through two hours of that an' for what? Nobody's gonna act on any of it anyway. Same song and dance every quarter.", ja: "ね、あれに2時間も付き合わされてさ、何のために? どうせ誰も動かないよ。毎四半期同じことの繰り返しだよ。", answer: "毎回同じ会議が繰り返されるが、何も実行されないと感じている", choices: ["毎回同じ会議が繰り返されるが、何も実行されないと感じている", "今回の会議は例外的に成果があり、次のアクションが決まった", "2時間の会議は長すぎたが、少なくとも重要な決定が下された", "話者は会議の内容を十分に理解できず、フォローアップが必要だと思っている", "四半期ごとに新しいテーマで会議が開かれており、今回も新鮮だった"], audio: "audio/q786.mp3", expl: "「Same song and dance」は「毎回同じことの繰り返し」というイディオム。「wejus' hadda」（we just had to）などの速い発話と合わせて、無力感・嫌気のトーンを聴き取れるかがカギ。", kp: ["same song and dance", "nobody's gonna act on any of it"] },
-  { diff: "lv5", axis: "reduction", text: "I coulda sworn I sentcha the updated version — lemme check my outbox 'cause if it gottcha wrong attachment that's gonna be a real problem before the pitch.", ja: "更新版を送ったと思ったんだけど——送信ボックス確認するね。もし間違った添付ファイルが届いてたら、プレゼン前に大問題だ。", answer: "正しいファイルが相手に届いているか確認しようとしている", choices: ["正しいファイルが相手に届いているか確認しようとしている", "添付ファイルを送り忘れたことに気づき、今すぐ送り直そうとしている", "相手がファイルを受け取ったことは確認済みで、内容の修正を依頼している", "プレゼンのために新しいバージョンを一から作り直す必要があると言っている", "送信したファイルに問題はなく、相手側の設定が原因だと思っている"], audio: "audio/q787.mp3", expl: "「coulda sworn」「lemme」「sentcha」「gottcha」などの大幅な音変化が連続する。「sentcha = sent you」「gottcha = got you / got to」と正確に復元しながら状況を把握することがカギ。", kp: ["coulda sworn I sentcha", "gottcha wrong attachment"] },
-  { diff: "lv5", axis: "vocab", text: "She's been a real dark horse in this whole process. Nobody gave her a second look at first, but she's completely run rings around the rest of the candidates.", ja: "このプロセスで彼女は完全なダークホースだったね。最初は誰も注目していなかったけど、他の候補者を圧倒したよ。", answer: "当初は注目されていなかった人物が他の候補を圧倒した", choices: ["当初は注目されていなかった人物が他の候補を圧倒した", "評判の高い候補者が予想外の失敗を犯し、選考から脱落した", "話者は彼女を最初から高く評価しており、結果に驚いていない", "すべての候補者が同水準で、最終的な判断が非常に難しかった", "彼女は面接で走り回るような積極的な行動で注目を集めた"], audio: "audio/q788.mp3", expl: "「dark horse」は「下馬評外の有力候補」、「run rings around」は「〜を大きく上回る・圧倒する」という慣用表現。後者を「走り回る」と文字通りに解釈させる誤答を含めた。", kp: ["dark horse", "run rings around"] },
-  { diff: "lv5", axis: "context", text: "Thanks. That means a lot. Really.", ja: "ありがとう。それはすごく嬉しいよ。本当に。", answer: "話者は心から感謝しており、言葉に深く感動している", choices: ["話者は心から感謝しており、言葉に深く感動している", "話者は感謝の気持ちを伝えているが、内心は迷惑に感じている", "話者は形式的に礼を言っているだけで、特に感情はない", "話者は相手の行動に驚いており、どう反応すべきか困惑している", "話者は皮肉を込めて言っており、本当は腹を立てている"], audio: "audio/q789.mp3", expl: "この問題は逆を狙った設問。短く静かな「Really.」という言葉が、感情を抑えながらも心に刺さった言葉への純粋な感謝を表すケースであることを、声のトーンと文脈から判断することが求められる。", kp: ["That means a lot", "Really"] },
-  { diff: "lv5", axis: "distractor", text: "Look, I hate to be the one to say it, but we've been kicking this can down the road for way too long. If we don't get ahead of it now, we're going to end up firefighting when it's already too late.", ja: "言いたくないけどさ、もうずっと問題を先送りしてきた。今手を打たないと、手遅れになってから対応することになるよ。", answer: "長期間先送りにしてきた問題に今すぐ対処すべきだと主張している", choices: ["長期間先送りにしてきた問題に今すぐ対処すべきだと主張している", "缶を道路に蹴り続けるという危険な行為をやめるよう注意している", "消防活動のような緊急対応に備えて事前準備を進めるべきだと言っている", "問題はすでに手遅れの段階に達しており、もはや対処不能だと述べている", "話者は自分が担当者でないため、あくまで他人事として意見を述べている"], audio: "audio/q790.mp3", expl: "「kicking the can down the road」は「問題を先送りにする」、「firefighting」は「緊急対応に追われる」という比喩表現。いずれも文字通りの意味と混同させる誤答を設けた。", kp: ["kicking this can down the road", "firefighting"] },
-  { diff: "lv5", axis: "vocab", text: "He's been stringing everybody along for months, dangling this so-called opportunity like a carrot. At this point, I think he's all talk and no action.", ja: "彼はずっとみんなを引っ張り回して、いわゆる「チャンス」をちらつかせてきた。もうただの口だけだと思う。", answer: "彼は口だけで実行力がないと思っている", choices: ["彼は口だけで実行力がないと思っている", "彼が長期間プロジェクトを主導してきたと感じている", "彼のチャンスに期待して待ち続けるつもりだ", "彼が全員を欺いていたことに驚いている", "彼はチームのモチベーションを高める存在だと思っている"], audio: "audio/q791.mp3", expl: "「all talk and no action」は「口だけで行動しない」というイディオム。「stringing along（引っ張り回す）」「dangling a carrot（えさをちらつかせる）」も合わせて状況を正確に把握する必要がある。", kp: ["all talk and no action", "stringing everybody along"] },
-  { diff: "lv5", axis: "speed", text: "Aright so didja endup talkin' t'the new supplier or are we jus' gonna keep stalling 'til the whole inventory situation blows up inna our faces?", ja: "で、新しいサプライヤーと話したの？それともまずいことになるまで先延ばしし続けるの？", answer: "新しいサプライヤーと交渉したかどうか聞いている", choices: ["新しいサプライヤーと交渉したかどうか聞いている", "在庫問題がすでに爆発的に悪化したと報告している", "サプライヤーとの契約を打ち切ることを提案している", "交渉を自分が代わりに引き受けると申し出ている", "在庫管理のやり方を根本から見直すべきだと言っている"], audio: "audio/q792.mp3", expl: "「didja endup talkin'」は「Did you end up talking」の速い発音。「blow up in our faces」は「事態が悪化して自分たちに跳ね返る」という意味のイディオム。", kp: ["didja endup talkin'", "blows up inna our faces"] },
-  { diff: "lv5", axis: "reduction", text: "I wanna get this sorted but lemme be real — we're kinda betweena rock an' a hard place here. There's no clean way outta this.", ja: "解決したいけど正直に言うと、進退両難の状況だよ。きれいな出口なんてない。", answer: "どちらを選んでも困難な板挟みの状態だと説明している", choices: ["どちらを選んでも困難な板挟みの状態だと説明している", "問題をすぐに解決できる具体的な方法を提案している", "この状況から完全に手を引きたいと言っている", "状況が思ったより簡単に解決できると楽観視している", "困難ではあるが一つの正しい選択肢があると示唆している"], audio: "audio/q793.mp3", expl: "「between a rock and a hard place」は「どちらを選んでも苦しい板挟み」というイディオム。「lemme be real」の縮約形と「kinda」の音変化も聴き取りのポイント。", kp: ["betweena rock an' a hard place", "lemme be real"] },
-  { diff: "lv5", axis: "context", text: "Oh, congrats. Really. That's... yeah, no, I'm happy for you. Totally.", ja: "あ、おめでとう。本当に。それは…うん、いや、嬉しいよ。全然。", answer: "本心では喜んでいないが表面上は祝福している", choices: ["本心では喜んでいないが表面上は祝福している", "相手の成功を心から喜んで祝福している", "何を祝えばいいのか状況が理解できずにいる", "相手の発言が信じられず戸惑っている", "おめでとうと言うべき場面ではないと気づいた"], audio: "audio/q794.mp3", expl: "「Really.」「Totally.」の間の「...yeah, no」というためらいと不自然な間が、本心では喜んでいないことを示す。トーンと間の取り方から感情を読み取る必要がある。", kp: ["yeah, no", "Totally（トーン）"] },
-  { diff: "lv5", axis: "distractor", text: "Look, I'm not trying to throw cold water on your idea, but have you actually stress-tested this against a worst-case scenario? Because if the bottom falls out, we're the ones left holding the bag.", ja: "水を差したいわけじゃないけど、最悪のケースで本当に検証した？底が抜けたら尻拭いをするのは私たちだよ。", answer: "アイデアに懸念を示しつつリスク検証を求めている", choices: ["アイデアに懸念を示しつつリスク検証を求めている", "アイデアに反対しており計画を中止するよう求めている", "最悪の事態が起きた場合に責任を取れないと言っている", "ストレステストの結果がすでに不合格だったと報告している", "リスク管理は他の部署の仕事だと主張している"], audio: "audio/q795.mp3", expl: "「throw cold water on」は「水を差す」、「holding the bag」は「責任を押し付けられる」の意。否定しているようで実は「検証をしてほしい」という提案であり、「反対・拒絶」と誤読しやすい。", kp: ["throw cold water on", "left holding the bag"] },
-  { diff: "lv5", axis: "vocab", text: "Honestly, she's been burning the candle at both ends for months. I'm not surprised she finally hit a wall. Something had to give.", ja: "正直、彼女はここ何ヶ月も無理を続けてきた。限界に達したのは驚くことじゃない。何かが崩れるしかなかった。", answer: "過労が続いた末に彼女が限界を迎えたのは当然だと思っている", choices: ["過労が続いた末に彼女が限界を迎えたのは当然だと思っている", "彼女が突然仕事を辞めたことに驚きを隠せないでいる", "彼女が燃え尽きる前にもっと早く助けるべきだったと後悔している", "彼女の成果がここ数ヶ月で著しく低下したと指摘している", "彼女に対して何か重大な変化が必要だと提案している"], audio: "audio/q796.mp3", expl: "「burning the candle at both ends」は「無理をして体を酷使する」、「hit a wall」は「限界に達する」、「something had to give」は「何かが限界を迎えるしかなかった」という意味のイディオム。", kp: ["burning the candle at both ends", "something had to give"] },
-  { diff: "lv5", axis: "speed", text: "Yknow, wejus' gottastop kiddin' ourselves — if the numbers aren't there by end'a next week, we're gonna hafta pull the plug whether we like it or not.", ja: "もう自分たちをごまかすのはやめないと。来週末までに数字が出なければ、好むと好まざるとにかかわらず打ち切りにしないといけない。", answer: "来週末までに成果が出なければ計画を中止すると言っている", choices: ["来週末までに成果が出なければ計画を中止すると言っている", "数字はすでに目標を達成しており次のステップに進める", "来週末の締め切りを延長するよう上司に掛け合うつもりだ", "計画を中止するかどうかをチーム全体で決めるべきだと言っている", "数字が悪い原因を来週中に特定しなければならないと言っている"], audio: "audio/q797.mp3", expl: "「wejus' gottastop」は「we just gotta stop」、「end'a」は「end of」の縮約。「pull the plug」は「計画・プロジェクトを打ち切る」という慣用句。", kp: ["pull the plug", "end'a next week"] },
-  { diff: "lv5", axis: "reduction", text: "I coulda sworn I toldja about the rescheduling, but lemme double-check 'cause if you'ren't in the loop that's on me.", ja: "日程変更のこと伝えたはずなんだけど、一応確認させて。知らせてなかったなら私のミスだから。", answer: "日程変更を伝えたか自信がなく自分の責任を認めている", choices: ["日程変更を伝えたか自信がなく自分の責任を認めている", "日程変更は確実に伝えたので相手の確認ミスだと言っている", "日程変更の連絡を相手に代わりにしてほしいと頼んでいる", "日程変更についての情報をまだ誰にも知らせていないと言っている", "スケジュールの混乱は別の人物が原因だと示唆している"], audio: "audio/q798.mp3", expl: "「coulda sworn」は「could have sworn（確かに〜したはずだ）」の縮約。「you'ren't in the loop」は「you aren't in the loop（情報を共有されていない）」の崩れた形。「that's on me」は「私のせいだ」。", kp: ["coulda sworn", "you'ren't in the loop"] },
-  { diff: "lv5", axis: "context", text: "Hm. Yeah. No, it looks... fine. It's fine. Honestly, it's great. You should go with it.", ja: "うーん、まあ。いや、…いいんじゃない。大丈夫だよ。本当に、いいと思う。それで行けばいい。", answer: "本当はよくないと思っているが相手に合わせて肯定している", choices: ["本当はよくないと思っているが相手に合わせて肯定している", "相手のアイデアを心から評価しており強く推薦している", "どちらでもよいので相手に判断を委ねている", "提案内容について詳しく聞かないと判断できないと言っている", "以前とは意見が変わり今は賛成していると伝えている"], audio: "audio/q799.mp3", expl: "「Hm」「Yeah. No」という曖昧な反応、「It's fine」の繰り返し、そして「You should go with it」の投げやりなトーンが、本心では乗り気でないことを示している。言葉の内容ではなくトーンと間から正解を導く問題。", kp: ["Yeah. No（トーン）", "It's fine（繰り返し）"] },
-  { diff: "lv5", axis: "distractor", text: "I'm not saying we should wash our hands of it entirely, but at some point we've gotta acknowledge that we've been flogging a dead horse here.", ja: "完全に手を引くべきだとは言っていないけど、どこかの時点で無駄な努力を続けてきたことを認めないといけない。", answer: "撤退はしないが効果のない取り組みを続けることに疑問を呈している", choices: ["撤退はしないが効果のない取り組みを続けることに疑問を呈している", "プロジェクトから完全に撤退することを提案している", "過去の努力がすべて無駄だったと結論づけている", "他のメンバーが十分な努力をしていないと批判している", "現状維持のままで問題ないと楽観的な見通しを示している"], audio: "audio/q800.mp3", expl: "「wash our hands of it」は「完全に手を引く」だが、話者は「not saying」と否定している。「flogging a dead horse」は「無駄な努力を続ける」の意。「撤退提案」と「効果への疑問」が混同しやすい典型的なdistractorパターン。", kp: ["wash our hands of it", "flogging a dead horse"] }
+  { diff: "lv5", axis: "speed", text: "Aright, so I'm tryna figure out if we're still on for the thing on Sunday or if everyone's just gonna bail like last time.", ja: "日曜日の件がどうなるか、また全員すっぽかすのか確認しようとしてる。", answer: "日曜の集まりが実現するか心配している", choices: ["日曜の集まりが実現するか心配している","日曜日の予定をキャンセルしたいと言っている","先週みんなに迷惑をかけたと謝っている","日曜日に用事ができて行けないと伝えている","集まりの時間や場所を確認しようとしている"], audio: "audio/q733.mp3", expl: "「tryna figure out」（trying to figure out）と「gonna bail」（すっぽかす）が速い口調で崩れており、前回の件から今回の集まりへの不安を表現している。", kp: ["tryna figure out","gonna bail like last time"] },
+  { diff: "lv5", axis: "reduction", text: "Shoulda told 'im sooner. Woulda saved us a lotta trouble if we'da just been upfront from the get-go.", ja: "もっと早く彼に言うべきだった。最初から正直にしていれば面倒を避けられた。", answer: "最初から正直に話すべきだったと後悔している", choices: ["最初から正直に話すべきだったと後悔している","相手の不誠実な態度に怒っている","問題を早期に発見できなかったと嘆いている","もっと早く助けを求めるべきだったと言っている","誰かを責任者として指名すべきだったと提案している"], audio: "audio/q734.mp3", expl: "「Shoulda」「Woulda」「we'da」はそれぞれ should have / would have / we had の縮約形で、後悔を表す仮定法の連続が速く崩れている。", kp: ["Shoulda told 'im sooner","from the get-go"] },
+  { diff: "lv5", axis: "vocab", text: "The whole negotiation went sideways the moment they started moving the goalposts. We're back to square one now.", ja: "交渉は相手が条件を変え始めた瞬間に崩れ、今は振り出しに戻った。", answer: "交渉が条件変更で破談になり最初からやり直しになった", choices: ["交渉が条件変更で破談になり最初からやり直しになった","ゴールが設定されて交渉がようやく前進した","交渉相手が途中で別のチームに交代した","交渉の場所が変わり条件の見直しを求められた","交渉が順調に進んだが最終段階で延期になった"], audio: "audio/q735.mp3", expl: "「moving the goalposts」は「条件・基準を後出しで変える」こと、「back to square one」は「振り出しに戻る」というイディオムで、どちらも語彙力がないと誤解しやすい。", kp: ["moving the goalposts","back to square one"] },
+  { diff: "lv5", axis: "context", text: "Yeah, no, I get it. Really. You don't have to explain.", ja: "うん、わかってる。本当に。説明しなくていいよ。", answer: "表面上は理解を示しているが実際には傷ついている", choices: ["表面上は理解を示しているが実際には傷ついている","相手の事情を完全に理解して納得している","これ以上話し合うことを提案している","相手の謝罪を素直に受け入れている","今は忙しいのであとで話したいと言っている"], audio: "audio/q736.mp3", expl: "「Yeah, no」は表面上の同意と否定が混在するパターンで、「You don't have to explain」は口調・文脈によって冷たい拒絶や傷心を示す。トーンを読まないと表面の言葉に惑わされる。", kp: ["Yeah, no","You don't have to explain"] },
+  { diff: "lv5", axis: "distractor", text: "I'm not saying it's your fault, but someone's gotta take ownership of this mess.", ja: "あなたのせいとは言わないけど、誰かがこの混乱に責任を持たないといけない。", answer: "責任者が誰もいない問題を暗に誰かに押しつけようとしている", choices: ["責任者が誰もいない問題を暗に誰かに押しつけようとしている","自分が責任を取ると申し出ている","相手のミスを直接指摘して謝罪を求めている","チーム全体で問題を共有すべきだと言っている","問題はすでに誰かが解決済みだと伝えている"], audio: "audio/q737.mp3", expl: "「I'm not saying it's your fault」と言いながら「someone's gotta take ownership」と続けることで、相手に暗示的に責任を向けている。表面的な否定に惑わされる典型的なパターン。", kp: ["I'm not saying it's your fault","take ownership"] },
+  { diff: "lv5", axis: "speed", text: "Yknow, I was thinkin' we'd just driveover, grabba quick bite, an' be back b'fore eight, but now it's lookin' like it's gonna be way later than that.", ja: "ドライブして軽く食事して8時前に戻れると思ってたけど、もっと遅くなりそう。", answer: "当初の予定より帰りが大幅に遅くなりそうだと言っている", choices: ["当初の予定より帰りが大幅に遅くなりそうだと言っている","8時までに食事の予約を取ってほしいと頼んでいる","ドライブは中止にして家で食べようと提案している","8時に戻れるよう急ぐつもりだと言っている","外食ではなく近所で済ませようと言っている"], audio: "audio/q738.mp3", expl: "「driveover」「grabba」「b'fore」など多数の音が脱落・連結されており、速度も速いためフレーズ全体の意味を追うことが難しい。", kp: ["b'fore eight","way later than that"] },
+  { diff: "lv5", axis: "reduction", text: "Lemmie jus' double-check 'cause I coulda sworn we haddit scheduled for the fourteenth, not the fifteenth.", ja: "確認させて。14日に入れてたと思ってたんだけど、15日じゃなかったっけ。", answer: "スケジュールの日付を15日ではなく14日と記憶していた", choices: ["スケジュールの日付を15日ではなく14日と記憶していた","15日の予定を14日に変更してほしいと頼んでいる","スケジュールが確認できないので相手に聞いている","14日と15日の両方に予定が入っていると言っている","14日の予定がキャンセルされたことに気づいていない"], audio: "audio/q739.mp3", expl: "「Lemmie jus'」「coulda sworn」「haddit」は let me just / could have sworn / had it の縮約で、特に「coulda sworn」は「絶対〜だと思っていた」という確信の表現。", kp: ["coulda sworn","haddit scheduled"] },
+  { diff: "lv5", axis: "vocab", text: "She really threw me under the bus in front of everyone. I can't believe she'd do that after everything I did for her.", ja: "彼女はみんなの前で私を犠牲にした。あれだけしてあげたのに信じられない。", answer: "恩のある相手にみんなの前で裏切られて怒っている", choices: ["恩のある相手にみんなの前で裏切られて怒っている","バスの中で誰かに怒鳴られて動揺している","失敗の原因を人のせいにされていると嘆いている","誰かが自分の功績を横取りしたと訴えている","友人関係がいつのまにか壊れていたことを知った"], audio: "audio/q740.mp3", expl: "「threw me under the bus」は「自分を守るために他人を犠牲にする・なすりつける」というイディオム。busを文字通りに解釈すると完全に誤読する。", kp: ["threw me under the bus","after everything I did for her"] },
+  { diff: "lv5", axis: "context", text: "Oh, that's... great. Really. Must be nice.", ja: "へえ、それは…すごいね。本当に。いいね。", answer: "嫉妬や皮肉を込めた返答をしている", choices: ["嫉妬や皮肉を込めた返答をしている","相手の知らせを心から喜んでいる","もっと詳しく教えてほしいと興味を示している","相手の成功に驚いて感動している","自分も同じ経験があると共感を示している"], audio: "audio/q741.mp3", expl: "「That's... great.」の間や「Must be nice」という言い回しはトーンによって強い皮肉・羨望を表す。文字通りに読むと称賛に見えるが、感情的文脈が重要。", kp: ["Must be nice","Really（間を置いた言い方）"] },
+  { diff: "lv5", axis: "distractor", text: "Look, I hear you. I totally do. But the numbers just aren't there yet.", ja: "言いたいことはわかる。本当に。でもまだ数字が伴っていない。", answer: "相手の意見は認めつつも承認できないと断っている", choices: ["相手の意見は認めつつも承認できないと断っている","データの収集方法について相手に助言している","数字の計算ミスを指摘して修正を求めている","相手の提案に完全に同意して前進しようとしている","もう少し時間をくれれば数字を揃えると約束している"], audio: "audio/q742.mp3", expl: "「I hear you」は同意ではなく「言っていることはわかる」という共感の表現。「But the numbers just aren't there yet」で却下していることが真意で、誤答と紛らわしい構造。", kp: ["I hear you","the numbers just aren't there yet"] },
+  { diff: "lv5", axis: "speed", text: "I dunno man, I mean I toldim we'd handleit but now I'm not sure we can pull it off by Friday without more resources.", ja: "対応するって言っちゃったけど、リソースなしに金曜までに終わらせる自信がない。", answer: "金曜の締め切りに間に合わせられるか自信がなくなっている", choices: ["金曜の締め切りに間に合わせられるか自信がなくなっている","リソース不足について金曜日に上司に報告すると言っている","自分では対応できないので別の人に頼むべきだと言っている","チームに金曜の締め切りを延ばすよう依頼するつもりだ","リソースを確保できれば金曜に余裕で終わると言っている"], audio: "audio/q743.mp3", expl: "「toldim」「handleit」はそれぞれ told him / handle it の連結で、速いテンポで発話されているため分解が難しい。文脈から約束と不安の両立を読み取る必要がある。", kp: ["toldim we'd handleit","pull it off by Friday"] },
+  { diff: "lv5", axis: "reduction", text: "Kinda feels like we're jus' spinnin' our wheels at this point, y'know? Gotta figure out a way forward.", ja: "このままでは空回りしてる気がする。前に進む方法を考えないといけない。", answer: "進展がなく努力が無駄になっていると感じている", choices: ["進展がなく努力が無駄になっていると感じている","車のタイヤが滑って動けない状況を説明している","仕事のやり方を根本から変える必要があると訴えている","もっとペースを落として慎重に進むべきだと言っている","前に進みたいが誰も協力してくれないと嘆いている"], audio: "audio/q744.mp3", expl: "「spinnin' our wheels」は「空回りする・無駄な努力をする」というイディオムで、reduction（spinnin'）とイディオムが重なって難度が高い。", kp: ["spinnin' our wheels","Gotta figure out a way forward"] },
+  { diff: "lv5", axis: "vocab", text: "He always manages to talk out of both sides of his mouth. You never know where he actually stands.", ja: "彼はいつも両面をしゃべる。本当の立場が全くわからない。", answer: "矛盾したことを言う人物で本音がつかめないと言っている", choices: ["矛盾したことを言う人物で本音がつかめないと言っている","他人の話を盗み聞きする癖がある人を批判している","口数が多すぎて要点がわからない人について話している","どちらの立場にも立てる柔軟な人を称賛している","二つの言語を使い分けて話す能力を説明している"], audio: "audio/q745.mp3", expl: "「talk out of both sides of his mouth」は「二枚舌を使う・矛盾したことを言う」という慣用句。物理的な意味に取ると完全に誤解する。", kp: ["both sides of his mouth","where he actually stands"] },
+  { diff: "lv5", axis: "context", text: "Don't worry about me. I'll be fine. I always am.", ja: "私のことは心配しないで。大丈夫だから。いつもそうだもの。", answer: "強がっているが実際には助けを必要としている", choices: ["強がっているが実際には助けを必要としている","自分は問題ないので別の人を助けるよう促している","心配してくれた相手に純粋に感謝している","自立していることを誇りに思って話している","過去の困難を乗り越えた経験を話している"], audio: "audio/q746.mp3", expl: "「I always am」という付け加えが感情の疲れや孤立感を示す文脈的サイン。表面的には平静だが「いつも一人でやってきた」という諦めが滲む。", kp: ["I'll be fine","I always am"] },
+  { diff: "lv5", axis: "distractor", text: "To be honest, I thought it was a long shot, but I figured it couldn't hurt to try.", ja: "正直あまり期待していなかったけど、やってみても損はないと思った。", answer: "成功する見込みは低かったが試みる価値はあると判断した", choices: ["成功する見込みは低かったが試みる価値はあると判断した","遠距離なので実行は難しいと最初からあきらめていた","失敗しても傷つかないと思って軽い気持ちで挑戦した","努力すれば必ず成功すると信じていたと言っている","長い時間がかかると予想して早めに準備を始めた"], audio: "audio/q747.mp3", expl: "「long shot」は「成功の見込みが薄い試み」を意味し、「it couldn't hurt to try」は「やってみて損はない」という表現。どちらも字義通りとは異なる意味を持つ。", kp: ["long shot","it couldn't hurt to try"] },
+  { diff: "lv5", axis: "speed", text: "Wejus' gotta push through this week an' thenit'll slowdown — at least that's what I keep tellin' myself.", ja: "今週さえ乗り越えれば落ち着くはず…と自分に言い聞かせてる。", answer: "忙しい状況が続いており半ば自分に言い聞かせている", choices: ["忙しい状況が続いており半ば自分に言い聞かせている","来週から仕事のペースを落とす計画を立てている","今週中に全ての仕事を終わらせると宣言している","自分を励ます言葉を相手にもかけようとしている","チームに今週だけ残業するよう頼んでいる"], audio: "audio/q748.mp3", expl: "「Wejus'」は We just の連結、「thenit'll」は then it'll の速い縮約。「at least that's what I keep tellin' myself」で、信じ切れていない本音が出ている。", kp: ["push through this week","keep tellin' myself"] },
+  { diff: "lv5", axis: "reduction", text: "I wanna say somethin' but I dunno how it's gonna come across. Last thing I need is for it to blow up in my face.", ja: "何か言いたいけど、どう受け取られるかわからない。逆効果になるのが一番怖い。", answer: "発言が誤解されて状況が悪化することを恐れている", choices: ["発言が誤解されて状況が悪化することを恐れている","爆発物の近くにいて怖いと話している","誰かへの本音を直接伝えるべきか迷っている","会議で発言する機会がもらえず困っていると言っている","自分の言葉が録音されていないか心配している"], audio: "audio/q749.mp3", expl: "「come across」は「（言葉が）どう伝わるか」という表現、「blow up in my face」は「裏目に出る・逆効果になる」というイディオムで、reductionも重なって難度が高い。", kp: ["come across","blow up in my face"] },
+  { diff: "lv5", axis: "vocab", text: "They strung us along for months with vague promises and then just pulled the plug without any warning.", ja: "何ヶ月も曖昧な約束でつなぎとめておいて、突然打ち切られた。", answer: "漠然とした約束で引き延ばされた末に突然契約を打ち切られた", choices: ["漠然とした約束で引き延ばされた末に突然契約を打ち切られた","長い準備期間の末にプロジェクトが承認された","何ヶ月もかけて交渉し最終的に合意に至った","プラグを抜いたことで機器が壊れたと報告している","曖昧な説明のまま一方的に引っ越しを命じられた"], audio: "audio/q750.mp3", expl: "「strung us along」は「期待を持たせながら引き延ばす」、「pulled the plug」は「突然中止にする」という慣用句。両方とも比喩的意味が核心。", kp: ["strung us along","pulled the plug"] },
+  { diff: "lv5", axis: "context", text: "Oh, you didn't have to do that. Really.", ja: "そんなことしてくれなくてよかったのに。本当に。", answer: "予想外の親切に照れつつ喜んでいる", choices: ["予想外の親切に照れつつ喜んでいる","してほしくなかったことをされて怒っている","行動が余計だったと相手をたしなめている","相手の行動に困惑して断っている","感謝の気持ちがなく形式的に返事している"], audio: "audio/q751.mp3", expl: "「You didn't have to do that」はトーンによって「そこまでしてくれなくていいのに（嬉しい）」という感謝・照れになる。文字通りに「すべきでなかった」と読むと誤解する。", kp: ["You didn't have to do that","Really（柔らかいトーン）"] },
+  { diff: "lv5", axis: "distractor", text: "I'm not one to complain, but this is the third week in a row. Something has to change.", ja: "文句を言うタイプじゃないけど、3週連続はさすがにきつい。何か変えないといけない。", answer: "我慢強い性格だが限界に達して変化を求めている", choices: ["我慢強い性格だが限界に達して変化を求めている","自分はいつも不満を口にしないと自慢している","3週間同じことが続いているが特に問題はないと言っている","何かを変えようとしているが誰も協力しないと嘆いている","今週で3週連続の目標を達成したと喜んでいる"], audio: "audio/q752.mp3", expl: "「I'm not one to complain」は「私は普段文句を言わない」という前置きで、この後に不満を述べることで強調効果を生む。前半だけ聞くと真逆の印象を受ける。", kp: ["I'm not one to complain","third week in a row"] },
+  { diff: "lv5", axis: "speed", text: "So basically what happened was, I getthere an' nobody's around, the lights're off, an' I'm like — wait, did I get the wrong day?", ja: "行ってみたら誰もいなくて電気も消えてて、「日にち間違えた？」ってなった。", answer: "到着したら誰もおらず自分が日付を間違えたか疑った", choices: ["到着したら誰もおらず自分が日付を間違えたか疑った","停電が原因でイベントが中止になったと説明している","自分が最初に会場に着いたので照明をつけたと言っている","日程の変更を事前に知らされなかったと怒っている","会場に着いたら鍵がかかっていて入れなかった"], audio: "audio/q753.mp3", expl: "「getthere」は get there の速い連結、「lights're off」も lights are の縮約。「I'm like」は口語的な「〜と思った」の表現で、全体がくだけた速度で流れる。", kp: ["getthere","did I get the wrong day"] },
+  { diff: "lv5", axis: "reduction", text: "I woulda gone with you if I'da known you were gonna be there. Nobodytoldme.", ja: "あなたが来るって知ってたら一緒に行ったのに。誰も教えてくれなかった。", answer: "事前に知らされていれば一緒に行けたと残念に思っている", choices: ["事前に知らされていれば一緒に行けたと残念に思っている","自分が情報を伝え忘れたことを謝っている","一緒に行けなかったことを相手のせいにして怒っている","次回は必ず一緒に行くと約束している","なぜ誰も連絡をくれないのか全員に不満をぶつけている"], audio: "audio/q754.mp3", expl: "「woulda」「I'da」はそれぞれ would have / I had の縮約で仮定法を形成、「Nobodytoldme」は Nobody told me の素早い連結発音。", kp: ["woulda gone","I'da known"] },
+  { diff: "lv5", axis: "vocab", text: "We really need to stop beating around the bush. Let's just lay our cards on the table and figure this out.", ja: "遠回しにするのはやめよう。全部正直に話して解決しよう。", answer: "遠回しな態度をやめて率直に話し合うことを求めている", choices: ["遠回しな態度をやめて率直に話し合うことを求めている","カードゲームのルールについて説明しようとしている","問題の周辺にある小さな課題を先に片付けようとしている","全員で意見を出し合ってアイデアを整理しようと提案している","重要な情報を隠している相手に開示を求めている"], audio: "audio/q755.mp3", expl: "「beating around the bush」は「遠回しにする」、「lay our cards on the table」は「手の内を明かす・率直に話す」という慣用句で、両方知らないと誤解しやすい。", kp: ["beating around the bush","lay our cards on the table"] },
+  { diff: "lv5", axis: "context", text: "Hey, no pressure or anything. Take all the time you need.", ja: "プレッシャーじゃないけど。時間はいくらでも取って。", answer: "言葉と裏腹に急がせていることが行間から伝わる", choices: ["言葉と裏腹に急がせていることが行間から伝わる","純粋に相手のペースを尊重している","締め切りはないので急がなくていいと伝えている","自分が待てる状況であることを説明している","相手にリラックスして仕事に取り組むよう励ましている"], audio: "audio/q756.mp3", expl: "「No pressure or anything」と言いつつ「Take all the time you need」と続ける文脈は、しばしばやんわりとした催促として機能する。トーンや状況から真意を読み取る必要がある。", kp: ["No pressure or anything","Take all the time you need"] },
+  { diff: "lv5", axis: "distractor", text: "Honestly, between you and me, I think they made the right call even if nobody wants to admit it.", ja: "正直、ここだけの話、誰も認めたくないけどあの判断は正しかったと思う。", answer: "公には言いにくいが内心では決断が正しかったと思っている", choices: ["公には言いにくいが内心では決断が正しかったと思っている","みんなが正しいと言っているので自分も同意している","二人で話し合って正しい判断を下したと喜んでいる","誰も正しい選択をしなかったと批判している","公式には正しいとされているが個人的には反対している"], audio: "audio/q757.mp3", expl: "「between you and me」は「ここだけの話」という内緒の前置き、「even if nobody wants to admit it」が主観的評価をさらに限定する。表面的な構文が複数の誤読を誘う。", kp: ["between you and me","even if nobody wants to admit it"] },
+  { diff: "lv5", axis: "speed", text: "Aright, so didja talk to the rep or are we jus' gonna sit on this 'til it blows up inna our faces again?", ja: "担当者と話したの？またぐずぐずして問題が爆発するまで待つつもり？", answer: "担当者に連絡したか急かしている", choices: ["担当者に連絡したか急かしている","担当者がミスを謝罪している","会議をキャンセルしようとしている","問題の原因を担当者のせいにしている","担当者を褒めてフォローしている"], audio: "audio/q758.mp3", expl: "\"didja\"はdid you、\"jus'\"はjust、\"inna\"はinto theの縮約。話者は相手に担当者へ連絡したか確認しつつ、対処しなければ問題が再発すると警告している。", kp: ["didja talk to the rep","sit on this 'til it blows up"] },
+  { diff: "lv5", axis: "speed", text: "I mean c'mon, we'rea team, aintwe? So why's everyone actin' like they dunno whatsa goin' on?", ja: "チームなのに、なんで全員わかってないふりをしてるの？", answer: "チームなのに誰も責任を取らないと不満を言っている", choices: ["チームなのに誰も責任を取らないと不満を言っている","チームの成果を褒めてまとめようとしている","チームの方針を新メンバーに説明している","プロジェクトの進捗報告を求めている","チームを解散させると宣言している"], audio: "audio/q759.mp3", expl: "\"we'rea\"はwe are a、\"aintwe\"はaren't we、\"whatsa goin' on\"はwhat's going onの連続した崩れ。話者はチームの連帯責任を問いながら、誰も把握していないふりをしていることへの苛立ちを表している。", kp: ["c'mon, we'rea team","actin' like they dunno"] },
+  { diff: "lv5", axis: "speed", text: "Yknow, if weda caught it earlier we'da never been ina position we're in now. Thas all I'm sayin'.", ja: "もっと早く気づいてれば、今みたいな状況にはなってなかったのに。それだけ言いたいわけ。", answer: "早期発見できていれば現状の問題は防げたと後悔している", choices: ["早期発見できていれば現状の問題は防げたと後悔している","今の状況は誰かの故意のミスだと断言している","問題を発見した自分を褒めている","現状に満足していて特に問題ないと伝えている","チームの対応を今後変えると宣言している"], audio: "audio/q760.mp3", expl: "\"weda\"はwe would have、\"we'da\"はwe would have、\"ina\"はin aの急速な縮約。後悔を示しつつも「これ以上は言わない」という締めくくりのトーンが重要。", kp: ["weda caught it earlier","we'da never been ina position"] },
+  { diff: "lv5", axis: "speed", text: "Basically whatit comes downto is nobody wantsta own it, so it jus' keeps gettin' kicked downna road.", ja: "要するに、誰も責任取りたくないから、ずっと先送りにされ続けてるわけ。", answer: "責任の所在が曖昧なまま問題が先送りされていると指摘している", choices: ["責任の所在が曖昧なまま問題が先送りされていると指摘している","問題を解決した担当者を称賛している","締め切りを延長することを提案している","チームが協力して問題を分担していると評価している","新しいリーダーを任命するよう求めている"], audio: "audio/q761.mp3", expl: "\"whatit comes downto\"はwhat it comes down to、\"wantsta\"はwants to、\"downna\"はdown theの音が連結・脱落。\"kicked down the road\"は「先送り」という重要イディオム。", kp: ["wantsta own it","kicked downna road"] },
+  { diff: "lv5", axis: "speed", text: "Look, I toldja we'dn'ta gone through with it if I'da known it was gonna turn out like this. That's on them, not us.", ja: "こうなるってわかってたらそんなこと進めなかったって言ったじゃないか。あっちの責任であって、こっちのじゃない。", answer: "もし結果を知っていたら実行しなかったと弁明している", choices: ["もし結果を知っていたら実行しなかったと弁明している","相手側の決断を全面的に支持していた過去を述べている","自分たちが問題を引き起こしたと認めている","相手に結果を事前に知らせなかったことを謝罪している","今後は相手に全て任せると宣言している"], audio: "audio/q762.mp3", expl: "\"toldja\"はtold you、\"we'dn'ta\"はwe wouldn't have、\"I'da known\"はI'd have knownの三重の縮約。責任転嫁のトーンを文脈から読み取る必要がある。", kp: ["I'da known it was gonna turn out like this","That's on them, not us"] },
+  { diff: "lv5", axis: "speed", text: "So getthis — they finally got back to us but now they're sayin' the whole deal's contingent on somethin' we can't even deliverby the deadline.", ja: "聞いてよ、向こうからやっと連絡来たと思ったら、期限までに対応不可能な条件が付いてきたんだよ。", answer: "相手から返事が来たが実現不可能な条件が提示されたと報告している", choices: ["相手から返事が来たが実現不可能な条件が提示されたと報告している","交渉が成立し全ての条件に合意できたと喜んでいる","相手からの連絡が途絶えたことを心配している","締め切りを自分たちの都合で延ばしてほしいと頼んでいる","相手の提示した条件が非常に好条件だと驚いている"], audio: "audio/q763.mp3", expl: "\"getthis\"はget this（「聞いてくれ」という導入表現）、\"deliverby\"はdeliver byの音連結。話者の落胆と困惑のトーンが「実現不可能な条件」という正解の根拠。", kp: ["get this","contingent on somethin' we can't even deliverby the deadline"] },
+  { diff: "lv5", axis: "reduction", text: "Gonna hafta loop in compliance before we go any further — otherwise we're just askin' for trouble.", ja: "これ以上進む前にコンプライアンス部門を巻き込まないと、面倒なことになるよ。", answer: "進める前にコンプライアンス部門を関与させる必要があると言っている", choices: ["進める前にコンプライアンス部門を関与させる必要があると言っている","コンプライアンス違反の責任を相手に押し付けようとしている","コンプライアンス部門への報告を省略しても問題ないと言っている","コンプライアンスの問題は既に解決済みだと報告している","法務部門との連携をこれからやめると提案している"], audio: "audio/q764.mp3", expl: "\"gonna hafta\"はgoing to have toの縮約。\"loop in\"は「関与させる」というビジネス英語のイディオム。\"askin' for trouble\"は「わざわざ問題を招く」という慣用句。", kp: ["gonna hafta loop in","askin' for trouble"] },
+  { diff: "lv5", axis: "reduction", text: "Kinda wanna bring it up but dunno if it's gonna go down well with the higher-ups, y'know?", ja: "提起したい気持ちはあるけど、上層部に受け入れられるかどうかわからなくて。", answer: "上層部の反応を恐れて問題提起をためらっている", choices: ["上層部の反応を恐れて問題提起をためらっている","上層部から提案を却下されたことを報告している","部下に意見を述べるよう促している","上層部と良好な関係を築けていると喜んでいる","会議での発言内容を事前に上司に確認している"], audio: "audio/q765.mp3", expl: "\"kinda wanna\"はkind of want to、\"dunno\"はdon't know、\"go down well\"は「うまく受け入れられる」という慣用句。話者の躊躇と不安が正解の根拠。", kp: ["kinda wanna bring it up","go down well with the higher-ups"] },
+  { diff: "lv5", axis: "reduction", text: "I'm s'posed to be heading this up but lemme be real — I dunno the first thing about running a project this size.", ja: "自分がこれを取り仕切る立場なんだけど、正直言って、これだけ大きなプロジェクトの運営なんて全くわからない。", answer: "リーダー役を任されたが経験不足で困惑していると本音を語っている", choices: ["リーダー役を任されたが経験不足で困惑していると本音を語っている","大規模プロジェクトの経験を買われてリーダーに選ばれた","プロジェクトを辞退するつもりだと上司に伝えている","部下のスキル不足を上司に報告している","新しいプロジェクト管理ツールの導入を提案している"], audio: "audio/q766.mp3", expl: "\"s'posed to\"はsupposed to、\"lemme be real\"はlet me be realの縮約。\"don't know the first thing about\"は「〜について全く知らない」という強調イディオム。", kp: ["s'posed to be heading this up","dunno the first thing about"] },
+  { diff: "lv5", axis: "reduction", text: "Honestly, wanna just cut our losses and walk away from the whole thing before it gets any worse.", ja: "正直、これ以上悪化する前に損切りして手を引いた方がいいと思う。", answer: "状況が悪化する前に撤退する方が得策だと提案している", choices: ["状況が悪化する前に撤退する方が得策だと提案している","損失の原因を徹底的に調査するよう求めている","より多くの資源を投入して状況を改善すべきだと言っている","これ以上の損失は出ないと楽観的に見込んでいる","相手側に損失の補填を要求しようとしている"], audio: "audio/q767.mp3", expl: "\"wanna\"はwant to、\"cut our losses\"は「損切りする・これ以上の損失を防ぐために撤退する」というビジネスイディオム。話者の諦めのトーンが重要。", kp: ["wanna cut our losses","walk away from the whole thing"] },
+  { diff: "lv5", axis: "reduction", text: "Dunno how we're s'posed to keep everyone motivated when the goalposts keep movin' an' nobody's tellin' us why.", ja: "ゴールポストが動き続けて、理由も説明されない中でどうやってみんなのモチベーションを保てというんだか。", answer: "目標が頻繁に変わり説明もなくチームの士気維持が困難だと訴えている", choices: ["目標が頻繁に変わり説明もなくチームの士気維持が困難だと訴えている","チームのモチベーションが非常に高く順調だと報告している","新しい目標設定の方法を提案している","目標の変更について上司に謝罪している","チームに方針変更を直接説明するよう上司に求めている"], audio: "audio/q768.mp3", expl: "\"dunno\"はdon't know、\"s'posed to\"はsupposed to、\"movin'\"はmovingの音変化。\"goalposts keep moving\"は「目標や基準が頻繁に変わる」という重要なイディオム。", kp: ["s'posed to keep everyone motivated","goalposts keep movin'"] },
+  { diff: "lv5", axis: "reduction", text: "Lemme put it this way — if we hadda do it all over again, we'da done things very differently from the start.", ja: "こう言わせてもらうと、もしやり直せるなら最初から全く違うやり方をしてたと思う。", answer: "振り返ると最初から別のアプローチを取るべきだったと反省している", choices: ["振り返ると最初から別のアプローチを取るべきだったと反省している","今のやり方で正解だったと確信を持って語っている","次のプロジェクトでも同じ手順を踏むつもりだと言っている","他のチームのやり方を参考にすべきだと提案している","過去の成功体験を誇らしげに振り返っている"], audio: "audio/q769.mp3", expl: "\"lemme\"はlet me、\"hadda\"はhad to、\"we'da\"はwe would haveの縮約。\"put it this way\"は「こう言えば」という前置き表現。後悔と反省のトーンが正解の鍵。", kp: ["lemme put it this way","we'da done things very differently"] },
+  { diff: "lv5", axis: "vocab", text: "At this point I think we need to just bite the bullet and have the difficult conversation, even if it ruffles some feathers.", ja: "もうここまで来たら、多少波風が立っても、覚悟を決めて難しい話し合いをするしかないと思う。", answer: "覚悟を決めて摩擦を恐れずに困難な話し合いをすべきだと主張している", choices: ["覚悟を決めて摩擦を恐れずに困難な話し合いをすべきだと主張している","議論を避けて問題をうやむやにするよう提案している","難しい会話は専門家に任せるべきだと言っている","全員が合意するまで話し合いを延期すべきだと言っている","過去の困難な交渉を振り返って反省している"], audio: "audio/q770.mp3", expl: "\"bite the bullet\"は「覚悟を決める・歯を食いしばる」、\"ruffle some feathers\"は「波風を立てる・人を怒らせる」という慣用句。両方のイディオムを理解しないと正解できない。", kp: ["bite the bullet","ruffles some feathers"] },
+  { diff: "lv5", axis: "vocab", text: "She's been flying under the radar for months, but sooner or later someone's gonna call her out on it.", ja: "彼女はずっと目立たないようにやってきたけど、遅かれ早かれ誰かに指摘されるよ。", answer: "目立たず問題を避けてきた人が遅かれ早かれ指摘されると述べている", choices: ["目立たず問題を避けてきた人が遅かれ早かれ指摘されると述べている","彼女が長期出張から戻ってきたことを報告している","彼女が航空会社に不当に扱われたと憤慨している","彼女の優れた業績が社内で評価されていると喜んでいる","彼女が会議での発言を控えているのは謙虚さゆえだと擁護している"], audio: "audio/q771.mp3", expl: "\"fly under the radar\"は「目立たずに問題を回避する」、\"call someone out\"は「公に指摘する・追及する」という重要スラング。ニュアンスを誤解すると誤答を選びやすい。", kp: ["flying under the radar","call her out on it"] },
+  { diff: "lv5", axis: "vocab", text: "I get that we're strapped for cash, but gutting the training budget is just robbing Peter to pay Paul.", ja: "資金難なのはわかるけど、研修予算を大幅削減するのは、結局どこかにしわ寄せが行くだけだよ。", answer: "研修予算削減は一時しのぎで別の問題を生むだけだと警告している", choices: ["研修予算削減は一時しのぎで別の問題を生むだけだと警告している","研修費を削減して資金難を解消すべきだと提案している","ピーターとポールという社員が資金を横領したと報告している","研修の費用対効果が低く廃止を検討すべきだと言っている","外部資金調達で研修予算を補填できると楽観視している"], audio: "audio/q772.mp3", expl: "\"strapped for cash\"は「資金難の」、\"gutting\"は「大幅に削減する」、\"robbing Peter to pay Paul\"は「一方の問題を解決するために別の問題を作る」という慣用句。", kp: ["strapped for cash","robbing Peter to pay Paul"] },
+  { diff: "lv5", axis: "vocab", text: "That was a real watershed moment for the team — things were never quite the same after that.", ja: "チームにとってあれは本当に転換点だった。あれ以降、何もかもがそれまでとは違ってしまった。", answer: "チームにとって大きな転換点となった出来事について話している", choices: ["チームにとって大きな転換点となった出来事について話している","チームが川での研修で絆を深めたことを振り返っている","チームの業績が急激に悪化した原因を分析している","チームが解散する前の最後の会議を回想している","チームが初めて目標を達成した喜びを語っている"], audio: "audio/q773.mp3", expl: "\"watershed moment\"は「重大な転換点・分岐点」という比喩的表現で、川（watershed）の地理的意味と混同しやすい。直後の\"things were never quite the same\"がニュアンスの確認に役立つ。", kp: ["watershed moment","never quite the same after that"] },
+  { diff: "lv5", axis: "vocab", text: "I don't wanna be the one to rain on your parade, but the timeline you're proposing is completely unrealistic.", ja: "水を差したくはないんだけど、あなたが提案しているスケジュールは全く現実的じゃないよ。", answer: "相手の計画に水を差すようで悪いが現実的でないと伝えている", choices: ["相手の計画に水を差すようで悪いが現実的でないと伝えている","雨天でのイベント中止をやむなく告げている","相手の提案するスケジュールが優れていると褒めている","タイムラインを自分が全面的に修正すると申し出ている","相手の計画への賛同を保留したまま詳細を聞こうとしている"], audio: "audio/q774.mp3", expl: "\"rain on your parade\"は「水を差す・喜びを台無しにする」というイディオム。\"I don't wanna be the one to\"という前置きが批判を和らげようとするトーンを示している。", kp: ["rain on your parade","completely unrealistic"] },
+  { diff: "lv5", axis: "vocab", text: "We've been going around in circles on this for weeks. Someone needs to just draw a line in the sand.", ja: "何週間もこれで堂々巡りしてる。誰かがはっきり一線を引かないといけない。", answer: "議論が堂々巡りで誰かが明確な立場を示す必要があると主張している", choices: ["議論が堂々巡りで誰かが明確な立場を示す必要があると主張している","砂浜での会議を終わらせて室内に戻るよう促している","議題を変えてもっと建設的な話し合いをしようと提案している","全員が賛成するまで議論を続けるべきだと言っている","チームが問題を一緒に解決しようと前向きに取り組んでいると評価している"], audio: "audio/q775.mp3", expl: "\"going around in circles\"は「堂々巡りをする」、\"draw a line in the sand\"は「明確な限界・立場を示す」という慣用句。どちらも文字通りに解釈すると誤答になる。", kp: ["going around in circles","draw a line in the sand"] },
+  { diff: "lv5", axis: "context", text: "Oh. You're here earlier than I expected. The... uh... living room's a bit of a state right now. Sorry.", ja: "あ、思ったより早かったね。えっと……リビングがちょっと散らかってて。ごめんね。", answer: "突然の訪問に慌てて家の散らかりを謝罪している", choices: ["突然の訪問に慌てて家の散らかりを謝罪している","仕事が早く終わったことを嬉しそうに報告している","リビングの改装が完成したことを誇らしげに披露している","早めに来てもらったことへの感謝を伝えている","部屋の掃除を相手に手伝ってほしいと頼んでいる"], audio: "audio/q776.mp3", expl: "\"a bit of a state\"は「散らかった・乱れた状態」というイギリス英語的表現。\"earlier than I expected\"と語尾の\"Sorry\"から、驚きと慌てた様子を読み取る必要がある。", kp: ["earlier than I expected","a bit of a state"] },
+  { diff: "lv5", axis: "context", text: "No, it's fine. It's completely fine. I'm fine. You don't need to apologize.", ja: "大丈夫、全然大丈夫。私は大丈夫だから。謝らなくていいよ。", answer: "傷ついているがそれを隠して大丈夫だと繰り返している", choices: ["傷ついているがそれを隠して大丈夫だと繰り返している","本当に問題がなく謝罪は不要だと率直に伝えている","相手の謝罪を受け入れて仲直りしようとしている","感情的になっている相手を落ち着かせようとしている","謝罪を受け入れるための条件を提示している"], audio: "audio/q777.mp3", expl: "\"fine\"を三回繰り返すことで、実際は傷ついているが強がっているというトーンを文脈から読み取る必要がある。表面的な意味で解釈すると正反対の選択肢を選びやすい。", kp: ["completely fine","You don't need to apologize"] },
+  { diff: "lv5", axis: "context", text: "Ha. Yeah. I mean... sure. If that's what you think happened, then... sure.", ja: "はは。そうだね。まあ……そうかな。そう思うんならそれで……いいんじゃない。", answer: "相手の解釈に不満だが皮肉をこめて表面上は同意している", choices: ["相手の解釈に不満だが皮肉をこめて表面上は同意している","相手の見方に心から同意して話を締めくくっている","相手が言ったことを正確に理解できず確認している","自分のミスを認めて謝罪しようとしている","相手の説明に感心して素直に賞賛している"], audio: "audio/q778.mp3", expl: "\"If that's what you think happened\"という条件節と、\"sure\"の繰り返しが不満と皮肉のトーンを示す。声のトーンと文脈を読まなければ純粋な同意と誤解しやすい。", kp: ["If that's what you think happened","then... sure"] },
+  { diff: "lv5", axis: "context", text: "Oh, don't worry about me. I'll manage. I always do. You go ahead.", ja: "私のことは気にしないで。なんとかなるから。いつもそうしてきたし。先に行って。", answer: "負担を押し付けられているが自己犠牲的に引き受けようとしている", choices: ["負担を押し付けられているが自己犠牲的に引き受けようとしている","体調が優れず先に帰るよう相手に伝えている","何も問題がなく自分で全てうまく処理できると自信満々に言っている","相手の心配を素直に感謝して励ましている","次回は自分が先に行く番だと順番を確認している"], audio: "audio/q779.mp3", expl: "\"I'll manage. I always do\"の繰り返しと\"You go ahead\"は、自己犠牲と軽い悲しみのトーンを持つ。純粋に問題ないと言っているように聞こえるが、文脈上は複雑な感情が込められている。", kp: ["I'll manage. I always do","You go ahead"] },
+  { diff: "lv5", axis: "context", text: "Well, that's... unexpected. I honestly don't know what to say. Wow.", ja: "それは……予想外だったな。正直、何て言えばいいかわからない。すごいね。", answer: "驚きのあまり言葉が出ず複雑な感情を抱いている", choices: ["驚きのあまり言葉が出ず複雑な感情を抱いている","相手の話に全く興味が持てず無視しようとしている","嬉しいニュースを聞いて純粋に喜んでいる","相手のプレゼンに対し率直なフィードバックを求めている","驚いた理由を相手に詳しく説明しようとしている"], audio: "audio/q780.mp3", expl: "\"unexpected\"、\"I don't know what to say\"、\"Wow\"の組み合わせから強い驚きと複雑な感情が読み取れる。ポジティブかネガティブかは文脈によって異なるため、「複雑な感情」という正解が最も適切。", kp: ["that's... unexpected","I don't know what to say"] },
+  { diff: "lv5", axis: "speed", text: "Aright, so I getcha — you're sayin' the whole rollout's on ice 'til legal clears it, but nobody's bothered tellin' the dev team yet, an' they're just sittin' there spinnin' their wheels. Someone's gotta loop 'em in before this blows up.", ja: "分かった、要するにリリース全体が法務の承認待ちで止まってるのに、開発チームには誰も伝えてないんでしょ。誰かが知らせないとまずいよ。", answer: "法務の承認を待つ間、開発チームに誰も連絡していない", choices: ["法務の承認を待つ間、開発チームに誰も連絡していない","開発チームが自分たちで法務の問題を解決しようとしている","リリースは既に完了したが、法務チームが事後確認中だ","開発チームは問題を把握していて、法務の結果を静観している","法務チームがリリースを中止するよう開発チームに直接指示した"], audio: "audio/q781.mp3", expl: "「on ice」は「保留中」、「loop 'em in」は「情報を共有する」の意。開発チームが何も知らされずに待機させられている状況を正確に把握できるかがポイント。", kp: ["on ice","loop 'em in"] },
+  { diff: "lv5", axis: "reduction", text: "I dunno, I'm kinda thinkin' we shoulda pushed back harder when they first floated the idea, 'cause now we're basically hafta agree to terms that weren't anywhere near what we originally signed up for.", ja: "最初に案が出た時にもっと強く反対すべきだったよ。今や最初と全然違う条件を受け入れるしかなくなってる。", answer: "当初の合意とかけ離れた条件を受け入れざるを得ない状況だ", choices: ["当初の合意とかけ離れた条件を受け入れざるを得ない状況だ","相手側の提案を最初から拒否していたので交渉が停滞している","条件は変わっておらず、最初の合意がそのまま維持されている","話者は新しい条件に満足しており、最初より良い結果になったと感じている","相手が提示した条件を精査中で、まだ判断を保留している"], audio: "audio/q782.mp3", expl: "「shoulda pushed back」＝「反対すべきだった」、「hafta agree to terms」＝「条件に同意しなければならない」という短縮形と後悔のトーンを正確に聞き取ることがカギ。", kp: ["shoulda pushed back","hafta agree to terms"] },
+  { diff: "lv5", axis: "vocab", text: "Honestly, the whole thing was a classic bait-and-switch. They reeled us in with the headline numbers and then buried the real costs in the small print. We should've done more due diligence before we signed.", ja: "完全に騙し売りだった。表向きの数字で引き寄せておいて、本当のコストは細かい文字で隠してあった。もっと事前調査をするべきだったね。", answer: "魅力的な条件で引きつけてから本当のコストを隠していた", choices: ["魅力的な条件で引きつけてから本当のコストを隠していた","契約書の小さな誤字が原因で費用が予想外に高くなった","相手方が誤った数字を誠意なく提示したが、すぐに謝罪し訂正した","費用は最初から明示されていたが、話者が見落としていた","広告の数字と実際のコストがほぼ一致しており、問題はなかった"], audio: "audio/q783.mp3", expl: "「bait-and-switch」は「おとり商法」、「due diligence」は「事前の十分な調査」を指すビジネス用語。これらのイディオムの意味を理解できるかが正解のカギ。", kp: ["bait-and-switch","due diligence"] },
+  { diff: "lv5", axis: "context", text: "Oh, yeah. No, that's — that's a great idea. Really. Super excited about that.", ja: "ああ、うん。それは……それはすごくいいアイデアだね。本当に。すごく楽しみ。", answer: "話者は実際にはその提案に乗り気でない", choices: ["話者は実際にはその提案に乗り気でない","話者は提案の内容を十分に理解できておらず困惑している","話者は提案を心から支持しており、積極的に参加したい","話者は提案には賛成だが、タイミングが悪いと感じている","話者は提案に興奮しているが、実現は難しいと考えている"], audio: "audio/q784.mp3", expl: "「Really. Super excited.」という過剰なほどの相づちは、実は乗り気でないサインであることが多い。言葉の表面通りに受け取らず、わざとらしいトーンから感情を推測することが求められる。", kp: ["Really","Super excited about that"] },
+  { diff: "lv5", axis: "distractor", text: "I'm not saying we should throw in the towel — I just think we need to take a step back and look at whether the juice is worth the squeeze at this point.", ja: "諦めろって言ってるわけじゃなくて、今の時点で労力に見合う成果が出るか、一歩引いて考える必要があると思う。", answer: "今の取り組みが労力に見合うか見直すべきだと提案している", choices: ["今の取り組みが労力に見合うか見直すべきだと提案している","すでに限界を超えており、プロジェクトを中止すべきだと主張している","チームが休憩を取り、エネルギーを回復させる必要があると言っている","コスト削減のために作業の一部を外部に委託することを検討している","搾りかすになるまで資源を使い切るべきだとアドバイスしている"], audio: "audio/q785.mp3", expl: "「throw in the towel」（諦める）を否定しているのに「諦める提案」と間違えやすく、「juice is worth the squeeze」（労力に見合う価値があるか）を文字通りに解釈させる誤答も混在させた。", kp: ["throw in the towel","juice is worth the squeeze"] },
+  { diff: "lv5", axis: "speed", text: "Y'know, wejus' hadda sit through two hours of that an' for what? Nobody's gonna act on any of it anyway. Same song and dance every quarter.", ja: "ね、あれに2時間も付き合わされてさ、何のために? どうせ誰も動かないよ。毎四半期同じことの繰り返しだよ。", answer: "毎回同じ会議が繰り返されるが、何も実行されないと感じている", choices: ["毎回同じ会議が繰り返されるが、何も実行されないと感じている","今回の会議は例外的に成果があり、次のアクションが決まった","2時間の会議は長すぎたが、少なくとも重要な決定が下された","話者は会議の内容を十分に理解できず、フォローアップが必要だと思っている","四半期ごとに新しいテーマで会議が開かれており、今回も新鮮だった"], audio: "audio/q786.mp3", expl: "「Same song and dance」は「毎回同じことの繰り返し」というイディオム。「wejus' hadda」（we just had to）などの速い発話と合わせて、無力感・嫌気のトーンを聴き取れるかがカギ。", kp: ["same song and dance","nobody's gonna act on any of it"] },
+  { diff: "lv5", axis: "reduction", text: "I coulda sworn I sentcha the updated version — lemme check my outbox 'cause if it gottcha wrong attachment that's gonna be a real problem before the pitch.", ja: "更新版を送ったと思ったんだけど——送信ボックス確認するね。もし間違った添付ファイルが届いてたら、プレゼン前に大問題だ。", answer: "正しいファイルが相手に届いているか確認しようとしている", choices: ["正しいファイルが相手に届いているか確認しようとしている","添付ファイルを送り忘れたことに気づき、今すぐ送り直そうとしている","相手がファイルを受け取ったことは確認済みで、内容の修正を依頼している","プレゼンのために新しいバージョンを一から作り直す必要があると言っている","送信したファイルに問題はなく、相手側の設定が原因だと思っている"], audio: "audio/q787.mp3", expl: "「coulda sworn」「lemme」「sentcha」「gottcha」などの大幅な音変化が連続する。「sentcha = sent you」「gottcha = got you / got to」と正確に復元しながら状況を把握することがカギ。", kp: ["coulda sworn I sentcha","gottcha wrong attachment"] },
+  { diff: "lv5", axis: "vocab", text: "She's been a real dark horse in this whole process. Nobody gave her a second look at first, but she's completely run rings around the rest of the candidates.", ja: "このプロセスで彼女は完全なダークホースだったね。最初は誰も注目していなかったけど、他の候補者を圧倒したよ。", answer: "当初は注目されていなかった人物が他の候補を圧倒した", choices: ["当初は注目されていなかった人物が他の候補を圧倒した","評判の高い候補者が予想外の失敗を犯し、選考から脱落した","話者は彼女を最初から高く評価しており、結果に驚いていない","すべての候補者が同水準で、最終的な判断が非常に難しかった","彼女は面接で走り回るような積極的な行動で注目を集めた"], audio: "audio/q788.mp3", expl: "「dark horse」は「下馬評外の有力候補」、「run rings around」は「〜を大きく上回る・圧倒する」という慣用表現。後者を「走り回る」と文字通りに解釈させる誤答を含めた。", kp: ["dark horse","run rings around"] },
+  { diff: "lv5", axis: "context", text: "Thanks. That means a lot. Really.", ja: "ありがとう。それはすごく嬉しいよ。本当に。", answer: "話者は心から感謝しており、言葉に深く感動している", choices: ["話者は心から感謝しており、言葉に深く感動している","話者は感謝の気持ちを伝えているが、内心は迷惑に感じている","話者は形式的に礼を言っているだけで、特に感情はない","話者は相手の行動に驚いており、どう反応すべきか困惑している","話者は皮肉を込めて言っており、本当は腹を立てている"], audio: "audio/q789.mp3", expl: "この問題は逆を狙った設問。短く静かな「Really.」という言葉が、感情を抑えながらも心に刺さった言葉への純粋な感謝を表すケースであることを、声のトーンと文脈から判断することが求められる。", kp: ["That means a lot","Really"] },
+  { diff: "lv5", axis: "distractor", text: "Look, I hate to be the one to say it, but we've been kicking this can down the road for way too long. If we don't get ahead of it now, we're going to end up firefighting when it's already too late.", ja: "言いたくないけどさ、もうずっと問題を先送りしてきた。今手を打たないと、手遅れになってから対応することになるよ。", answer: "長期間先送りにしてきた問題に今すぐ対処すべきだと主張している", choices: ["長期間先送りにしてきた問題に今すぐ対処すべきだと主張している","缶を道路に蹴り続けるという危険な行為をやめるよう注意している","消防活動のような緊急対応に備えて事前準備を進めるべきだと言っている","問題はすでに手遅れの段階に達しており、もはや対処不能だと述べている","話者は自分が担当者でないため、あくまで他人事として意見を述べている"], audio: "audio/q790.mp3", expl: "「kicking the can down the road」は「問題を先送りにする」、「firefighting」は「緊急対応に追われる」という比喩表現。いずれも文字通りの意味と混同させる誤答を設けた。", kp: ["kicking this can down the road","firefighting"] },
+  { diff: "lv5", axis: "vocab", text: "He's been stringing everybody along for months, dangling this so-called opportunity like a carrot. At this point, I think he's all talk and no action.", ja: "彼はずっとみんなを引っ張り回して、いわゆる「チャンス」をちらつかせてきた。もうただの口だけだと思う。", answer: "彼は口だけで実行力がないと思っている", choices: ["彼は口だけで実行力がないと思っている","彼が長期間プロジェクトを主導してきたと感じている","彼のチャンスに期待して待ち続けるつもりだ","彼が全員を欺いていたことに驚いている","彼はチームのモチベーションを高める存在だと思っている"], audio: "audio/q791.mp3", expl: "「all talk and no action」は「口だけで行動しない」というイディオム。「stringing along（引っ張り回す）」「dangling a carrot（えさをちらつかせる）」も合わせて状況を正確に把握する必要がある。", kp: ["all talk and no action","stringing everybody along"] },
+  { diff: "lv5", axis: "speed", text: "Aright so didja endup talkin' t'the new supplier or are we jus' gonna keep stalling 'til the whole inventory situation blows up inna our faces?", ja: "で、新しいサプライヤーと話したの？それともまずいことになるまで先延ばしし続けるの？", answer: "新しいサプライヤーと交渉したかどうか聞いている", choices: ["新しいサプライヤーと交渉したかどうか聞いている","在庫問題がすでに爆発的に悪化したと報告している","サプライヤーとの契約を打ち切ることを提案している","交渉を自分が代わりに引き受けると申し出ている","在庫管理のやり方を根本から見直すべきだと言っている"], audio: "audio/q792.mp3", expl: "「didja endup talkin'」は「Did you end up talking」の速い発音。「blow up in our faces」は「事態が悪化して自分たちに跳ね返る」という意味のイディオム。", kp: ["didja endup talkin'","blows up inna our faces"] },
+  { diff: "lv5", axis: "reduction", text: "I wanna get this sorted but lemme be real — we're kinda betweena rock an' a hard place here. There's no clean way outta this.", ja: "解決したいけど正直に言うと、進退両難の状況だよ。きれいな出口なんてない。", answer: "どちらを選んでも困難な板挟みの状態だと説明している", choices: ["どちらを選んでも困難な板挟みの状態だと説明している","問題をすぐに解決できる具体的な方法を提案している","この状況から完全に手を引きたいと言っている","状況が思ったより簡単に解決できると楽観視している","困難ではあるが一つの正しい選択肢があると示唆している"], audio: "audio/q793.mp3", expl: "「between a rock and a hard place」は「どちらを選んでも苦しい板挟み」というイディオム。「lemme be real」の縮約形と「kinda」の音変化も聴き取りのポイント。", kp: ["betweena rock an' a hard place","lemme be real"] },
+  { diff: "lv5", axis: "context", text: "Oh, congrats. Really. That's... yeah, no, I'm happy for you. Totally.", ja: "あ、おめでとう。本当に。それは…うん、いや、嬉しいよ。全然。", answer: "本心では喜んでいないが表面上は祝福している", choices: ["本心では喜んでいないが表面上は祝福している","相手の成功を心から喜んで祝福している","何を祝えばいいのか状況が理解できずにいる","相手の発言が信じられず戸惑っている","おめでとうと言うべき場面ではないと気づいた"], audio: "audio/q794.mp3", expl: "「Really.」「Totally.」の間の「...yeah, no」というためらいと不自然な間が、本心では喜んでいないことを示す。トーンと間の取り方から感情を読み取る必要がある。", kp: ["yeah, no","Totally（トーン）"] },
+  { diff: "lv5", axis: "distractor", text: "Look, I'm not trying to throw cold water on your idea, but have you actually stress-tested this against a worst-case scenario? Because if the bottom falls out, we're the ones left holding the bag.", ja: "水を差したいわけじゃないけど、最悪のケースで本当に検証した？底が抜けたら尻拭いをするのは私たちだよ。", answer: "アイデアに懸念を示しつつリスク検証を求めている", choices: ["アイデアに懸念を示しつつリスク検証を求めている","アイデアに反対しており計画を中止するよう求めている","最悪の事態が起きた場合に責任を取れないと言っている","ストレステストの結果がすでに不合格だったと報告している","リスク管理は他の部署の仕事だと主張している"], audio: "audio/q795.mp3", expl: "「throw cold water on」は「水を差す」、「holding the bag」は「責任を押し付けられる」の意。否定しているようで実は「検証をしてほしい」という提案であり、「反対・拒絶」と誤読しやすい。", kp: ["throw cold water on","left holding the bag"] },
+  { diff: "lv5", axis: "vocab", text: "Honestly, she's been burning the candle at both ends for months. I'm not surprised she finally hit a wall. Something had to give.", ja: "正直、彼女はここ何ヶ月も無理を続けてきた。限界に達したのは驚くことじゃない。何かが崩れるしかなかった。", answer: "過労が続いた末に彼女が限界を迎えたのは当然だと思っている", choices: ["過労が続いた末に彼女が限界を迎えたのは当然だと思っている","彼女が突然仕事を辞めたことに驚きを隠せないでいる","彼女が燃え尽きる前にもっと早く助けるべきだったと後悔している","彼女の成果がここ数ヶ月で著しく低下したと指摘している","彼女に対して何か重大な変化が必要だと提案している"], audio: "audio/q796.mp3", expl: "「burning the candle at both ends」は「無理をして体を酷使する」、「hit a wall」は「限界に達する」、「something had to give」は「何かが限界を迎えるしかなかった」という意味のイディオム。", kp: ["burning the candle at both ends","something had to give"] },
+  { diff: "lv5", axis: "speed", text: "Yknow, wejus' gottastop kiddin' ourselves — if the numbers aren't there by end'a next week, we're gonna hafta pull the plug whether we like it or not.", ja: "もう自分たちをごまかすのはやめないと。来週末までに数字が出なければ、好むと好まざるとにかかわらず打ち切りにしないといけない。", answer: "来週末までに成果が出なければ計画を中止すると言っている", choices: ["来週末までに成果が出なければ計画を中止すると言っている","数字はすでに目標を達成しており次のステップに進める","来週末の締め切りを延長するよう上司に掛け合うつもりだ","計画を中止するかどうかをチーム全体で決めるべきだと言っている","数字が悪い原因を来週中に特定しなければならないと言っている"], audio: "audio/q797.mp3", expl: "「wejus' gottastop」は「we just gotta stop」、「end'a」は「end of」の縮約。「pull the plug」は「計画・プロジェクトを打ち切る」という慣用句。", kp: ["pull the plug","end'a next week"] },
+  { diff: "lv5", axis: "reduction", text: "I coulda sworn I toldja about the rescheduling, but lemme double-check 'cause if you'ren't in the loop that's on me.", ja: "日程変更のこと伝えたはずなんだけど、一応確認させて。知らせてなかったなら私のミスだから。", answer: "日程変更を伝えたか自信がなく自分の責任を認めている", choices: ["日程変更を伝えたか自信がなく自分の責任を認めている","日程変更は確実に伝えたので相手の確認ミスだと言っている","日程変更の連絡を相手に代わりにしてほしいと頼んでいる","日程変更についての情報をまだ誰にも知らせていないと言っている","スケジュールの混乱は別の人物が原因だと示唆している"], audio: "audio/q798.mp3", expl: "「coulda sworn」は「could have sworn（確かに〜したはずだ）」の縮約。「you'ren't in the loop」は「you aren't in the loop（情報を共有されていない）」の崩れた形。「that's on me」は「私のせいだ」。", kp: ["coulda sworn","you'ren't in the loop"] },
+  { diff: "lv5", axis: "context", text: "Hm. Yeah. No, it looks... fine. It's fine. Honestly, it's great. You should go with it.", ja: "うーん、まあ。いや、…いいんじゃない。大丈夫だよ。本当に、いいと思う。それで行けばいい。", answer: "本当はよくないと思っているが相手に合わせて肯定している", choices: ["本当はよくないと思っているが相手に合わせて肯定している","相手のアイデアを心から評価しており強く推薦している","どちらでもよいので相手に判断を委ねている","提案内容について詳しく聞かないと判断できないと言っている","以前とは意見が変わり今は賛成していると伝えている"], audio: "audio/q799.mp3", expl: "「Hm」「Yeah. No」という曖昧な反応、「It's fine」の繰り返し、そして「You should go with it」の投げやりなトーンが、本心では乗り気でないことを示している。言葉の内容ではなくトーンと間から正解を導く問題。", kp: ["Yeah. No（トーン）","It's fine（繰り返し）"] },
+  { diff: "lv5", axis: "distractor", text: "I'm not saying we should wash our hands of it entirely, but at some point we've gotta acknowledge that we've been flogging a dead horse here.", ja: "完全に手を引くべきだとは言っていないけど、どこかの時点で無駄な努力を続けてきたことを認めないといけない。", answer: "撤退はしないが効果のない取り組みを続けることに疑問を呈している", choices: ["撤退はしないが効果のない取り組みを続けることに疑問を呈している","プロジェクトから完全に撤退することを提案している","過去の努力がすべて無駄だったと結論づけている","他のメンバーが十分な努力をしていないと批判している","現状維持のままで問題ないと楽観的な見通しを示している"], audio: "audio/q800.mp3", expl: "「wash our hands of it」は「完全に手を引く」だが、話者は「not saying」と否定している。「flogging a dead horse」は「無駄な努力を続ける」の意。「撤退提案」と「効果への疑問」が混同しやすい典型的なdistractorパターン。", kp: ["wash our hands of it","flogging a dead horse"] }
 ];
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+question_compact.py - 列形式・文字列表つきのコンパクトな問題データ（圧縮版も同時に出力）
+
+questions.js は1問ごとにキー名を繰り返し、何度も出てくる選択肢や kp も毎回文字列で持つ。
+ここではフィールドごとの列（配列）に並べ替え、繰り返し出てくる文字列（diff / axis /
+choices / kp）は文字列表の番号で参照する。出現回数の多い文字列ほど小さい番号にするので、
+番号の桁数も少なくなる。answer は choices の中の位置で持つ。
+
+公開しているクイズが読むのはレベル別シャード（question_shards.py、デフォルトは1行1問の JSON）で、
+この形式は question_shards.py --compact でシャードに使う場合だけ配信される。
+単体のファイル（空白なしの JSON と .gz / .br）は --write を付けたときだけ書き出す。GitHub Pages は
+圧縮済みファイルを配信しないので、これは事前圧縮に対応した別の配信先向け（git には入れない）。
+
+  listening/questions.min.json(.gz / .br)   # --write のときだけ（.gitignore 済み）
+      {"v": 1, "n": 問題数, "s": [文字列表],
+       "c": {"diff": [番号], "axis": [番号 | null], "text": [文字列], "answer": [choices の位置],
+             "choices": [[番号 または 文字列, ...]], "audio": ["q12", ...], ...}}
+
+question_shards.py --compact でシャードもこの形式になり、クイズは読み込み時に展開する
+（decodeCompact）。
+
+Usage:
+  python3 question_compact.py              # サイズの比較だけ表示（ファイルは書かない）
+  python3 question_compact.py --write      # questions.min.json と圧縮版も書き出す
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+REPO_ROOT = Path(__file__).parent
+LISTENING_DIR = REPO_ROOT / "listening"
+COMPACT_JSON = LISTENING_DIR / "questions.min.json"
+
+FORMAT_VERSION = 1
+FIELDS = ("diff", "axis", "text", "ja", "answer", "choices", "audio", "expl", "kp", "dur")
+INTERNED = ("diff", "axis")                  # 1つの文字列を番号で持つ列
+INTERNED_LISTS = ("choices", "kp")           # 文字列のリストを番号のリストで持つ列
+
+_AUDIO = re.compile(r"audio/(q\d+)\.mp3")
+_AUDIO_STEM = re.compile(r"q\d+")
+
+
+def _ref(index, value):
+    """文字列表にあれば番号、無ければ（1回しか出てこない文字列は）そのまま"""
+    return index.get(value, value)
+
+
+def encode(questions):
+    """問題のリストを列形式の dict にする
+
+    - 2回以上出てくる diff / axis / choices / kp の文字列は文字列表の番号にする
+      （1回しか出てこない選択肢はそのまま。表を引く分だけ大きくなるため）
+    - answer は choices の中の位置（choices に無ければ文字列のまま）
+    - audio は "audio/q12.mp3" → "q12"（ゼロ埋めの表記揺れを保つため数値にはしない）
+    - dur は1問でも値があるときだけ列を作る
+    - FIELDS 以外のキー（ストアの extra 列）はそのままの値の列にする（無い問題は null）
+    """
+    questions = list(questions)
+    freq = Counter()
+    for q in questions:
+        for field in INTERNED:
+            if q.get(field):
+                freq[q[field]] += 1
+        for field in INTERNED_LISTS:
+            freq.update(q.get(field) or [])
+    # 出現回数の多い順（同数なら先に出た順。Counter は挿入順を保つ）
+    strings = [s for s, n in sorted(freq.items(), key=lambda kv: -kv[1]) if n > 1]
+    index = {s: i for i, s in enumerate(strings)}
+
+    fields = [f for f in FIELDS if f != "dur" or any(q.get("dur") is not None for q in questions)]
+    fields += list(dict.fromkeys(k for q in questions for k in q if k not in FIELDS))
+    columns = {}
+    for field in fields:
+        if field in INTERNED:
+            column = [_ref(index, q[field]) if q.get(field) else None for q in questions]
+        elif field in INTERNED_LISTS:
+            column = [[_ref(index, s) for s in q.get(field) or []] for q in questions]
+        elif field == "answer":
+            column = [q["choices"].index(q["answer"]) if q.get("answer") in q.get("choices", []) else q.get("answer")
+                      for q in questions]
+        elif field == "audio":
+            column = []
+            for q in questions:
+                m = _AUDIO.fullmatch(q.get("audio") or "")
+                column.append(m.group(1) if m else q.get("audio"))
+        else:
+            column = [q.get(field) for q in questions]
+        columns[field] = column
+    return {"v": FORMAT_VERSION, "n": len(questions), "s": strings, "c": columns}
+
+
+def decode(payload):
+    """encode の逆（値の無い axis / dur はキーごと省く）"""
+    strings, columns = payload["s"], payload["c"]
+
+    def lookup(v):
+        return strings[v] if isinstance(v, int) else v
+
+    out = []
+    for i in range(payload["n"]):
+        q = {}
+        for field, column in columns.items():
+            value = column[i]
+            if field in INTERNED:
+                value = lookup(value)
+            elif field in INTERNED_LISTS:
+                value = [lookup(k) for k in value]
+            elif field == "audio" and value and _AUDIO_STEM.fullmatch(value):
+                value = f"audio/{value}.mp3"
+            if value is not None:
+                q[field] = value
+        if isinstance(q.get("answer"), int):
+            q["answer"] = q["choices"][q["answer"]]
+        out.append(q)
+    return out
+
+
+def dumps(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def compress(data):
+    """{"gz": bytes, "br": bytes}（brotli が無ければ gz のみ）。mtime=0 で毎回同じ出力にする"""
+    out = {"gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        out["br"] = brotli.compress(data, quality=11)
+    return out
+
+
+def sizes(data):
+    """そのまま・gzip・brotli のバイト数（brotli が無ければ None）"""
+    packed = compress(data)
+    return len(data), len(packed["gz"]), len(packed["br"]) if "br" in packed else None
+
+
+def write_compact(questions, path=COMPACT_JSON):
+    """列形式の JSON と .gz / .br を書き出す。戻り値: 本体のバイト列"""
+    data = dumps(encode(questions)).encode("utf-8")
+    targets = {path: data}
+    for ext, packed in compress(data).items():
+        targets[path.with_name(f"{path.name}.{ext}")] = packed
+    for target, content in targets.items():
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_bytes(content)
+        os.replace(tmp, target)
+    if brotli is None:
+        path.with_name(f"{path.name}.br").unlink(missing_ok=True)   # 古い .br を残さない
+    return data
+
+
+def print_size_report(rows):
+    """rows: [(ラベル, バイト列), ...]。先頭の行を基準に削減率を出す"""
+    def kb(n):
+        return f"{n / 1024:8.1f} KB" if n is not None else "         -"
+
+    base = None
+    print(f"  {'':16s} {'raw':>11s} {'gzip':>11s} {'brotli':>11s}")
+    for label, data in rows:
+        raw, gz, br = sizes(data)
+        note = ""
+        if base is None:
+            base = (raw, gz, br)
+        else:
+            note = f"  （gzip で {(1 - gz / base[1]) * 100:.0f}% 減）"
+        print(f"  {label:16s} {kb(raw)} {kb(gz)} {kb(br)}{note}")
+    if brotli is None:
+        print("  ※ brotli 未インストールのため .br は作りません（pip install brotli）")
+
+
+def main():
+    from question_store import QUESTIONS_JS, open_store
+    import question_shards
+
+    parser = argparse.ArgumentParser(description="列形式・文字列表つきのコンパクトな問題データを作る")
+    parser.add_argument("--write", action="store_true",
+                        help="questions.min.json と圧縮版を書き出す（事前圧縮に対応した配信先向け）")
+    args = parser.parse_args()
+
+    if not QUESTIONS_JS.exists():
+        print(f"ERROR: {QUESTIONS_JS} が見つかりません", file=sys.stderr)
+        sys.exit(1)
+    with open_store() as store:
+        durations = store.emit_durations()
+        records = []
+        for q in store.iter_questions():
+            if q.get("audio") in durations:
+                q["dur"] = round(durations[q["audio"]], 2)
+            records.append(question_shards.to_record(q))
+
+    payload = encode(records)
+    if decode(payload) != records:
+        print("ERROR: 展開した結果が元の問題と一致しません", file=sys.stderr)
+        sys.exit(1)
+    if args.write:
+        data = write_compact(records)
+    else:
+        data = dumps(payload).encode("utf-8")
+
+    print(f"{len(records)} 問 / 文字列表 {len(payload['s'])} 件")
+    print_size_report([
+        ("questions.js", QUESTIONS_JS.read_bytes()),
+        ("JSON records", json.dumps(records, ensure_ascii=False, separators=(",", ":")).encode("utf-8")),
+        ("compact", data),
+    ])
+    if args.write:
+        print(f"✅ {COMPACT_JSON.relative_to(REPO_ROOT)} を書き出しました")
+
+
+if __name__ == "__main__":
+    main()
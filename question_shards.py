@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+question_shards.py - レベル別（任意で axis 別）の問題シャードと小さなマニフェストを作る
+
+questions.js は全レベル・全解説を1ファイルに持つので、クイズは最初の1問を出す前に
+全問題をダウンロードする必要がある。問題をプールごとの JSON に分け、件数と内容ハッシュを
+マニフェストに書き出す。クイズはマニフェストを見て、これから出すレベルのシャードだけを先に取得し、
+残りは後から読む（マニフェストが無ければ従来どおり questions.js を読む）。
+
+  listening/shards/lv1.json ...      # 問題の配列（questions.js と同じフィールド）
+  listening/shards/manifest.json     # クライアント用のマニフェスト
+      {"version": 1, "total": 732, "by_axis": false, "format": "records",
+       "shards": {"lv1": {"file": "shards/lv1.json", "diff": "lv1", "axis": null,
+                          "count", "bytes", "hash"}},
+       "files": {"timings": {"file": "timings.json", "bytes", "hash"}}}
+
+files にはシャード以外の配信ファイル（word_timings.py の timings.json など）を載せる。
+クイズは files に載っているファイルだけを取得する（まだ公開していないファイルを取りに行かない）。
+
+format が "compact" のときシャードは question_compact.py の列形式（文字列表つき）になる。
+
+question_store.emit_js（questions.js の生成）のたびに呼ばれ、内容ハッシュが変わった
+シャードだけを書き換える。問題の追加（question_store.append_js）では、追加した問題を
+該当するシャードの末尾に書き足すだけにする（records 形式のみ。compact 形式は作り直す）。
+axis 別にするか・列形式にするかはストアの meta（shard_by_axis / shard_format）に保存する。
+
+Usage:
+  python3 question_shards.py              # シャードとマニフェストを作る（変更のあるシャードだけ書き換え）
+  python3 question_shards.py --by-axis    # レベル×axis 別のシャードにする（設定を保存）
+  python3 question_shards.py --by-level   # レベル別のシャードに戻す（設定を保存）
+  python3 question_shards.py --compact    # 列形式のシャードにする（設定を保存）
+  python3 question_shards.py --records    # 1行1問の JSON に戻す（設定を保存）
+  python3 question_shards.py --rebuild    # ハッシュを比べずにすべて書き直す
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import question_compact
+
+REPO_ROOT = Path(__file__).parent
+LISTENING_DIR = REPO_ROOT / "listening"
+SHARD_DIR = LISTENING_DIR / "shards"
+SHARD_MANIFEST = SHARD_DIR / "manifest.json"
+
+MANIFEST_VERSION = 1
+RECORD_FIELDS = ("diff", "axis", "text", "ja", "answer", "choices", "audio", "expl", "kp", "dur")
+
+
+def shard_name(q, by_axis):
+    if by_axis:
+        return f"{q['diff']}-{q.get('axis') or 'none'}"
+    return q["diff"]
+
+
+def to_record(q):
+    """questions.js の1問と同じ内容の dict（axis / dur は値があるときだけ）
+
+    ストアの extra 列のキー（RECORD_FIELDS 以外）もそのまま含める。ストアの ID は含めない。
+    """
+    record = {k: q[k] for k in RECORD_FIELDS if q.get(k) is not None and q.get(k) != ""}
+    record.update((k, v) for k, v in q.items() if k not in RECORD_FIELDS and k != "id")
+    return record
+
+
+def serialize(records, fmt="records"):
+    """シャードの中身
+
+    records: 1行1問の JSON 配列（追加時の git diff を小さくする）
+    compact: question_compact の列形式（空白なし）
+    """
+    if fmt == "compact":
+        return (question_compact.dumps(question_compact.encode(records)) + "\n").encode("utf-8")
+    body = ",\n".join(json.dumps(r, ensure_ascii=False, separators=(",", ":")) for r in records)
+    return f"[\n{body}\n]\n".encode("utf-8")
+
+
+def load_manifest():
+    if SHARD_MANIFEST.exists():
+        return json.loads(SHARD_MANIFEST.read_text(encoding="utf-8"))
+    return {"shards": {}}
+
+
+def write_shards(questions, by_axis=False, fmt="records", rebuild=False):
+    """問題をシャードに分けて書き出す。戻り値: (マニフェスト, 書き換えたシャード名のリスト)
+
+    questions: 問題の iterable（登録順）。内容ハッシュとサイズが前回のマニフェストと
+    一致するシャードは書き込まない。
+    """
+    pools = defaultdict(list)
+    meta = {}
+    total = 0
+    for q in questions:
+        name = shard_name(q, by_axis)
+        pools[name].append(to_record(q))
+        meta.setdefault(name, (q["diff"], (q.get("axis") or None) if by_axis else None))
+        total += 1
+
+    SHARD_DIR.mkdir(parents=True, exist_ok=True)
+    old_manifest = load_manifest()
+    previous = {} if rebuild else old_manifest.get("shards", {})
+    manifest = {"version": MANIFEST_VERSION, "total": total, "by_axis": by_axis, "format": fmt,
+                "shards": {}}
+    if old_manifest.get("files"):
+        manifest["files"] = old_manifest["files"]
+    written = []
+    for name in sorted(pools):
+        data = serialize(pools[name], fmt)
+        digest = hashlib.sha1(data).hexdigest()[:10]
+        path = SHARD_DIR / f"{name}.json"
+        prev = previous.get(name)
+        if not (prev and prev["hash"] == digest and path.exists() and path.stat().st_size == len(data)):
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            written.append(name)
+        diff, axis = meta[name]
+        manifest["shards"][name] = {
+            "file": f"shards/{path.name}", "diff": diff, "axis": axis,
+            "count": len(pools[name]), "bytes": len(data), "hash": digest,
+        }
+
+    # 今回のプールに無いシャード（axis 別 → レベル別への切り替えなど）を削除
+    for stale in SHARD_DIR.glob("*.json"):
+        if stale != SHARD_MANIFEST and stale.stem not in pools:
+            stale.unlink()
+
+    _write_manifest(manifest)
+    return manifest, written
+
+
+def _write_manifest(manifest):
+    tmp = SHARD_MANIFEST.with_name(SHARD_MANIFEST.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+    os.replace(tmp, SHARD_MANIFEST)
+
+
+def _file_sha1(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()[:10]
+
+
+def register_file(key, path):
+    """シャード以外の配信ファイルをマニフェストの files に載せる（内容ハッシュ付き）
+
+    マニフェストが無ければ何もしない（クイズは questions.js を読むので files も使わない）。
+    """
+    if not SHARD_MANIFEST.exists():
+        return
+    path = Path(path)
+    manifest = load_manifest()
+    manifest.setdefault("files", {})[key] = {
+        "file": path.relative_to(LISTENING_DIR).as_posix(), "bytes": path.stat().st_size,
+        "hash": _file_sha1(path),
+    }
+    _write_manifest(manifest)
+
+
+def append(store, questions):
+    """追加した問題だけをシャードの末尾に書き足す。戻り値: 書き換えたシャード名のリスト
+
+    questions: 追加した問題（dur 付け済み）。シャードの閉じ括弧を切り詰めて新しい問題を書き、
+    内容ハッシュはそのシャードだけ計算し直す。前回のマニフェストと設定・件数が合わない、
+    compact 形式、ファイルのサイズが記録と違う場合は emit で全体を更新する。
+    """
+    manifest = load_manifest()
+    by_axis = store.get_meta("shard_by_axis") == "1"
+    fmt = store.get_meta("shard_format", "records")
+    if (fmt != "records" or manifest.get("format") != fmt or manifest.get("by_axis") != by_axis
+            or manifest.get("total", -1) + len(questions) != store.count()):
+        return emit(store)[1]
+
+    groups = defaultdict(list)
+    for q in questions:
+        groups[shard_name(q, by_axis)].append(q)
+
+    for name, qs in groups.items():
+        path = SHARD_DIR / f"{name}.json"
+        entry = manifest["shards"].get(name)
+        if entry is None:
+            path.write_bytes(serialize([to_record(q) for q in qs]))
+            entry = manifest["shards"][name] = {
+                "file": f"shards/{path.name}", "diff": qs[0]["diff"],
+                "axis": (qs[0].get("axis") or None) if by_axis else None, "count": 0,
+            }
+        else:
+            if not path.exists() or path.stat().st_size != entry["bytes"]:
+                return emit(store)[1]
+            body = "".join(",\n" + json.dumps(to_record(q), ensure_ascii=False, separators=(",", ":"))
+                           for q in qs)
+            with open(path, "r+b") as f:
+                f.seek(-3, os.SEEK_END)
+                if f.read() != b"\n]\n":
+                    return emit(store)[1]
+                f.seek(-3, os.SEEK_END)
+                f.write(body.encode("utf-8") + b"\n]\n")
+                f.flush()
+                os.fsync(f.fileno())
+        entry.update(count=entry["count"] + len(qs), bytes=path.stat().st_size, hash=_file_sha1(path))
+
+    manifest["total"] += len(questions)
+    manifest["shards"] = dict(sorted(manifest["shards"].items()))
+    _write_manifest(manifest)
+    return sorted(groups)
+
+
+def emit(store, rebuild=False):
+    """ストアの内容でシャードを更新する（question_store.emit_js から呼ばれる）"""
+    durations = store.emit_durations()
+
+    def questions():
+        for q in store.iter_questions():
+            if q.get("audio") in durations:
+                q["dur"] = round(durations[q["audio"]], 2)
+            yield q
+
+    return write_shards(questions(), by_axis=store.get_meta("shard_by_axis") == "1",
+                        fmt=store.get_meta("shard_format", "records"), rebuild=rebuild)
+
+
+def print_manifest(manifest, written):
+    total_bytes = sum(s["bytes"] for s in manifest["shards"].values())
+    mode = ("レベル×axis 別" if manifest["by_axis"] else "レベル別") + f"・{manifest['format']}"
+    print(f"問題シャード（{mode}）: {len(manifest['shards'])} 個 / {manifest['total']} 問"
+          f"（{total_bytes / 1024:.0f} KB、書き換え {len(written)} 個）")
+    for name, shard in manifest["shards"].items():
+        mark = " *" if name in written else ""
+        print(f"  {name:18s} {shard['count']:4d} 問  {shard['bytes'] / 1024:7.1f} KB  {shard['hash']}{mark}")
+    print(f"マニフェスト: {SHARD_MANIFEST.relative_to(REPO_ROOT)}（{SHARD_MANIFEST.stat().st_size / 1024:.1f} KB）")
+
+
+def main():
+    from question_store import open_store
+
+    parser = argparse.ArgumentParser(description="レベル別の問題シャードとマニフェストを作る")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--by-axis", action="store_true", help="レベル×axis 別のシャードにする（設定を保存）")
+    mode.add_argument("--by-level", action="store_true", help="レベル別のシャードに戻す（設定を保存）")
+    fmt = parser.add_mutually_exclusive_group()
+    fmt.add_argument("--compact", action="store_true", help="列形式のシャードにする（設定を保存）")
+    fmt.add_argument("--records", action="store_true", help="1行1問の JSON に戻す（設定を保存）")
+    parser.add_argument("--rebuild", action="store_true", help="ハッシュを比べずにすべて書き直す")
+    args = parser.parse_args()
+
+    with open_store() as store:
+        if args.by_axis or args.by_level:
+            with store.conn:
+                store.set_meta("shard_by_axis", "1" if args.by_axis else "0")
+        if args.compact or args.records:
+            with store.conn:
+                store.set_meta("shard_format", "compact" if args.compact else "records")
+        started = time.perf_counter()
+        manifest, written = emit(store, rebuild=args.rebuild)
+        elapsed = time.perf_counter() - started
+    print_manifest(manifest, written)
+    print(f"（{elapsed:.2f}秒）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+question_store.py - 問題データの正本（SQLite）と questions.js の生成
+
+listening/questions.db を問題の正本とし、listening/questions.js はここから生成する
+ビルド成果物として扱う（公開・git 管理するのは questions.js。questions.db はローカル専用で、
+無ければ questions.js から自動で作られる）。各問題は安定した ID を持ち、diff / axis / audio / 正規化済み
+text にインデックスを張るので、「既存問題数」「除外用の text 一覧」「axis 未付与の問題」
+などはファイル全体の正規表現スキャンではなくインデックス付きクエリになる。
+
+questions.js が直接編集された場合（手作業の修正・git pull 等）は、次に開いたときに
+内容ハッシュの差分を検知して自動でストアに取り込む（audio パスが同じ問題は ID を維持）。
+
+問題の追加（add_questions.py）は append_js で questions.js の末尾に新しい問題だけを書き足す。
+閉じ括弧の位置・件数・次の ID を meta の js_tail に記録しておくので、既存部分は読み書きしない
+（js_tail は emit_js のほか、移行・直接編集の取り込み時にも記録する）。
+
+Usage:
+  python3 question_store.py                  # 統計表示（必要なら自動移行）
+  python3 question_store.py --migrate        # questions.js からストアを作り直す
+  python3 question_store.py --emit           # ストアから questions.js（とシャード）を再生成
+  python3 question_store.py --format json    # questions.js を const DATA = JSON.parse('...') 形式にして再生成
+                                             # （クイズはシャードを読むので、効くのは questions.js を直接読む
+                                             #   外部の利用者とシャードが取れないときのフォールバックだけ）
+  python3 question_store.py --format literal # 従来のオブジェクトリテラル形式に戻して再生成
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+
+import question_shards
+from lib import format_question_js, js_single_quote, load_questions_js
+
+REPO_ROOT = Path(__file__).parent
+QUESTIONS_JS = REPO_ROOT / "listening" / "questions.js"
+STORE_DB = REPO_ROOT / "listening" / "questions.db"
+
+# questions.js に出力するフィールド（この順で並ぶ）
+FIELDS = ("diff", "axis", "text", "ja", "answer", "choices", "audio", "expl", "kp")
+_JSON_FIELDS = ("choices", "kp")
+# questions.js の形式（meta の js_format）
+#   literal: const DATA = [ { diff: "lv1", ... }, ... ];
+#   json   : const DATA = JSON.parse('[...]');  JS の構文解析を通さずに JSON パーサーで読ませる
+# どちらが速いかはエンジンと件数による（bench_js_parse.py で比較できる）
+# クイズ（listening/index.html）はレベル別シャード（JSON を fetch して res.json()）を読むので、
+# この設定が効くのは questions.js を直接読む外部の利用者と、マニフェストが取れないときの
+# フォールバックだけ。通常のページ読み込み時間は変わらない
+JS_FORMATS = ("literal", "json")
+# 形式ごとの (開き, 区切り, 閉じ)。json は文字列内の行継続（行末のバックスラッシュ）で1行1問にする
+_JS_SYNTAX = {
+    "literal": ("const DATA = [\n", ",\n", "\n];\n"),
+    "json": ("const DATA = JSON.parse('[\\\n", ",\\\n", "\\\n]');\n"),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id        INTEGER PRIMARY KEY,
+    diff      TEXT NOT NULL,
+    axis      TEXT,
+    text      TEXT NOT NULL,
+    norm_text TEXT NOT NULL,
+    ja        TEXT NOT NULL DEFAULT '',
+    answer    TEXT NOT NULL DEFAULT '',
+    choices   TEXT NOT NULL DEFAULT '[]',
+    audio     TEXT,
+    expl      TEXT NOT NULL DEFAULT '',
+    kp        TEXT NOT NULL DEFAULT '[]',
+    extra     TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_questions_diff  ON questions(diff);
+CREATE INDEX IF NOT EXISTS idx_questions_axis  ON questions(axis);
+CREATE INDEX IF NOT EXISTS idx_questions_audio ON questions(audio);
+CREATE INDEX IF NOT EXISTS idx_questions_norm  ON questions(norm_text);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+-- 既存問題の更新・削除の回数（append_js が「追加だけ」かどうかを判定する）
+INSERT OR IGNORE INTO meta (key, value) VALUES ('rev', '0');
+CREATE TRIGGER IF NOT EXISTS questions_rev_update AFTER UPDATE ON questions
+BEGIN UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'rev'; END;
+CREATE TRIGGER IF NOT EXISTS questions_rev_delete AFTER DELETE ON questions
+BEGIN UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'rev'; END;
+CREATE TABLE IF NOT EXISTS audio_meta (
+    audio       TEXT PRIMARY KEY,
+    bytes       INTEGER NOT NULL,
+    mtime_ns    INTEGER NOT NULL,
+    frames      INTEGER NOT NULL,
+    duration    REAL NOT NULL,
+    kbps        REAL NOT NULL,
+    sample_rate INTEGER NOT NULL,
+    wps         REAL
+);
+"""
+
+# audio_meta の列（audio_meta.py のスキャン結果と同じキー）
+AUDIO_META_FIELDS = ("audio", "bytes", "mtime_ns", "frames", "duration", "kbps", "sample_rate", "wps")
+
+# ストアに保存せず、出力時に付け足すフィールド（dur: audio_meta の秒数）
+_DERIVED_FIELDS = ("id", "dur")
+
+
+def normalize_text(text):
+    """完全一致判定用の正規化（前後空白除去・小文字化）"""
+    return text.strip().lower()
+
+
+def _file_stamp(path):
+    st = path.stat()
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def _file_hash(path):
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def _row_to_question(row):
+    q = {}
+    for f in FIELDS:
+        v = row[f]
+        if f in _JSON_FIELDS:
+            v = json.loads(v)
+        if v is None or (f == "axis" and not v):
+            continue
+        q[f] = v
+    if row["extra"]:
+        q.update(json.loads(row["extra"]))
+    q["id"] = row["id"]
+    return q
+
+
+def _question_params(q):
+    extra = {k: v for k, v in q.items() if k not in FIELDS and k not in _DERIVED_FIELDS}
+    return (
+        q["diff"],
+        q.get("axis") or None,
+        q["text"],
+        normalize_text(q["text"]),
+        q.get("ja", ""),
+        q.get("answer", ""),
+        json.dumps(q.get("choices", []), ensure_ascii=False),
+        q.get("audio"),
+        q.get("expl", ""),
+        json.dumps(q.get("kp", []), ensure_ascii=False),
+        json.dumps(extra, ensure_ascii=False) if extra else None,
+    )
+
+
+_COLUMNS = "diff, axis, text, norm_text, ja, answer, choices, audio, expl, kp, extra"
+_INSERT = f"INSERT INTO questions ({_COLUMNS}) VALUES ({', '.join('?' * 11)})"
+_INSERT_WITH_ID = f"INSERT INTO questions (id, {_COLUMNS}) VALUES ({', '.join('?' * 12)})"
+
+
+class QuestionStore:
+    """questions.db へのアクセス"""
+
+    def __init__(self, path=STORE_DB, js_path=QUESTIONS_JS):
+        self.path = Path(path)
+        self.js_path = Path(js_path)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── meta ──────────────────────────────────────────────────────────────
+
+    def get_meta(self, key, default=None):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else default
+
+    def set_meta(self, key, value):
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, str(value)),
+        )
+
+    def _record_js(self):
+        """生成・取り込みした questions.js の指紋を記録"""
+        self.set_meta("js_stamp", _file_stamp(self.js_path))
+        self.set_meta("js_sha1", _file_hash(self.js_path))
+
+    def js_changed(self):
+        """questions.js がストアの知らない内容に変わっているか
+
+        append_js の後は内容ハッシュを記録しない（全体を読むことになるため）ので、
+        サイズ・更新時刻が変わっていれば変更ありとみなす。
+        """
+        if not self.js_path.exists():
+            return False
+        if self.get_meta("js_stamp") == _file_stamp(self.js_path):
+            return False
+        return self.get_meta("js_sha1") != _file_hash(self.js_path)
+
+    # ── 取り込み ───────────────────────────────────────────────────────────
+
+    def import_js(self, questions=None):
+        """questions.js の内容でストアを置き換える（audio が同じ問題は ID を維持）"""
+        if questions is None:
+            questions = load_questions_js(self.js_path)
+        old_ids = {
+            row["audio"]: row["id"]
+            for row in self.conn.execute("SELECT id, audio FROM questions WHERE audio IS NOT NULL")
+        }
+        with self.conn:
+            self.conn.execute("DELETE FROM questions")
+            next_id = max(old_ids.values(), default=0) + 1
+            used = set()
+            for q in questions:
+                qid = old_ids.get(q.get("audio"))
+                if qid is None or qid in used:
+                    qid = next_id
+                    next_id += 1
+                used.add(qid)
+                self.conn.execute(_INSERT_WITH_ID, (qid, *_question_params(q)))
+            self._record_js()
+            self._record_tail(len(questions))
+        return len(questions)
+
+    def _record_tail(self, count):
+        """取り込んだ questions.js の閉じ括弧の位置を js_tail に記録する
+
+        移行・直接編集の取り込み直後でも、次の append_js が全体を書き直さずに末尾へ書き足せるようにする。
+        末尾が現在の出力形式の閉じ括弧（literal なら "\\n];\\n"）でなければ記録を消す
+        （次の append_js は emit_js で全体を書き直す）。
+        """
+        state = self._emit_state()
+        closing = _JS_SYNTAX[state["format"]][2].encode("utf-8")
+        size = self.js_path.stat().st_size
+        with open(self.js_path, "rb") as f:
+            f.seek(max(0, size - len(closing)))
+            ends_with_closing = f.read() == closing
+        if not ends_with_closing:
+            self.conn.execute("DELETE FROM meta WHERE key = 'js_tail'")
+            return
+        self.set_meta("js_tail", json.dumps(
+            {**state, "count": count, "next_id": self.max_id() + 1, "offset": size - len(closing)}))
+
+    def sync_from_js(self):
+        """questions.js が外部で変更されていれば取り込む（戻り値: 取り込んだか）"""
+        if self.get_meta("js_pending"):
+            # 書き足しの途中で止まった（閉じ括弧が無いかもしれない）→ ストアから作り直す
+            print("question_store: questions.js の書き足しが中断されていたため再生成します")
+            self.emit_js()
+            return False
+        if not self.js_changed():
+            return False
+        empty = self.count() == 0
+        n = self.import_js()
+        if empty:
+            print(f"question_store: questions.js から {n} 問をストアに移行しました")
+        else:
+            print(f"question_store: questions.js の直接編集を検知 → {n} 問を再取り込みしました")
+        return True
+
+    # ── クエリ ─────────────────────────────────────────────────────────────
+
+    def count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+
+    def texts(self, limit=None):
+        """text 一覧（ID 順）。limit を指定すると直近 limit 問"""
+        if limit is None:
+            rows = self.conn.execute("SELECT text FROM questions ORDER BY id")
+            return [r[0] for r in rows]
+        rows = self.conn.execute(
+            "SELECT text FROM questions ORDER BY id DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [r[0] for r in reversed(rows)]
+
+    def has_text(self, text):
+        row = self.conn.execute(
+            "SELECT 1 FROM questions WHERE norm_text = ? LIMIT 1", (normalize_text(text),)
+        ).fetchone()
+        return row is not None
+
+    def missing_axis(self):
+        """axis 未付与の問題（ID 順）"""
+        rows = self.conn.execute(
+            "SELECT * FROM questions WHERE axis IS NULL OR axis = '' ORDER BY id"
+        )
+        return [_row_to_question(r) for r in rows]
+
+    def by_diff(self, diff):
+        rows = self.conn.execute("SELECT * FROM questions WHERE diff = ? ORDER BY id", (diff,))
+        return [_row_to_question(r) for r in rows]
+
+    def by_audio(self, audio):
+        row = self.conn.execute("SELECT * FROM questions WHERE audio = ?", (audio,)).fetchone()
+        return _row_to_question(row) if row else None
+
+    def iter_questions(self, after_id=0):
+        """全問題（after_id を指定するとそれより後に追加された問題）を ID 順に dict で返す"""
+        for row in self.conn.execute("SELECT * FROM questions WHERE id > ? ORDER BY id", (after_id,)):
+            yield _row_to_question(row)
+
+    def max_id(self):
+        return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM questions").fetchone()[0]
+
+    def counts_by(self, field):
+        """diff / axis ごとの件数"""
+        assert field in ("diff", "axis")
+        rows = self.conn.execute(
+            f"SELECT {field}, COUNT(*) FROM questions GROUP BY {field} ORDER BY {field}"
+        )
+        return {r[0]: r[1] for r in rows}
+
+    # ── 音声メタデータ（audio_meta.py が更新）─────────────────────────────
+
+    def audio_meta(self):
+        """{audio パス: {bytes, mtime_ns, frames, duration, kbps, sample_rate, wps}}"""
+        rows = self.conn.execute("SELECT * FROM audio_meta")
+        return {r["audio"]: {f: r[f] for f in AUDIO_META_FIELDS[1:]} for r in rows}
+
+    def audio_durations(self):
+        """{audio パス: 秒}"""
+        return dict(self.conn.execute("SELECT audio, duration FROM audio_meta"))
+
+    def set_audio_meta(self, rows):
+        """スキャン結果を書き込む（rows: AUDIO_META_FIELDS をキーに持つ dict のリスト）"""
+        cols = ", ".join(AUDIO_META_FIELDS)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO audio_meta ({cols}) VALUES ({', '.join('?' * len(AUDIO_META_FIELDS))})",
+                [tuple(r[f] for f in AUDIO_META_FIELDS) for r in rows],
+            )
+
+    def delete_audio_meta(self, audios):
+        with self.conn:
+            self.conn.executemany("DELETE FROM audio_meta WHERE audio = ?", [(a,) for a in audios])
+
+    # ── 更新 ───────────────────────────────────────────────────────────────
+
+    def insert_questions(self, questions):
+        """問題を追加して ID を付与（questions の各 dict に "id" を書き込む）"""
+        with self.conn:
+            for q in questions:
+                cur = self.conn.execute(_INSERT, _question_params(q))
+                q["id"] = cur.lastrowid
+        return questions
+
+    def set_axis(self, text_to_axis, only_missing=True):
+        """text → axis の対応で axis を更新（戻り値: 更新件数）"""
+        # norm_text のインデックスで行を引く（text 列だけだと1件ごとに全表走査になる）
+        sql = "UPDATE questions SET axis = ? WHERE norm_text = ? AND text = ?"
+        if only_missing:
+            sql += " AND (axis IS NULL OR axis = '')"
+        with self.conn:
+            cur = self.conn.executemany(
+                sql, [(a, normalize_text(t), t) for t, a in text_to_axis.items()]
+            )
+        return cur.rowcount
+
+    # ── 出力 ───────────────────────────────────────────────────────────────
+
+    def emit_durations(self):
+        """questions.js・シャードに dur として出力する秒数（meta の emit_dur が無効なら空）"""
+        return self.audio_durations() if self.get_meta("emit_dur") == "1" else {}
+
+    def _emit_state(self):
+        """questions.js の出力設定（変わっていたら append_js は全体を書き直す）"""
+        return {"format": self.get_meta("js_format", "literal"), "dur": self.get_meta("emit_dur") == "1",
+                "rev": self.get_meta("rev")}
+
+    def emit_js(self, path=None):
+        """ストアから questions.js を生成（一時ファイルに書いて fsync してから置き換え）
+
+        行を1件ずつ読んでそのまま書き出すので、全問題をメモリに展開しない。
+        meta の emit_dur が有効なら audio_meta の秒数を dur として付ける（audio_meta.py --emit）。
+        meta の js_format が json なら JSON.parse('...') 形式にする。文字列内は行継続（行末のバックスラッシュ）で
+        1行1問に保つので、git の差分は従来どおり追加した行だけになる。
+        公開用の questions.js を生成したときは、レベル別シャードも変更分だけ更新する（question_shards.py）。
+        """
+        path = Path(path) if path else self.js_path
+        total = self.count()
+        durations = self.emit_durations()
+        state = self._emit_state()
+
+        def questions():
+            for q in self.iter_questions():
+                if q.get("audio") in durations:
+                    q["dur"] = round(durations[q["audio"]], 2)
+                yield q
+
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            for chunk in iter_js_chunks(questions(), total, state["format"], closing=False):
+                f.write(chunk.encode("utf-8"))
+            offset = f.tell()
+            f.write(_JS_SYNTAX[state["format"]][2].encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        if path == self.js_path:
+            with self.conn:
+                self._record_js()
+                self.set_meta("js_tail", json.dumps(
+                    {**state, "count": total, "next_id": self.max_id() + 1, "offset": offset}))
+                self.conn.execute("DELETE FROM meta WHERE key = 'js_pending'")
+            question_shards.emit(self)
+        return total
+
+    def append_js(self):
+        """前回の出力以降に追加された問題だけを questions.js の末尾に書き足す
+
+        meta の js_tail（件数・次の ID・閉じ括弧の位置）を使い、閉じ括弧から後ろだけを
+        新しい問題 + 閉じ括弧で上書きしてヘッダーの件数を書き換える（既存部分は読まない）。
+        書き足しの間は meta に js_pending を立てておき、途中で止まったら次に開いたとき作り直す。
+        初回・questions.js の直接編集・既存問題の更新や削除・出力設定の変更・件数の桁が変わって
+        ヘッダーの長さが変わる場合は emit_js で全体を書き直す。
+        シャードも追加分だけを書き足す（question_shards.append）。
+        戻り値: 問題の総数
+        """
+        tail = json.loads(self.get_meta("js_tail") or "null")
+        state = self._emit_state()
+        if (not tail or {k: tail.get(k) for k in state} != state or not self.js_path.exists()
+                or self.get_meta("js_stamp") != _file_stamp(self.js_path)):
+            return self.emit_js()
+
+        new = list(self.iter_questions(after_id=tail["next_id"] - 1))
+        total = self.count()
+        if total != tail["count"] + len(new):
+            return self.emit_js()
+        if not new:
+            return total
+
+        header, new_header = _js_header(tail["count"]), _js_header(total)
+        _, sep, closing = _JS_SYNTAX[state["format"]]
+        if len(header.encode("utf-8")) != len(new_header.encode("utf-8")):
+            return self.emit_js()
+
+        if state["dur"]:
+            for q in new:
+                row = self.conn.execute("SELECT duration FROM audio_meta WHERE audio = ?",
+                                        (q.get("audio"),)).fetchone()
+                if row:
+                    q["dur"] = round(row[0], 2)
+        body = "".join((sep if i or tail["count"] else "") + format_js_record(q, state["format"])
+                       for i, q in enumerate(new)).encode("utf-8")
+
+        with open(self.js_path, "r+b") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(tail["offset"])
+            if f.read().decode("utf-8", "replace") != closing or size != tail["offset"] + len(closing.encode()):
+                return self.emit_js()
+            f.seek(0)
+            if f.read(len(header.encode("utf-8"))) != header.encode("utf-8"):
+                return self.emit_js()
+
+            with self.conn:
+                self.set_meta("js_pending", "1")
+            f.seek(tail["offset"])
+            f.write(body + closing.encode("utf-8"))
+            f.truncate()
+            f.seek(0)
+            f.write(new_header.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+        with self.conn:
+            self.set_meta("js_stamp", _file_stamp(self.js_path))
+            self.set_meta("js_sha1", "")     # 全体を読まないと分からないので記録しない
+            self.set_meta("js_tail", json.dumps({**state, "count": total, "next_id": self.max_id() + 1,
+                                                 "offset": tail["offset"] + len(body)}))
+            self.conn.execute("DELETE FROM meta WHERE key = 'js_pending'")
+        question_shards.append(self, new)
+        return total
+
+
+def _js_header(total):
+    return f"// questions.js — {total} questions\n"
+
+
+def format_js_record(q, fmt="literal"):
+    """questions.js の1問分（区切りは含まない）"""
+    if fmt == "json":
+        record = question_shards.to_record(q)
+        return js_single_quote(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+    return format_question_js(q)
+
+
+def iter_js_chunks(questions, total, fmt="literal", closing=True):
+    """questions.js の中身を先頭から少しずつ返す（emit_js と bench_js_parse.py で共用）"""
+    opening, sep, close = _JS_SYNTAX[fmt]
+    yield _js_header(total)
+    yield opening
+    first = True
+    for q in questions:
+        if not first:
+            yield sep
+        yield format_js_record(q, fmt)
+        first = False
+    if closing:
+        yield close
+
+
+def open_store(sync=True):
+    """ストアを開く。未移行・questions.js が直接編集済みなら自動で取り込む"""
+    store = QuestionStore()
+    if sync:
+        store.sync_from_js()
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="問題ストア（questions.db）の移行・生成・統計")
+    parser.add_argument("--migrate", action="store_true", help="questions.js からストアを作り直す")
+    parser.add_argument("--emit", action="store_true", help="ストアから questions.js を再生成")
+    parser.add_argument("--format", choices=JS_FORMATS,
+                        help="questions.js の形式を切り替えて再生成（設定はストアに保存。"
+                             "クイズはシャードを読むので、効くのは questions.js を直接読む外部の利用者だけ）")
+    args = parser.parse_args()
+
+    if args.migrate:
+        if not QUESTIONS_JS.exists():
+            print(f"ERROR: {QUESTIONS_JS} が見つかりません", file=sys.stderr)
+            sys.exit(1)
+        with QuestionStore() as store:
+            n = store.import_js()
+        print(f"✅ questions.js から {n} 問をストアに移行しました（{STORE_DB}）")
+        return
+
+    with open_store() as store:
+        if args.format:
+            with store.conn:
+                store.set_meta("js_format", args.format)
+        if args.emit or args.format:
+            n = store.emit_js()
+            print(f"✅ questions.js を再生成しました（{n} 問、{store.get_meta('js_format', 'literal')} 形式）")
+            return
+
+        print(f"ストア: {STORE_DB}")
+        print(f"  問題数: {store.count()} 問")
+        print("  diff 別: " + ", ".join(f"{k}={v}" for k, v in store.counts_by("diff").items()))
+        print("  axis 別: " + ", ".join(f"{k or '未付与'}={v}" for k, v in store.counts_by("axis").items()))
+
+
+if __name__ == "__main__":
+    main()
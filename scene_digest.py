@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+scene_digest.py - 既存問題の場面別ダイジェスト（重複回避用の除外セクション）
+
+既存問題の英文を「交通・飲食店・職場…」などの場面にキーワードで振り分け、
+場面ごとの件数・よく出る語・代表例数件だけをまとめる。英文リストをそのまま
+プロンプトに載せるより1桁小さく、しかも問題バンク全体をカバーできる。
+
+generate_questions.py / get_prompt.py の build_prompt が除外セクションとして使う。
+
+Usage:
+  python3 scene_digest.py              # ダイジェストを表示（サイズ比較つき）
+  python3 scene_digest.py --per-scene 8
+"""
+
+import argparse
+import json
+import re
+from collections import Counter
+
+from dedup_index import load_bank_texts
+
+# 場面名 → キーワード（語単位の完全一致。活用形・複数形は "/" で並べて明示する）
+# 1つの語は1つの場面にだけ置く（複数の場面に当たる文はヒット数の多い方、同数なら先の場面）
+SCENES = {
+    "交通・移動": [
+        "train/trains", "bus/buses", "station", "subway", "metro", "platform", "taxi", "uber",
+        "cab", "traffic", "drive/drives/driving/drove/driven", "car/cars", "parking",
+        "flight/flights", "airport", "plane", "gate", "boarding", "commute/commuting",
+        "ride/rides/riding/rode", "highway", "gas", "ticket/tickets",
+    ],
+    "飲食店・食事": [
+        "restaurant", "table", "menu", "order/orders/ordered/ordering", "waiter", "server",
+        "food", "coffee", "lunch", "dinner", "breakfast", "brunch", "eat/eats/eating/ate/eaten",
+        "drink/drinks/drinking/drank", "cafe", "bar", "pizza", "cook/cooks/cooking/cooked",
+        "recipe", "kitchen", "delicious", "spicy", "check", "tip",
+    ],
+    "職場・仕事": [
+        "meeting/meetings", "boss", "deadline/deadlines", "client/clients", "project/projects",
+        "office", "email/emails/emailed", "team", "manager", "report/reports",
+        "presentation", "promotion", "job/jobs", "interview", "coworker/coworkers",
+        "colleague/colleagues", "shift/shifts", "salary", "raise", "quit", "hired", "fired",
+        "company", "work/works/working/worked", "slack", "zoom",
+    ],
+    "家・家族・住まい": [
+        "home", "house", "apartment", "landlord", "rent", "roommate/roommates",
+        "neighbor/neighbors", "kid/kids", "mom", "dad", "parents", "sister", "brother",
+        "wife", "husband", "family", "laundry", "dishes", "clean/cleaning/cleaned",
+        "moving", "moved", "lease", "couch", "baby",
+    ],
+    "天気・季節": [
+        "weather", "rain/rains/raining/rained", "umbrella", "snow/snowing", "sunny", "hot",
+        "cold", "freezing", "humid", "storm", "forecast", "temperature", "winter", "summer",
+        "spring", "fall",
+    ],
+    "買い物・お金": [
+        "store/stores", "shop/shops", "shopping", "buy/buys/buying/bought", "price/prices",
+        "sale/sales", "discount", "size", "return/returned", "receipt", "refund", "cashier",
+        "cart", "online", "money", "card/cards", "pay/pays/paying/paid", "bank", "budget",
+        "expensive", "cheap", "deal",
+    ],
+    "健康・病院・運動": [
+        "doctor", "hospital", "sick", "fever", "flu", "headache", "medicine", "pharmacy",
+        "appointment", "dentist", "gym", "workout/workouts", "run/runs/running/ran",
+        "exercise", "diet", "sleep/sleeping/slept", "tired", "hurt/hurts", "injury",
+        "allergic", "yoga", "shower",
+    ],
+    "学校・勉強": [
+        "school", "class/classes", "teacher", "professor", "exam/exams", "test/tests",
+        "homework", "study/studies/studying/studied", "grade/grades", "semester", "college",
+        "university", "lecture", "assignment", "learning", "campus",
+    ],
+    "旅行・ホテル": [
+        "hotel", "trip", "travel/traveling", "vacation", "booked", "reservation", "check-in",
+        "passport", "luggage", "suitcase", "tour", "beach", "abroad", "sightseeing",
+    ],
+    "友人・趣味・イベント": [
+        "party", "birthday", "friend/friends", "date", "wedding", "concert", "movie/movies",
+        "show", "game/games", "music", "band", "weekend", "hang", "festival", "netflix", "series",
+    ],
+    "スマホ・IT": [
+        "phone", "app/apps", "laptop", "computer", "wifi", "password", "battery", "charger",
+        "update", "screen", "text/texts/texted/texting", "message/messages", "internet",
+        "website", "account",
+    ],
+}
+
+
+def _keyword_scenes(scenes):
+    """{語: 場面}。同じ語が2つの場面にあれば ValueError"""
+    out = {}
+    for scene, keywords in scenes.items():
+        for entry in keywords:
+            for word in entry.split("/"):
+                if word in out:
+                    raise ValueError(f"キーワード {word!r} が {out[word]} と {scene} の両方にあります")
+                out[word] = scene
+    return out
+
+
+KEYWORD_SCENES = _keyword_scenes(SCENES)
+OTHER_SCENE = "その他"
+
+DEFAULT_PER_SCENE = 5     # 場面ごとの代表例数
+DEFAULT_TOP_WORDS = 8     # 場面ごとの「よく出る語」数
+
+_WORD = re.compile(r"[a-z][a-z'\-]*")
+_STOPWORDS = set("""
+a an the and or but so to of in on at for with from by about as into over up down out off
+i i'm i've i'll i'd me my you you're your we we're our they they're them their he she it it's
+is are was were be been being am do does did done have has had just really that this these those
+there there's what when where why how who not no yes can can't could would should will don't
+didn't gonna wanna kinda dunno lemme gotta hafta all some any more much very too again still
+than then like know think get got go going went come back time one two three
+now need way here every first last already finally actually honestly right whole made
+make take took day days week weeks weekend month months year years minutes hour hours
+good bit might left leave before after someone something saying said an' 'cause
+""".split())
+
+
+def _words(text):
+    return _WORD.findall(text.lower())
+
+
+def classify_scene(text):
+    """英文を最もキーワードのヒットが多い場面に振り分ける（同数なら SCENES の先の場面）"""
+    hits = Counter()
+    for w in _words(text):
+        scene = KEYWORD_SCENES.get(w.removesuffix("'s"))
+        if scene:
+            hits[scene] += 1
+    if not hits:
+        return OTHER_SCENE
+    return max(SCENES, key=lambda scene: hits[scene])
+
+
+def cluster_texts(texts):
+    """{場面: [text, ...]}（元の順序を保持）"""
+    clusters = {}
+    for t in texts:
+        clusters.setdefault(classify_scene(t), []).append(t)
+    return clusters
+
+
+def _representatives(texts, k):
+    """バンク全体から均等な間隔で k 件（古い問題・新しい問題の両方を含める）"""
+    if len(texts) <= k:
+        return list(texts)
+    step = len(texts) / k
+    return [texts[int(i * step + step / 2)] for i in range(k)]
+
+
+def _top_words(texts, k):
+    counter = Counter(
+        w for t in texts for w in set(_words(t))
+        if w not in _STOPWORDS and len(w) > 2
+    )
+    return [w for w, _ in counter.most_common(k)]
+
+
+def build_digest(texts, per_scene=DEFAULT_PER_SCENE, top_words=DEFAULT_TOP_WORDS):
+    """プロンプト用の除外セクション（場面別の件数・頻出語・代表例）を返す"""
+    clusters = cluster_texts(texts)
+    order = sorted(clusters, key=lambda s: (s == OTHER_SCENE, -len(clusters[s])))
+
+    lines = [
+        f"既存の {len(texts)} 問を場面別に集計したものです。件数の多い場面は避け、",
+        "代表例と同じ・似たシチュエーション（同じ場面で同じ出来事）の問題は作らないでください。",
+    ]
+    for scene in order:
+        members = clusters[scene]
+        lines.append("")
+        lines.append(f"### {scene}（{len(members)}問）")
+        words = _top_words(members, top_words)
+        if words:
+            lines.append(f"よく出る語: {', '.join(words)}")
+        # 件数の多い場面は代表例を増やす（最大 2 倍）
+        k = min(per_scene * 2, max(per_scene, len(members) // 40))
+        for t in _representatives(members, k):
+            lines.append(f"- {json.dumps(t, ensure_ascii=False)}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="既存問題の場面別ダイジェストを表示")
+    parser.add_argument("--per-scene", type=int, default=DEFAULT_PER_SCENE,
+                        help=f"場面ごとの代表例数（デフォルト: {DEFAULT_PER_SCENE}）")
+    args = parser.parse_args()
+
+    texts = load_bank_texts()
+    digest = build_digest(texts, per_scene=args.per_scene)
+    full = json.dumps(texts, ensure_ascii=False, indent=2)
+    print(digest)
+    print(f"\nサイズ: ダイジェスト {len(digest.encode('utf-8')):,} bytes / "
+          f"全文リスト {len(full.encode('utf-8')):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""lib.file_lock（公開ロック）と子プロセスへの引き継ぎのテスト
+
+  python3 -m pytest tests/
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from lib import HELD_LOCK_ENV, file_lock, held_lock_env  # noqa: E402
+
+# 子プロセスでロックを取りに行き、取れたかを終了コードで返す（0: 取れた 1: 保持中）
+CHILD = f"""
+import sys
+sys.path.insert(0, {str(REPO_ROOT)!r})
+from lib import file_lock
+with file_lock(sys.argv[1]) as locked:
+    sys.exit(0 if locked else 1)
+"""
+
+
+class FileLockTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.lock = self.tmp / ".publish.lock"
+        self.env = {k: v for k, v in os.environ.items() if k != HELD_LOCK_ENV}
+
+    def child(self, path, env):
+        return subprocess.run([sys.executable, "-c", CHILD, str(path)], env=env).returncode
+
+    def test_other_process_is_refused(self):
+        with file_lock(self.lock) as locked:
+            self.assertTrue(locked)
+            self.assertEqual(self.child(self.lock, self.env), 1)
+        self.assertEqual(self.child(self.lock, self.env), 0)
+
+    def test_child_inherits_held_lock(self):
+        with file_lock(self.lock):
+            self.assertEqual(self.child(self.lock, held_lock_env(self.lock)), 0)
+            # 別のロックファイルには引き継がれない
+            other = self.tmp / "other.lock"
+            with file_lock(other):
+                self.assertEqual(self.child(other, held_lock_env(self.lock)), 1)
+
+    def test_stale_env_from_other_parent_is_ignored(self):
+        env = dict(self.env, **{HELD_LOCK_ENV: f"1:{os.path.realpath(self.lock)}"})
+        with file_lock(self.lock):
+            self.assertEqual(self.child(self.lock, env), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
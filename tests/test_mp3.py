@@ -0,0 +1,123 @@
+"""lib.mp3_frame_header / audio_meta.scan_mp3（MP3 のフレームヘッダ解析）のテスト
+
+  python3 -m pytest tests/
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from audio_meta import scan_mp3  # noqa: E402
+from lib import id3v2_size, mp3_frame_header, mp3_is_info_frame  # noqa: E402
+
+# MPEG2 Layer III / 24kHz / mono / CRC なし（edge-tts の出力と同じ形式）
+MPEG2_L3 = 0xF3
+BITRATE_IDX = {48: 6, 64: 8}    # MPEG2 のビットレート表の位置
+RATE_24K = 1
+
+
+def frame(kbps=48, padding=False, body=b""):
+    """1フレーム分のバイト列（ヘッダ + 中身。残りは 0x55 で埋める）"""
+    header = bytes([0xFF, MPEG2_L3, BITRATE_IDX[kbps] << 4 | RATE_24K << 2 | int(padding) << 1, 0xC4])
+    length = 576 // 8 * kbps * 1000 // 24000 + int(padding)
+    return header + body + b"\x55" * (length - 4 - len(body))
+
+
+def id3v2_tag(payload):
+    size = len(payload)
+    synchsafe = bytes([(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F])
+    return b"ID3\x04\x00\x00" + synchsafe + payload
+
+
+class FrameHeaderTest(unittest.TestCase):
+
+    def test_mpeg2_layer3(self):
+        self.assertEqual(mp3_frame_header(frame(), 0), (144, 48, 24000, 576))
+        self.assertEqual(mp3_frame_header(frame(padding=True), 0), (145, 48, 24000, 576))
+
+    def test_mpeg1_layer3(self):
+        # 128 kbps / 44.1kHz: 1152 / 8 * 128000 / 44100 = 417.9 → 417
+        self.assertEqual(mp3_frame_header(b"\xff\xfb\x90\x00", 0), (417, 128, 44100, 1152))
+
+    def test_position(self):
+        buf = b"\x00\x00" + frame()
+        self.assertIsNone(mp3_frame_header(buf, 0))
+        self.assertEqual(mp3_frame_header(buf, 2)[0], 144)
+
+    def test_invalid_headers(self):
+        for header in (
+            b"\xfe\xf3\x64\xc4",    # 同期ビットなし
+            b"\xff\xeb\x64\xc4",    # 予約のバージョン
+            b"\xff\xf5\x64\xc4",    # Layer II
+            b"\xff\xf3\x04\xc4",    # ビットレート free
+            b"\xff\xf3\xf4\xc4",    # ビットレート不正
+            b"\xff\xf3\x6c\xc4",    # サンプリングレート予約
+            b"\xff\xf3\x64",        # 4バイトに足りない
+        ):
+            self.assertIsNone(mp3_frame_header(header, 0), header.hex())
+
+    def test_id3v2_size(self):
+        self.assertEqual(id3v2_size(id3v2_tag(b"\x00" * 300)), 310)
+        footer = bytearray(id3v2_tag(b"\x00" * 20))
+        footer[5] = 0x10
+        self.assertEqual(id3v2_size(footer), 40)
+        self.assertEqual(id3v2_size(frame()), 0)
+
+    def test_info_frame(self):
+        info = frame(64, body=b"\x00" * 9 + b"Info")
+        self.assertTrue(mp3_is_info_frame(info, 0, len(info)))
+        self.assertFalse(mp3_is_info_frame(frame(), 0, 144))
+
+
+class ScanMp3Test(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def scan(self, data):
+        path = self.tmp / "q1.mp3"
+        path.write_bytes(data)
+        return scan_mp3(path)
+
+    def test_clean_file(self):
+        info = self.scan(frame() * 50)
+        self.assertEqual((info["frames"], info["duration"], info["kbps"], info["sample_rate"]),
+                         (50, 1.2, 48.0, 24000))
+        self.assertEqual((info["sync_errors"], info["truncated"]), (0, False))
+
+    def test_tag_info_frame_garbage_and_truncated_tail(self):
+        data = (
+            id3v2_tag(b"TIT2" + b"\xff\xf3\x64\xc4" * 8)    # タグ内のフレームらしいバイト列は読まない
+            + frame(64, body=b"\x00" * 9 + b"Info")         # Info フレームは数えない
+            + frame() * 20
+            + b"\x00\xff\x00\x11"                          # フレーム間のゴミ（同期外れ 2 回）
+            + frame(padding=True) * 20
+            + frame()[:60]                                  # 途切れた最後のフレーム
+        )
+        info = self.scan(data)
+        self.assertEqual(info["bytes"], len(data))
+        self.assertEqual(info["frames"], 40)
+        self.assertEqual(info["duration"], 0.96)            # 40 * 576 / 24000
+        self.assertEqual(info["kbps"], round((20 * 144 + 20 * 145) * 8 / 0.96 / 1000, 1))
+        self.assertEqual(info["sync_errors"], 2)
+        self.assertTrue(info["truncated"])
+
+    def test_id3v1_tag_is_excluded(self):
+        info = self.scan(frame() * 10 + b"TAG" + b"\x00" * 125)
+        self.assertEqual((info["frames"], info["sync_errors"], info["truncated"]), (10, 0, False))
+
+    def test_empty_and_non_mp3(self):
+        self.assertEqual(self.scan(b"")["frames"], 0)
+        info = self.scan(b"not an mp3 file at all")
+        self.assertEqual(info["frames"], 0)
+        self.assertEqual(info["duration"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""question_store の questions.js 生成・書き足しのテスト
+
+  python3 -m pytest tests/
+  python3 -m unittest discover tests
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import question_compact  # noqa: E402
+import question_shards  # noqa: E402
+from lib import load_questions_js  # noqa: E402
+from question_store import QUESTIONS_JS, QuestionStore, _js_header, iter_js_chunks  # noqa: E402
+
+NEW_QUESTION = {
+    "diff": "lv2", "axis": "context", "text": "Could you hold the elevator for me?",
+    "ja": "エレベーターを止めておいてもらえますか？", "answer": "エレベーターを待ってほしいと頼んでいる",
+    "choices": ["エレベーターを待ってほしいと頼んでいる", "階段を使おうと提案している"],
+    "audio": "audio/q99999.mp3", "expl": "hold the elevator は「扉を押さえて待つ」。",
+    "kp": ["hold the elevator"],
+}
+
+
+@unittest.skipUnless(QUESTIONS_JS.exists(), "listening/questions.js がありません")
+class AppendAfterMigrateTest(unittest.TestCase):
+    """移行直後の append_js が既存部分を書き換えないこと"""
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.js = self.tmp / "questions.js"
+        shutil.copyfile(QUESTIONS_JS, self.js)
+        self.original = self.js.read_bytes()
+        shard_dir = self.tmp / "shards"
+        for patcher in (mock.patch.object(question_shards, "SHARD_DIR", shard_dir),
+                        mock.patch.object(question_shards, "SHARD_MANIFEST", shard_dir / "manifest.json")):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.store = QuestionStore(path=self.tmp / "questions.db", js_path=self.js)
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.addCleanup(self.store.close)
+
+    def test_emit_after_migrate_is_byte_identical(self):
+        self.store.import_js()
+        self.store.emit_js()
+        self.assertEqual(self.js.read_bytes(), self.original)
+
+    def test_append_after_migrate_keeps_existing_lines(self):
+        count = self.store.import_js()
+        self.store.insert_questions([dict(NEW_QUESTION)])
+        # 全体の書き直しに落ちたら失敗させる
+        with mock.patch.object(QuestionStore, "emit_js", side_effect=AssertionError("emit_js が呼ばれた")):
+            total = self.store.append_js()
+        self.assertEqual(total, count + 1)
+
+        old_lines = self.original.split(b"\n")
+        new_lines = self.js.read_bytes().split(b"\n")
+        self.assertEqual(new_lines[0] + b"\n", _js_header(count + 1).encode("utf-8"))
+        # ヘッダーと閉じ括弧を除いた既存の行（最後の問題には区切りのカンマが付く）
+        body = old_lines[1:-3]
+        self.assertEqual(new_lines[1:len(body) + 1], body)
+        self.assertEqual(new_lines[len(body) + 1], old_lines[-3] + b",")
+        self.assertIn(b'audio: "audio/q99999.mp3"', new_lines[len(body) + 2])
+        self.assertEqual(new_lines[-2:], [b"];", b""])
+
+
+class ExtraFieldsTest(unittest.TestCase):
+    """ストアの extra 列（決まったフィールド以外のキー）が出力・取り込み直しで失われないこと"""
+
+    EXTRA = {"source": "podcast", "tags": ["office", "idiom"], "note-1": 'say "hi"'}
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        shard_dir = self.tmp / "shards"
+        for patcher in (mock.patch.object(question_shards, "SHARD_DIR", shard_dir),
+                        mock.patch.object(question_shards, "SHARD_MANIFEST", shard_dir / "manifest.json")):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def roundtrip(self, fmt):
+        js = self.tmp / f"questions_{fmt}.js"
+        js.write_text("".join(iter_js_chunks([{**NEW_QUESTION, **self.EXTRA}], 1, fmt)), encoding="utf-8")
+        with QuestionStore(path=self.tmp / f"{fmt}.db", js_path=js) as store:
+            store.set_meta("js_format", fmt)
+            store.import_js()
+            store.emit_js()
+            store.import_js()
+            stored = list(store.iter_questions())
+        return load_questions_js(js), stored
+
+    def test_literal_and_json_forms_keep_extra_keys(self):
+        for fmt in ("literal", "json"):
+            emitted, stored = self.roundtrip(fmt)
+            self.assertEqual(emitted, [{**NEW_QUESTION, **self.EXTRA}], fmt)
+            self.assertEqual({k: stored[0][k] for k in self.EXTRA}, self.EXTRA, fmt)
+
+    def test_records_and_compact_keep_extra_keys(self):
+        q = {**NEW_QUESTION, **self.EXTRA, "id": 7}
+        record = question_shards.to_record(q)
+        self.assertNotIn("id", record)
+        self.assertEqual({k: record[k] for k in self.EXTRA}, self.EXTRA)
+        records = [record, question_shards.to_record(dict(NEW_QUESTION, audio="audio/q2.mp3"))]
+        self.assertEqual(question_compact.decode(question_compact.encode(records)), records)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+"""scene_digest.classify_scene（語単位のキーワード一致）のテスト
+
+  python3 -m pytest tests/
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from scene_digest import OTHER_SCENE, SCENES, _keyword_scenes, classify_scene  # noqa: E402
+
+
+class ClassifySceneTest(unittest.TestCase):
+
+    def test_no_prefix_matches(self):
+        """app → apparently / bus → business / car → careful のような前方一致はしない"""
+        cases = {
+            "Apparently the business meeting got moved.": "職場・仕事",
+            "Be careful with that card, it's the only one I have.": "買い物・お金",
+            "I took a shower after my workout.": "健康・病院・運動",
+            "That hotel was barely okay.": "旅行・ホテル",
+            "He barely finished the homework.": "学校・勉強",
+            "Honestly, I have no idea.": OTHER_SCENE,
+        }
+        for text, scene in cases.items():
+            self.assertEqual(classify_scene(text), scene, text)
+
+    def test_listed_inflections_match(self):
+        self.assertEqual(classify_scene("We drove all night."), "交通・移動")
+        self.assertEqual(classify_scene("She texted me twice."), "スマホ・IT")
+        self.assertEqual(classify_scene("My friend's birthday."), "友人・趣味・イベント")
+
+    def test_each_keyword_has_one_scene(self):
+        _keyword_scenes(SCENES)     # 重複があれば ValueError
+        with self.assertRaises(ValueError):
+            _keyword_scenes({"a": ["cold"], "b": ["hot/cold"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""lib.QuestionStreamParser / parse_response（途中で切れた出力の回収）のテスト
+
+  python3 -m pytest tests/
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from lib import QuestionStreamParser, parse_response  # noqa: E402
+
+
+def question(i, text=None):
+    return {
+        "diff": "lv3", "text": text or f"Question {i}", "ja": f"問題 {i}", "answer": "A",
+        "choices": ["A", "B", "C", "D", "E"], "expl": "説明", "kp": ["kp"],
+    }
+
+
+def feed_all(chunks):
+    parser = QuestionStreamParser()
+    out = []
+    for chunk in chunks:
+        out.extend(parser.feed(chunk))
+    return parser, out
+
+
+class QuestionStreamParserTest(unittest.TestCase):
+
+    def test_every_split_point(self):
+        """どこで2つに切っても（文字列・エスケープの途中を含む）同じ結果になる"""
+        qs = [question(1, 'He said "wait {here}"\\ and left.'), question(2, "Brace } in text")]
+        raw = "```json\n" + json.dumps(qs, ensure_ascii=False, indent=2) + "\n```"
+        for i in range(len(raw) + 1):
+            parser, out = feed_all([raw[:i], raw[i:]])
+            self.assertEqual(out, qs, f"split at {i}: {raw[max(0, i - 10):i]!r}|{raw[i:i + 10]!r}")
+            self.assertFalse(parser.pending)
+
+    def test_split_mid_escape(self):
+        q = question(1, 'quote \\" and backslash \\\\ end')
+        raw = json.dumps([q])
+        cut = raw.index("\\") + 1           # バックスラッシュの直後で切る
+        self.assertEqual(raw[cut - 1], "\\")
+        _, out = feed_all([raw[:cut], raw[cut:]])
+        self.assertEqual(out, [q])
+
+    def test_one_character_chunks(self):
+        qs = [question(i, f'Line {i} with \\"escaped\\" {{braces}}') for i in range(3)]
+        raw = json.dumps(qs)
+        _, out = feed_all(list(raw))
+        self.assertEqual(out, qs)
+
+    def test_trailing_partial_object(self):
+        """最後のオブジェクトが途中で切れても、完結した分は返し pending になる"""
+        qs = [question(1), question(2)]
+        raw = json.dumps(qs + [question(3)])
+        truncated = raw[:raw.rindex('"ja"')]
+        parser, out = feed_all([truncated])
+        self.assertEqual(out, qs)
+        self.assertTrue(parser.pending)
+        self.assertEqual(parser.parsed, 2)
+
+    def test_invalid_objects_are_counted(self):
+        bad = dict(question(2), choices=["A", "B"])
+        raw = json.dumps([question(1), bad, {"diff": "lv9"}])
+        parser, out = feed_all([raw])
+        self.assertEqual(out, [question(1)])
+        self.assertEqual((parser.parsed, parser.rejected), (3, 2))
+
+
+class ParseResponseTest(unittest.TestCase):
+
+    def test_complete_response(self):
+        qs = [question(1), question(2)]
+        self.assertEqual(parse_response("```json\n" + json.dumps(qs) + "\n```"), qs)
+
+    def test_truncated_mid_string_salvages_complete_objects(self):
+        raw = json.dumps([question(1), question(2, "This sentence is cut off right")])
+        truncated = raw[:raw.index("cut off") + 3]
+        self.assertEqual(parse_response(truncated), [question(1)])
+
+    def test_nothing_salvageable(self):
+        raw = '[{"diff": "lv1", "text": "cut'
+        self.assertEqual(parse_response(raw, raise_on_error=False), [])
+        with self.assertRaises(json.JSONDecodeError):
+            parse_response(raw)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""word_timings（kp の再生位置の索引）の更新とマニフェストへの登録のテスト
+
+  python3 -m pytest tests/
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import question_shards  # noqa: E402
+import question_store  # noqa: E402
+import tts_cache  # noqa: E402
+import word_timings  # noqa: E402
+from question_store import QuestionStore  # noqa: E402
+
+WORDS = [[0.1, 0.2, "Could"], [0.3, 0.2, "you"], [0.5, 0.2, "hold"], [0.7, 0.1, "the"], [0.8, 0.5, "elevator?"]]
+
+
+def question(n, kp):
+    return {
+        "diff": "lv2", "text": f"Could you hold the elevator {n}?", "ja": "止めておいて", "answer": "A",
+        "choices": ["A", "B", "C", "D", "E"], "audio": f"audio/q{n}.mp3", "expl": "説明", "kp": kp,
+    }
+
+
+class WordTimingsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        shard_dir = self.tmp / "shards"
+        self.index = self.tmp / "timings.json"
+        for patcher in (
+            mock.patch.object(question_shards, "LISTENING_DIR", self.tmp),
+            mock.patch.object(question_shards, "SHARD_DIR", shard_dir),
+            mock.patch.object(question_shards, "SHARD_MANIFEST", shard_dir / "manifest.json"),
+            mock.patch.object(word_timings, "TIMINGS_INDEX", self.index),
+            mock.patch.object(word_timings, "load_post_manifest", return_value={}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_rebuild_keeps_entries_without_local_timings(self):
+        questions = [question(1, ["hold the elevator"]), question(2, ["hold"]), question(3, ["the", "you"])]
+        store = QuestionStore(path=self.tmp / "questions.db", js_path=self.tmp / "questions.js")
+        self.addCleanup(store.close)
+        store.insert_questions(questions)
+        word_timings.save_index({
+            "audio/q1.mp3": [[500, 1300]],          # 手元にタイミングなし → 残す
+            "audio/q3.mp3": [[700, 800]],           # kp の数が変わった → 外す
+            "audio/q9.mp3": [[0, 100]],             # ストアに無い → 外す
+        })
+        cache = {"audio/q2.mp3": "k2"}
+        with mock.patch.object(question_store, "open_store", return_value=store), \
+                mock.patch.object(tts_cache, "load_manifest", return_value=cache), \
+                mock.patch.object(tts_cache, "load_timings", side_effect=lambda key: WORDS):
+            entries = word_timings.rebuild()
+        self.assertEqual(len(entries), 3)
+        self.assertEqual(word_timings.load_index(), {
+            "audio/q1.mp3": [[500, 1300]],
+            "audio/q2.mp3": [[500, 700]],
+        })
+
+    def test_index_is_listed_in_manifest(self):
+        question_shards.write_shards([question(1, ["hold"])])
+        word_timings.update_index([("audio/q1.mp3", WORDS, ["hold the elevator"])])
+        manifest = question_shards.load_manifest()
+        entry = manifest["files"]["timings"]
+        self.assertEqual(entry["file"], "timings.json")
+        self.assertEqual(entry["bytes"], self.index.stat().st_size)
+        # シャードを作り直しても files は残る
+        question_shards.write_shards([question(1, ["hold"]), question(2, ["hold"])])
+        self.assertEqual(question_shards.load_manifest()["files"]["timings"], entry)
+        self.assertEqual(json.loads(self.index.read_text(encoding="utf-8"))["clips"],
+                         {"audio/q1.mp3": [[500, 1300]]})
+
+    def test_no_manifest_no_listing(self):
+        word_timings.update_index([("audio/q1.mp3", WORDS, ["hold"])])
+        self.assertFalse(question_shards.SHARD_MANIFEST.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+tts_cache.py - edge-tts 音声のコンテンツアドレス型キャッシュ
+
+(text, voice, TTS パラメータ) のハッシュをキーに MP3 を保存し、
+同じ内容の合成を二度と行わないようにする。add_questions.py が合成前に参照する。
+
+構成:
+  listening/tts_cache/blobs/ab/abcdef....mp3  # キー = sha256
+  listening/tts_cache/blobs/ab/abcdef....json # 合成時の単語タイミング（WordBoundary）
+  listening/tts_cache/manifest.json           # {"audio/q801.mp3": "<key>", ...}
+
+Usage:
+  python3 tts_cache.py            # キャッシュ統計を表示
+  python3 tts_cache.py --gc       # manifest から参照されていない blob を削除
+  python3 tts_cache.py --gc --dry-run
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent
+LISTENING_DIR = REPO_ROOT / "listening"
+CACHE_DIR = LISTENING_DIR / "tts_cache"
+BLOB_DIR = CACHE_DIR / "blobs"
+MANIFEST = CACHE_DIR / "manifest.json"
+
+# キー形式を変えたら上げる（古い blob は GC で回収される）
+CACHE_VERSION = 1
+
+
+def cache_key(text, voice, params):
+    """(text, voice, TTS パラメータ) から sha256 キーを作る"""
+    payload = json.dumps(
+        {"v": CACHE_VERSION, "text": text, "voice": voice, "params": params},
+        ensure_ascii=False, sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def blob_path(key):
+    """キーに対応する blob のパス（先頭2文字でディレクトリを分ける）"""
+    return BLOB_DIR / key[:2] / f"{key}.mp3"
+
+
+def has_blob(key):
+    path = blob_path(key)
+    return path.exists() and path.stat().st_size > 0
+
+
+def store_blob(key, src_path):
+    """既存の MP3 を blob としてキャッシュに取り込む"""
+    dest = blob_path(key)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(dest.name + ".part")
+    shutil.copyfile(src_path, tmp)
+    tmp.replace(dest)
+
+
+def materialize(key, output_path):
+    """blob を output_path にコピー（blob が無ければ False）"""
+    if not has_blob(key):
+        return False
+    output_path = Path(output_path)
+    tmp = output_path.with_name(output_path.name + ".part")
+    shutil.copyfile(blob_path(key), tmp)
+    tmp.replace(output_path)
+    return True
+
+
+def timings_path(key):
+    return blob_path(key).with_suffix(".json")
+
+
+def store_timings(key, words):
+    """合成時の単語タイミングを blob の隣に保存（words: [[開始秒, 長さ秒, 単語], ...]）"""
+    path = timings_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".part")
+    tmp.write_text(json.dumps(words, ensure_ascii=False), encoding="utf-8")
+    tmp.replace(path)
+
+
+def load_timings(key):
+    """単語タイミング（記録が無ければ None。タイミング対応前に合成した blob など）"""
+    path = timings_path(key)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def load_manifest():
+    """manifest.json を読み込む（audio パス → キー）"""
+    if MANIFEST.exists():
+        return json.loads(MANIFEST.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_manifest(manifest):
+    """manifest.json をアトミックに書き込む"""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = MANIFEST.with_name(MANIFEST.name + ".tmp")
+    tmp.write_text(
+        json.dumps(dict(sorted(manifest.items())), ensure_ascii=False, indent=2) + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp, MANIFEST)
+
+
+def iter_blobs():
+    if not BLOB_DIR.exists():
+        return
+    yield from BLOB_DIR.glob("*/*.mp3")
+
+
+def gc(dry_run=False):
+    """参照されていない blob を削除
+
+    1. 音声ファイルが存在しない manifest エントリを除去
+    2. manifest のどのエントリからも参照されていない blob を削除
+    戻り値: (削除した blob 数, 回収したバイト数, 除去した manifest エントリ数)
+    """
+    manifest = load_manifest()
+    stale = [p for p in manifest if not (LISTENING_DIR / p).exists()]
+    for p in stale:
+        del manifest[p]
+
+    referenced = set(manifest.values())
+    removed = 0
+    reclaimed = 0
+    for path in iter_blobs():
+        if path.stem in referenced:
+            continue
+        reclaimed += path.stat().st_size
+        removed += 1
+        if not dry_run:
+            path.unlink()
+            path.with_suffix(".json").unlink(missing_ok=True)
+
+    if not dry_run:
+        for leftover in BLOB_DIR.glob("*/*.part") if BLOB_DIR.exists() else []:
+            leftover.unlink()
+        save_manifest(manifest)
+    return removed, reclaimed, len(stale)
+
+
+def print_stats():
+    manifest = load_manifest()
+    blobs = list(iter_blobs())
+    total = sum(p.stat().st_size for p in blobs)
+    referenced = set(manifest.values())
+    unreferenced = [p for p in blobs if p.stem not in referenced]
+    print(f"キャッシュ: {CACHE_DIR}")
+    print(f"  blob 数      : {len(blobs)} 件（{total / 1024 / 1024:.1f} MB）")
+    print(f"  manifest     : {len(manifest)} エントリ（参照 blob {len(referenced)} 件）")
+    print(f"  未参照 blob  : {len(unreferenced)} 件（--gc で削除可）")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TTS 音声キャッシュの統計表示・GC")
+    parser.add_argument("--gc", action="store_true", help="未参照の blob を削除")
+    parser.add_argument("--dry-run", action="store_true", help="--gc で削除対象の表示のみ")
+    args = parser.parse_args()
+
+    if not args.gc:
+        print_stats()
+        return
+
+    removed, reclaimed, stale = gc(dry_run=args.dry_run)
+    prefix = "[dry-run] " if args.dry_run else ""
+    print(f"{prefix}manifest から除去: {stale} エントリ（音声ファイルなし）")
+    print(f"{prefix}削除 blob: {removed} 件（{reclaimed / 1024 / 1024:.2f} MB）")
+
+
+if __name__ == "__main__":
+    main()
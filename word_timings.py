@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+word_timings.py - 合成時の単語タイミングから kp フレーズの再生位置を作る
+
+add_questions.py は edge-tts のストリームを1回だけ読み、MP3 と WordBoundary（単語ごとの
+開始位置・長さ）を同時に受け取って tts_cache に保存する（別途の強制アライメントは不要）。
+ここでは各問題の kp フレーズを単語列に当てはめ、クイズがハイライトと
+「フレーズから再生」に使う索引を書き出す。
+
+  listening/timings.json
+      {"version": 1, "clips": {"audio/q801.mp3": [[開始ms, 終了ms] または null, ...]}}  # kp と同じ順
+
+後処理（audio_postprocess.py）で先頭を切った音声は、記録された shift の分だけ前にずらす。
+無音検出で先頭を切った（shift が不明な）音声と、タイミング対応前に合成した音声は載らない。
+書き出した索引はシャードのマニフェスト（question_shards.py）の files に載せ、
+クイズはマニフェストに載っているときだけ取得する。
+
+Usage:
+  python3 word_timings.py          # ストアと tts_cache から索引を更新して集計を表示
+                                   # （手元の tts_cache にタイミングが無い問題は既存の位置を残す）
+"""
+
+import json
+import os
+import re
+from collections import Counter
+from pathlib import Path
+
+import question_shards
+import tts_cache
+from audio_postprocess import load_post_manifest
+
+REPO_ROOT = Path(__file__).parent
+TIMINGS_INDEX = REPO_ROOT / "listening" / "timings.json"
+
+INDEX_VERSION = 1
+FUZZY_MIN = 0.6     # 完全一致しない kp は、単語の6割以上が重なる区間を採用
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:'[a-z0-9]+)*")
+
+
+def tokens(text):
+    return _TOKEN.findall(text.lower().replace("’", "'"))
+
+
+def match_phrase(words, phrase):
+    """kp フレーズに当たる単語の範囲 (先頭 index, 末尾 index) を返す（見つからなければ None）
+
+    words: WordBoundary の単語文字列のリスト
+    """
+    flat, owner = [], []
+    for i, w in enumerate(words):
+        for t in tokens(w):
+            flat.append(t)
+            owner.append(i)
+    target = tokens(phrase)
+    n = len(target)
+    if not n or n > len(flat):
+        return None
+
+    for i in range(len(flat) - n + 1):
+        if flat[i:i + n] == target:
+            return owner[i], owner[i + n - 1]
+
+    # 言い換え・活用違い（"figured it out" ↔ "figure it out" など）は重なりの多い区間で近似
+    want = Counter(target)
+    best, best_score = None, 0.0
+    for i in range(len(flat) - n + 1):
+        score = sum((Counter(flat[i:i + n]) & want).values()) / n
+        if score > best_score:
+            best, best_score = i, score
+    if best is None or best_score < FUZZY_MIN:
+        return None
+    return owner[best], owner[best + n - 1]
+
+
+def kp_ranges(words, kp, shift=0.0):
+    """kp ごとの [開始ms, 終了ms]（見つからない kp は None）
+
+    words: [[開始秒, 長さ秒, 単語], ...]（合成直後の音声での位置）
+    shift: 後処理で先頭を切った秒数
+    """
+    texts = [w[2] for w in words]
+    ranges = []
+    for phrase in kp:
+        span = match_phrase(texts, phrase)
+        if span is None:
+            ranges.append(None)
+            continue
+        start = words[span[0]][0] - shift
+        end = words[span[1]][0] + words[span[1]][1] - shift
+        ranges.append([max(0, round(start * 1000)), max(0, round(end * 1000))])
+    return ranges
+
+
+def load_index():
+    if TIMINGS_INDEX.exists():
+        return json.loads(TIMINGS_INDEX.read_text(encoding="utf-8"))["clips"]
+    return {}
+
+
+def save_index(clips):
+    tmp = TIMINGS_INDEX.with_name(TIMINGS_INDEX.name + ".tmp")
+    tmp.write_text(
+        json.dumps({"version": INDEX_VERSION, "clips": dict(sorted(clips.items()))},
+                   ensure_ascii=False, separators=(",", ":")) + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp, TIMINGS_INDEX)
+    question_shards.register_file("timings", TIMINGS_INDEX)
+
+
+def update_index(entries, clips=None):
+    """索引に問題を追加・更新する
+
+    entries: [(audio パス, words, kp), ...]  words が None（タイミングなし）のものは除く
+    戻り値: 索引に載せた件数
+    """
+    post = load_post_manifest()
+    clips = load_index() if clips is None else clips
+    added = 0
+    for audio, words, kp in entries:
+        rec = post.get(audio)
+        shift = rec.get("shift") if rec else 0.0
+        if not words or shift is None:
+            clips.pop(audio, None)
+            continue
+        clips[audio] = kp_ranges(words, kp, shift)
+        added += 1
+    save_index(clips)
+    return added
+
+
+def rebuild():
+    """ストアの全問題について tts_cache のタイミングから索引を更新する
+
+    手元の tts_cache にタイミングが無い問題（別の環境で合成した音声など）は既存の索引の位置を残す。
+    ストアに無くなった音声と、kp の数が変わった問題の位置は外す。
+    戻り値: [(audio パス, words, kp), ...]（全問題）
+    """
+    from question_store import open_store
+
+    manifest = tts_cache.load_manifest()
+    with open_store() as store:
+        entries = []
+        for q in store.iter_questions():
+            key = manifest.get(q.get("audio"))
+            words = tts_cache.load_timings(key) if key else None
+            entries.append((q.get("audio"), words, q.get("kp", [])))
+    kp_count = {audio: len(kp) for audio, _, kp in entries}
+    clips = {audio: ranges for audio, ranges in load_index().items() if kp_count.get(audio) == len(ranges)}
+    update_index([e for e in entries if e[1]], clips=clips)
+    return entries
+
+
+def main():
+    entries = rebuild()
+    clips = load_index()
+    matched = sum(1 for ranges in clips.values() for r in ranges if r)
+    total_kp = sum(len(ranges) for ranges in clips.values())
+    print(f"単語タイミング: {len(clips)} / {len(entries)} 問（{TIMINGS_INDEX.name}）")
+    if total_kp:
+        print(f"  kp の位置: {matched} / {total_kp} 件（{matched / total_kp * 100:.0f}%）")
+    no_timing = [audio for audio, words, _ in entries if not words]
+    if no_timing:
+        kept = sum(1 for audio in no_timing if audio in clips)
+        print(f"  手元にタイミングなし: {len(no_timing)} 問（既存の位置を残した {kept} 問。"
+              f"残りはタイミング対応前に合成した音声）")
+
+
+if __name__ == "__main__":
+    main()